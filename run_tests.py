@@ -26,12 +26,20 @@ optional_arguments = parser.add_argument_group("Optional named arguments.")
 optional_arguments.add_argument("-p", "--python-versions", help="Python version to run", nargs="+", choices=python_version_choices)
 optional_arguments.add_argument("-w", "--wwiseroot-path", required=False, help="Override the path to the Wwise Root")
 optional_arguments.add_argument("-c", "--console-path", required=False, help="Override the path to the WwiseConsole executable")
+optional_arguments.add_argument("-f", "--fake-server", action="store_true", help="Run the tests against the fake WAAPI server of the package instead of WwiseConsole")
 args = parser.parse_args()
 
 print(f"Running tests on {args.python_versions}.")
 
 tox_results = []
 
+if args.fake_server:
+    command = ["tox"]
+    if args.python_versions:
+        command += [f"-e {python_version}" for python_version in args.python_versions]
+    tox_result = subprocess.run(command, check=False, env=dict(os.environ, WAAPI_FAKE_SERVER="1"))
+    sys.exit(tox_result.returncode)
+
 wwiseconsole_path = None
 if args.console_path:
     wwiseconsole_path = args.console_path
@@ -1,2 +1,13 @@
-# Provide client artifacts directly for simplicity of import statements
-from waapi.client import *
+# Provide client artifacts directly for simplicity of import statements, imported on first use
+import waapi.client as _client
+from waapi.client import __all__
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    return getattr(_client, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
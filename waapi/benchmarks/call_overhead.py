@@ -0,0 +1,91 @@
+"""
+Measure the overhead of WaapiClient.call per call, against the fake WAAPI server of the package with no latency.
+
+The baseline is the same call awaited with AsyncWaapiClient on the loop of the connection, which has no thread hop
+nor queue: the difference is the cost of the synchronous API. Run with:
+  python -m waapi.benchmarks.call_overhead
+"""
+import argparse
+import json
+import time
+
+from waapi.client.async_client import AsyncWaapiClient
+from waapi.client.client import WaapiClient
+from waapi.server.fake_server import FakeWaapiServer
+from waapi.wamp.async_compatibility import asyncio
+
+URI = "ak.wwise.core.getInfo"
+
+
+def _best_us(timings, count):
+    """
+    :param timings: Durations of the repetitions, in seconds
+    :type timings: list[float]
+    :param count: Number of calls of each repetition
+    :type count: int
+    :return: Best duration per call, in microseconds
+    :rtype: float
+    """
+    return min(timings) / count * 1000000.
+
+
+def bench_sync(url, count, repeat):
+    """
+    :return: Microseconds per WaapiClient.call
+    :rtype: float
+    """
+    timings = []
+    with WaapiClient(url) as client:
+        client.call(URI)  # Warm up
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(count):
+                client.call(URI)
+            timings.append(time.perf_counter() - start)
+    return _best_us(timings, count)
+
+
+def bench_async(url, count, repeat):
+    """
+    :return: Microseconds per AsyncWaapiClient.call
+    :rtype: float
+    """
+    async def run():
+        timings = []
+        async with AsyncWaapiClient(url) as client:
+            await client.call(URI)  # Warm up
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(count):
+                    await client.call(URI)
+                timings.append(time.perf_counter() - start)
+        return timings
+
+    return _best_us(asyncio.run(run()), count)
+
+
+def run(count=2000, repeat=5):
+    """
+    :param count: Number of calls per repetition
+    :type count: int
+    :param repeat: Number of repetitions, the best one is kept
+    :type repeat: int
+    :return: Microseconds per call of each client, and the overhead of the synchronous client
+    :rtype: dict
+    """
+    with FakeWaapiServer(port=0) as server:
+        sync_us = bench_sync(server.url, count, repeat)
+        async_us = bench_async(server.url, count, repeat)
+    return {"sync_call_us": sync_us, "async_call_us": async_us, "overhead_us": sync_us - async_us}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Number of calls per repetition")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+    print(json.dumps(run(args.count, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
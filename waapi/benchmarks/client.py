@@ -0,0 +1,236 @@
+"""
+Measure the request path of the client against the fake WAAPI server of the package.
+
+Reports calls per second and latency percentiles of small and large calls, events per second delivered through each
+callback executor, and the time to connect and disconnect. Run with:
+  python -m waapi.benchmarks.client > results.json
+"""
+import argparse
+import json
+import time
+from threading import Event
+
+from waapi.client.client import WaapiClient, wait_all
+from waapi.client.event import BatchingEventHandler
+from waapi.client.executor import SequentialThreadExecutor, PerCallbackThreadExecutor, AsyncioLoopExecutor, \
+    ThreadPoolCallbackExecutor, PartitionedThreadExecutor
+from waapi.server.fake_server import FakeWaapiServer, FAKE_PAYLOAD_URI, FAKE_TICK_TOPIC
+
+# Factories of the callback executors compared, by name
+EXECUTORS = {
+    "SequentialThreadExecutor": SequentialThreadExecutor,
+    "PerCallbackThreadExecutor": PerCallbackThreadExecutor,
+    "AsyncioLoopExecutor": AsyncioLoopExecutor,
+    "ThreadPoolCallbackExecutor": lambda: ThreadPoolCallbackExecutor(max_workers=4),
+    "ThreadPoolCallbackExecutor(ordered)": lambda: ThreadPoolCallbackExecutor(max_workers=4, ordered=True),
+    "PartitionedThreadExecutor": lambda: PartitionedThreadExecutor(workers=4)
+}
+
+
+def _percentile(sorted_values, percent):
+    """
+    :param sorted_values: Values in ascending order
+    :type sorted_values: list[float]
+    :type percent: float
+    :rtype: float
+    """
+    index = min(len(sorted_values) - 1, int(round(percent / 100. * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summary(latencies, elapsed):
+    """
+    :param latencies: Duration of each operation, in seconds
+    :type latencies: list[float]
+    :param elapsed: Total duration of the operations, in seconds
+    :type elapsed: float
+    :rtype: dict
+    """
+    latencies = sorted(latencies)
+    return {
+        "count": len(latencies),
+        "per_sec": len(latencies) / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000.,
+        "p99_ms": _percentile(latencies, 99) * 1000.,
+        "max_ms": latencies[-1] * 1000.
+    }
+
+
+def bench_calls(client, count, _uri, **kwargs):
+    """
+    Time calls made one after the other
+
+    :type client: WaapiClient
+    :param count: Number of calls
+    :type count: int
+    :rtype: dict
+    """
+    client.call(_uri, **kwargs)  # Warm up
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(count):
+        call_start = time.perf_counter()
+        client.call(_uri, **kwargs)
+        latencies.append(time.perf_counter() - call_start)
+    return _summary(latencies, time.perf_counter() - start)
+
+
+def bench_pipelined_calls(client, count, _uri, **kwargs):
+    """
+    Time calls all made at once with call_async
+
+    :type client: WaapiClient
+    :param count: Number of calls
+    :type count: int
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    wait_all([client.call_async(_uri, **kwargs) for _ in range(count)])
+    elapsed = time.perf_counter() - start
+    return {"count": count, "per_sec": count / elapsed}
+
+
+def bench_events(server, executor, count):
+    """
+    Time the delivery of a burst of events to a subscriber
+
+    :type server: FakeWaapiServer
+    :param executor: Factory of the callback executor of the client
+    :type executor: () -> CallbackExecutor
+    :param count: Number of events
+    :type count: int
+    :rtype: dict
+    """
+    received = []
+    done = Event()
+
+    def on_tick(*args, **kwargs):
+        received.append(time.perf_counter())
+        if len(received) == count:
+            done.set()
+
+    with WaapiClient(server.url, callback_executor=executor) as client:
+        client.subscribe(FAKE_TICK_TOPIC, on_tick)
+        start = time.perf_counter()
+        server.publish_burst(count).result()
+        published = time.perf_counter() - start
+        delivered = done.wait(max(30., count / 100.))
+        elapsed = (received[-1] if received else time.perf_counter()) - start
+    return {
+        "count": len(received),
+        "complete": delivered,
+        "per_sec": len(received) / elapsed if elapsed else 0.,
+        "publish_ms": published * 1000.
+    }
+
+
+def bench_batched_events(server, count, max_batch_size=500):
+    """
+    Time the delivery of a burst of events to a subscriber receiving them in batches
+
+    :type server: FakeWaapiServer
+    :param count: Number of events
+    :type count: int
+    :param max_batch_size: Maximum number of events per batch
+    :type max_batch_size: int
+    :rtype: dict
+    """
+    received = []
+    batches = []
+    done = Event()
+
+    def on_batch(events):
+        batches.append(len(events))
+        received.extend(time.perf_counter() for _ in events)
+        if len(received) >= count:
+            done.set()
+
+    with WaapiClient(server.url) as client:
+        client.subscribe(FAKE_TICK_TOPIC, BatchingEventHandler(callback=on_batch, max_batch_size=max_batch_size))
+        start = time.perf_counter()
+        server.publish_burst(count).result()
+        delivered = done.wait(max(30., count / 100.))
+        elapsed = (received[-1] if received else time.perf_counter()) - start
+    return {
+        "count": len(received),
+        "complete": delivered,
+        "per_sec": len(received) / elapsed if elapsed else 0.,
+        "batches": len(batches)
+    }
+
+
+def bench_connections(url, count):
+    """
+    Time connecting and disconnecting new clients
+
+    :type url: str
+    :param count: Number of connections
+    :type count: int
+    :rtype: dict
+    """
+    connects = []
+    disconnects = []
+    for _ in range(count):
+        start = time.perf_counter()
+        client = WaapiClient(url)
+        connects.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        client.disconnect()
+        disconnects.append(time.perf_counter() - start)
+    return {
+        "connect": _summary(connects, sum(connects)),
+        "disconnect": _summary(disconnects, sum(disconnects))
+    }
+
+
+def run(calls=2000, large_calls=50, large_size=1024 * 1024, events=10000, connections=20, latency=0.):
+    """
+    :param calls: Number of small calls
+    :type calls: int
+    :param large_calls: Number of large calls
+    :type large_calls: int
+    :param large_size: Size in bytes of the result of the large calls
+    :type large_size: int
+    :param events: Number of events per callback executor
+    :type events: int
+    :param connections: Number of connections and disconnections
+    :type connections: int
+    :param latency: Seconds waited by the server before replying to each call
+    :type latency: float
+    :return: Results per measurement, durations in milliseconds
+    :rtype: dict
+    """
+    results = {
+        "parameters": {
+            "calls": calls, "large_calls": large_calls, "large_size": large_size, "events": events,
+            "connections": connections, "latency": latency
+        }
+    }
+    with FakeWaapiServer(port=0, latency=latency) as server:
+        with WaapiClient(server.url) as client:
+            results["small_call"] = bench_calls(client, calls, "ak.wwise.core.getInfo")
+            results["small_call_pipelined"] = bench_pipelined_calls(client, calls, "ak.wwise.core.getInfo")
+            results["large_call"] = bench_calls(client, large_calls, FAKE_PAYLOAD_URI, size=large_size)
+        results["events"] = {name: bench_events(server, executor, events) for name, executor in EXECUTORS.items()}
+        results["events_batched"] = bench_batched_events(server, events)
+        results.update(bench_connections(server.url, connections))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000, help="Number of small calls")
+    parser.add_argument("--large-calls", type=int, default=50, help="Number of large calls")
+    parser.add_argument("--large-size", type=int, default=1024 * 1024, help="Size of the large results, in bytes")
+    parser.add_argument("--events", type=int, default=10000, help="Number of events per callback executor")
+    parser.add_argument("--connections", type=int, default=20, help="Number of connections")
+    parser.add_argument("--latency", type=float, default=0., help="Server latency per call, in seconds")
+    args = parser.parse_args()
+    print(json.dumps(
+        run(args.calls, args.large_calls, args.large_size, args.events, args.connections, args.latency),
+        indent=2
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure the import time of the package, with the -X importtime option of fresh interpreters.
+
+Reports the cumulative import time of each statement and the heavy dependencies it loads: importing the package or
+its exception classes must not load autobahn, which is only imported once a client is created. Run with:
+  python -m waapi.benchmarks.imports
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# Statements timed, by name
+STATEMENTS = {
+    "package": "import waapi",
+    "exceptions": "from waapi import CannotConnectToWaapiException, WaapiRequestFailed, WaapiRequestTimeout",
+    "event_handler": "from waapi import EventHandler",
+    "client": "from waapi import WaapiClient",
+    "autobahn": "import autobahn.asyncio.wamp"
+}
+
+# Dependencies reported when loaded by a statement
+HEAVY_MODULES = ("autobahn", "txaio", "asyncio")
+
+
+def measure(statement):
+    """
+    Time a statement in a fresh interpreter
+
+    :type statement: str
+    :return: Cumulative import time in milliseconds, and the heavy dependencies loaded
+    :rtype: dict
+    """
+    code = "{}\nimport sys\nprint(','.join(m for m in {!r} if m in sys.modules))".format(statement, HEAVY_MODULES)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+
+    # Each line is "import time: self [us] | cumulative | imported package", top-level imports are not indented
+    total_us = 0
+    for line in process.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and not fields[2].startswith("  ") and fields[1].strip().isdigit():
+            total_us += int(fields[1])
+    loaded = process.stdout.strip()
+    return {"ms": total_us / 1000., "loaded": loaded.split(",") if loaded else []}
+
+
+def run(repeat=5):
+    """
+    :param repeat: Number of times each statement is timed, the best time is kept
+    :type repeat: int
+    :return: Import time in milliseconds, beyond the imports of the interpreter startup, and the heavy dependencies
+             loaded, per statement
+    :rtype: dict
+    """
+    def best_ms(statement):
+        return min(measure(statement)["ms"] for _ in range(repeat))
+
+    startup_ms = best_ms("pass")
+    return {
+        name: {"ms": max(0., best_ms(statement) - startup_ms), "loaded": measure(statement)["loaded"]}
+        for name, statement in STATEMENTS.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
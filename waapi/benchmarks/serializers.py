@@ -0,0 +1,90 @@
+"""
+Compare the encoding and decoding cost of the WAMP serializers supported by the client.
+
+The request is the large ak.wwise.core.object.get call of test_large_payload.py (5000 names) and the reply holds
+one object per name. Besides the serializers of the client, JSON is measured with the serializer of autobahn
+("json/autobahn") and with FastJsonSerializer on each JSON package installed, whose reply is also decoded as a raw
+result. Run with:
+  python -m waapi.benchmarks.serializers
+"""
+import argparse
+import json
+import timeit
+
+from autobahn.wamp.message import Result
+
+from waapi.wamp.ak_autobahn import AkCall, SERIALIZER_CLASS_NAMES, create_serializers
+from waapi.wamp.json_serializer import FastJsonSerializer, available_json_backends
+
+
+def large_payload_messages(count=5000):
+    """
+    :param count: Number of object names in the payload
+    :type count: int
+    :return: The CALL message of the request and the RESULT message of its reply
+    :rtype: (AkCall, Result)
+    """
+    names = ["GameParameter:a" + str(n) for n in range(count)]
+    call = AkCall(1, "ak.wwise.core.object.get", [], {"from": {"name": names}, "options": {"return": ["id", "name"]}})
+    reply = Result(1, kwargs={"return": [
+        {"id": "{{{:08X}-0000-0000-0000-000000000000}}".format(n), "name": name} for n, name in enumerate(names)
+    ]})
+    return call, reply
+
+
+def run(count=5000, repeat=20):
+    """
+    :param count: Number of object names in the payload
+    :type count: int
+    :param repeat: Number of times each operation is timed, the best time is kept
+    :type repeat: int
+    :return: Timings in milliseconds and sizes in bytes, per serializer
+    :rtype: dict
+    """
+    # Imported once txaio is set up by the client
+    from autobahn.wamp.serializer import JsonSerializer
+
+    call, reply = large_payload_messages(count)
+    # Serializers whose package is not installed are skipped
+    serializers = {
+        serializer.SERIALIZER_ID: serializer for serializer in create_serializers(list(SERIALIZER_CLASS_NAMES))
+    }
+    serializers["json/autobahn"] = JsonSerializer()
+    for backend in available_json_backends():
+        serializers["json/" + backend] = FastJsonSerializer(backend)
+
+    results = {}
+    for name, serializer in serializers.items():
+        object_serializer = serializer._serializer
+        request_bytes = object_serializer.serialize(call.marshal())
+        reply_bytes = object_serializer.serialize(reply.marshal())
+
+        def best_ms(statement):
+            return min(timeit.repeat(statement, number=1, repeat=repeat)) * 1000.
+
+        results[name] = {
+            "request_bytes": len(request_bytes),
+            "reply_bytes": len(reply_bytes),
+            "encode_request_ms": best_ms(lambda: object_serializer.serialize(call.marshal())),
+            "decode_reply_ms": best_ms(lambda: serializer.unserialize(reply_bytes, object_serializer.BINARY)),
+        }
+
+        if isinstance(serializer, FastJsonSerializer):
+            def decode_raw():
+                object_serializer.raw_requests.add(reply.request)
+                serializer.unserialize(reply_bytes, object_serializer.BINARY)
+                return object_serializer.raw_results.pop(reply.request)
+            results[name]["decode_reply_raw_ms"] = best_ms(decode_raw)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000, help="Number of object names in the payload")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of timed repetitions")
+    args = parser.parse_args()
+    print(json.dumps(run(args.count, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
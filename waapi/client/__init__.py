@@ -1,3 +1,59 @@
-from waapi.client.client import *
-from waapi.client.event import *
-from waapi.client.executor import *
+from importlib import import_module
+
+# Client artifacts are imported on first use: the connection modules import autobahn, whose import is a noticeable
+# share of the runtime of short-lived tools
+_MODULES = {
+    "WaapiClient": "waapi.client.client",
+    "connect": "waapi.client.client",
+    "wait_all": "waapi.client.client",
+    "as_completed": "waapi.client.client",
+    "enable_debug_log": "waapi.client.client",
+    "DEFAULT_CHUNK_SIZE": "waapi.client.client",
+    "AsyncWaapiClient": "waapi.client.async_client",
+    "PoolStrategy": "waapi.client.pool",
+    "WaapiClientPool": "waapi.client.pool",
+    "ReconnectPolicy": "waapi.client.reconnect",
+    "WaapiRuntime": "waapi.client.runtime",
+    "ResultCache": "waapi.client.cache",
+    "DEFAULT_CACHED_URIS": "waapi.client.cache",
+    "DEFAULT_INVALIDATION_TOPICS": "waapi.client.cache",
+    "ClientMetrics": "waapi.client.metrics",
+    "LatencyHistogram": "waapi.client.metrics",
+    "DEFAULT_LATENCY_BUCKETS_MS": "waapi.client.metrics",
+    "EventHandler": "waapi.client.event",
+    "CoalescingEventHandler": "waapi.client.event",
+    "BatchingEventHandler": "waapi.client.event",
+    "object_property_key": "waapi.client.event",
+    "PerCallbackThreadExecutor": "waapi.client.executor",
+    "PartitionedThreadExecutor": "waapi.client.executor",
+    "SequentialThreadExecutor": "waapi.client.executor",
+    "AsyncioLoopExecutor": "waapi.client.executor",
+    "ThreadPoolCallbackExecutor": "waapi.client.executor",
+    "CallbackExecutor": "waapi.client.interface",
+    "UnsubscribeHandler": "waapi.client.interface",
+    "CannotConnectToWaapiException": "waapi.wamp.interface",
+    "WaapiRequestFailed": "waapi.wamp.interface",
+    "WaapiRequestTimeout": "waapi.wamp.interface",
+    "QueueOverflowError": "waapi.wamp.interface",
+    "OverflowPolicy": "waapi.wamp.interface",
+    # Also exported by waapi.client.client before the imports were deferred, kept for compatibility
+    "WampRequest": "waapi.wamp.interface",
+    "WampRequestType": "waapi.wamp.interface",
+    "WampClientAutobahn": "waapi.wamp.async_decoupled_client",
+    "start_decoupled_autobahn_client": "waapi.wamp.ak_autobahn",
+    "Subscription": "autobahn.wamp.request"
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,331 @@
+from copy import copy
+
+from waapi.client.client import _merge_args_to_kwargs
+from waapi.client.event import EventHandler
+from waapi.client.interface import UnsubscribeHandler
+from waapi.client.executor import AsyncioLoopExecutor, _executor_factory
+from waapi.wamp.interface import WampRequest, WampRequestType, CannotConnectToWaapiException, WaapiRequestTimeout, \
+    DEFAULT_MAX_IN_FLIGHT
+from waapi.wamp.async_compatibility import asyncio
+
+
+class _ScheduledUnsubscribeHandler(UnsubscribeHandler):
+    """
+    Unsubscribe handler of the event handlers of an AsyncWaapiClient.
+    EventHandler.unsubscribe is synchronous: the unsubscription is scheduled as a task on the loop of the client, so
+    it is done even if the task returned is never awaited.
+    """
+    def __init__(self, client):
+        """
+        :type client: AsyncWaapiClient
+        """
+        self._client = client
+
+    def unsubscribe(self, event_handler):
+        """
+        :type event_handler: EventHandler
+        :return: Task resolving to True if the unsubscribe was successful, False otherwise.
+        :rtype: asyncio.Task
+        """
+        return asyncio.ensure_future(self._client.unsubscribe(event_handler), loop=self._client._loop)
+
+
+class AsyncWaapiClient(UnsubscribeHandler):
+    """
+    Pythonic Wwise Authoring API client with a native asyncio API.
+
+    Runs the WAMP session directly on the caller's asyncio loop: requests are dispatched to the session without any
+    thread or queue hop, so many calls can be awaited concurrently, e.g. with asyncio.gather.
+    Each subscription to a topic is managed by a EventHandler instance for a reference is kept in this client.
+
+    Use as an asynchronous context manager to tie the lifetime of the connection to a block:
+      async with AsyncWaapiClient() as client:
+          result = await client.call("ak.wwise.core.getInfo")
+
+    Import as:
+      from waapi import AsyncWaapiClient
+    """
+    def __init__(self,
+        url=None,
+        allow_exception=False,
+        callback_executor=AsyncioLoopExecutor,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        serializers=None,
+        timeout=None
+        ):
+        """
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to ws://127.0.0.1:8080/waapi
+        :type: str
+        :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+        :type allow_exception: bool
+        :param callback_executor: Executor strategy for event callbacks, defaults to running them on the loop, as a
+                                  class or as an instance
+        :type callback_executor: type | CallbackExecutor
+        :param max_in_flight: Maximum number of requests sent to the server and awaiting a reply at the same time.
+        :type max_in_flight: int
+        :param serializers: Serializers to offer to the server in order of preference, by name ("msgpack", "cbor",
+                            "ubjson" or "json") or as autobahn serializer instances. JSON is always offered last as
+                            the fallback, and is the only serializer used by default.
+        :type serializers: list[str | ISerializer] | None
+        :param timeout: Default timeout in seconds of calls and subscriptions, None to wait indefinitely
+        :type timeout: float | None
+        :raises: ValueError
+        """
+        super(AsyncWaapiClient, self).__init__()
+
+        self._url = url or "ws://127.0.0.1:8080/waapi"
+        self._allow_exception = allow_exception
+        self._callback_executor = _executor_factory(callback_executor)
+        self._max_in_flight = max_in_flight
+        # autobahn is only imported once a client is created, keeping the import of the package cheap
+        from waapi.wamp.ak_autobahn import create_serializers
+        self._serializers = create_serializers(serializers)
+        self._timeout = timeout
+
+        self._loop = None
+        """:type: asyncio.AbstractEventLoop"""
+
+        self._decoupler = None
+        """:type: AutobahnClientDecoupler"""
+
+        self._session = None
+        """:type: WampClientAutobahn"""
+
+        self._protocol = None
+        self._in_flight = None
+        """:type: asyncio.Semaphore"""
+
+        self._subscriptions = set()
+        """:type: set[EventHandler]"""
+
+        self._unsubscribe_handler = _ScheduledUnsubscribeHandler(self)
+
+    async def connect(self):
+        """
+        Connect to the Waapi server on the running asyncio loop.
+
+        :return: self, to allow chaining the construction: client = await AsyncWaapiClient().connect()
+        :rtype: AsyncWaapiClient
+        :raises: CannotConnectToWaapiException
+        """
+        if self.is_connected():
+            return self
+
+        from waapi.wamp.ak_autobahn import AutobahnClientDecoupler, connect_autobahn_client
+        from waapi.wamp.async_decoupled_client import WampClientAutobahn
+
+        self._loop = asyncio.get_running_loop()
+        self._decoupler = AutobahnClientDecoupler(queue_size=0)
+        self._in_flight = asyncio.Semaphore(self._max_in_flight)
+        joined = self._loop.create_future()
+
+        def on_join(session, details):
+            if not joined.done():
+                joined.set_result(True)
+
+        def create_session():
+            self._session = WampClientAutobahn(
+                self._decoupler,
+                self._callback_executor(),
+                self._allow_exception,
+                self._max_in_flight
+            )
+            self._session.on("join", on_join)
+            return self._session
+
+        try:
+            transport, self._protocol = await connect_autobahn_client(
+                self._url,
+                self._loop,
+                create_session,
+                self._serializers
+            )
+        except Exception as e:
+            raise CannotConnectToWaapiException("Could not connect to " + self._url) from e
+
+        # The protocol closes on any handshake failure, in which case the session never joins
+        await asyncio.wait(
+            [joined, asyncio.ensure_future(self._protocol.is_closed)],
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        if not self.is_connected():
+            raise CannotConnectToWaapiException("Could not connect to " + self._url)
+
+        self._protocol.is_closed.add_done_callback(lambda _: self.__on_closed())
+        return self
+
+    async def disconnect(self):
+        """
+        Gracefully disconnect from the Waapi server.
+
+        :return: True if the call caused a successful disconnection, False otherwise.
+        :rtype: bool
+        """
+        if not self.is_connected():
+            return False
+
+        # The STOP request goes through the decoupler to terminate the session's request loop
+        future = self._loop.create_future()
+        await self._decoupler.put_request(WampRequest(WampRequestType.STOP, future=future))
+        if not await future:
+            return False
+
+        await self._protocol.is_closed
+        self._subscriptions.clear()  # No need to unsubscribe, subscriptions will be dropped anyways
+        return True
+
+    def is_connected(self):
+        """
+        :return: True if the client is connected, False otherwise.
+        :rtype: bool
+        """
+        return self._session is not None and self._session.is_attached() and \
+            self._protocol is not None and not self._protocol.is_closed.done()
+
+    async def call(self, _uri, *args, timeout=None, raw=False, **kwargs):
+        """
+        Do a Remote Procedure Call (RPC) to the Waapi server.
+        Arguments and options are specified the same way as WaapiClient.call, e.g.:
+          await client.call("my.function", {"some_argument": "Value"}, options={"option1": "Option Value"})
+
+        Cancelling the awaiting task cancels the request, whose reply will then be ignored.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param timeout: Seconds to wait for the result, defaults to the client's timeout
+        :type timeout: float | None
+        :param raw: Return the JSON of the result as bytes instead of a dictionary, see WaapiClient.call
+        :type raw: bool
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Result from the remote procedure call, None if failed.
+        :rtype: dict | bytes | None
+        :raises: WaapiRequestFailed, WaapiRequestTimeout
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        return await self.__wait_for(self.__do_request(WampRequestType.CALL, _uri, raw=raw, **kwargs), _uri, timeout)
+
+    async def subscribe(self, _uri, callback_or_handler=None, *args, timeout=None, **kwargs):
+        """
+        Subscribe to a topic on the Waapi server.
+        Named arguments are options to be passed for the subscription, as with WaapiClient.subscribe.
+
+        The callback is run according to the callback executor strategy, by default on the asyncio loop.
+        The unsubscribe method of the returned EventHandler schedules the unsubscription on the loop of the client
+        and returns its task, which may be awaited to get the result.
+
+        :param _uri: URI of the topic to subscribe to
+        :type _uri: str
+        :param callback_or_handler: A callback that will be called when the server publishes on the provided topic,
+                                    or an instance of EventHandler (or subclass).
+        :type callback_or_handler: callable | EventHandler
+        :param timeout: Seconds to wait for the subscription, defaults to the client's timeout
+        :type timeout: float | None
+        :rtype: EventHandler | None
+        :raises: WaapiRequestFailed, WaapiRequestTimeout
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+
+        if callback_or_handler is not None and isinstance(callback_or_handler, EventHandler):
+            event_handler = callback_or_handler
+        else:
+            event_handler = EventHandler(self._unsubscribe_handler, callback_or_handler)
+
+        subscription = await self.__wait_for(
+            self.__do_request(
+                WampRequestType.SUBSCRIBE, _uri, event_handler.on_event, None, event_handler._executor, **kwargs
+            ),
+            _uri,
+            timeout
+        )
+        if subscription is not None:
+            event_handler.subscription = subscription
+            event_handler._unsubscribe_handler = self._unsubscribe_handler
+            self._subscriptions.add(event_handler)
+            return event_handler
+
+    async def unsubscribe(self, event_handler):
+        """
+        Unsubscribe from a topic managed by the passed EventHandler instance.
+
+        :param event_handler: Event handler that can be found in this client instance's subscriptions
+        :type event_handler: EventHandler
+        :return: True if successfully unsubscribed, False otherwise.
+        :rtype: bool
+        """
+        if event_handler not in self._subscriptions:
+            return False
+
+        success = await self.__do_request(
+            WampRequestType.UNSUBSCRIBE, subscription=event_handler.subscription, executor=event_handler._executor
+        )
+        if success:
+            self._subscriptions.remove(event_handler)
+            event_handler.subscription = None
+        return success
+
+    def subscriptions(self):
+        """
+        :return: A copy of the set of subscriptions belonging to client instance.
+        :rtype: set[EventHandler]
+        """
+        return copy(self._subscriptions)
+
+    async def __wait_for(self, request, _uri, timeout):
+        """
+        Await a request, cancelling it on timeout
+
+        :type request: collections.abc.Awaitable
+        :type _uri: str
+        :param timeout: Seconds to wait, None for the client's timeout
+        :type timeout: float | None
+        :raises: WaapiRequestTimeout
+        """
+        timeout = self._timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(request, timeout)
+        except asyncio.TimeoutError:
+            raise WaapiRequestTimeout(_uri, timeout) from None
+
+    async def __do_request(self, request_type, _uri=None, callback=None, subscription=None, executor=None, raw=False,
+                           **kwargs):
+        """
+        Create a generic WAMP request and process it directly on the session
+
+        :type request_type: WampRequestType
+        :type _uri: str | None
+        :type callback: (*Any) -> None | None
+        :type subscription: Subscription | None
+        :param executor: Executor of the callback, None for the executor of the client
+        :type executor: CallbackExecutor | None
+        :param raw: For a CALL, return the JSON of the result as bytes
+        :type raw: bool
+        :return: Result from WampRequest, None if request failed.
+        :rtype: dict | bytes | None
+        """
+        if not self.is_connected():
+            return
+
+        future = self._loop.create_future()
+        async with self._in_flight:
+            await self._session.process_request(
+                WampRequest(request_type, _uri, kwargs, callback, subscription, future, executor, raw)
+            )
+
+        if future.done():
+            return future.result()
+
+    def __on_closed(self):
+        """
+        Terminate the session's request loop when the connection is lost without a STOP request
+        """
+        self._subscriptions.clear()
+        if not self._decoupler.is_stopping():
+            stop = WampRequest(WampRequestType.STOP, future=self._loop.create_future())
+            asyncio.ensure_future(self._decoupler.put_request(stop))
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+
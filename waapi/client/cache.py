@@ -0,0 +1,185 @@
+import json
+from collections import OrderedDict
+from threading import Lock
+
+from waapi.client.interface import CallbackExecutor
+
+
+DEFAULT_CACHED_URIS = (
+    "ak.wwise.core.getInfo",
+    "ak.wwise.core.getProjectInfo",
+    "ak.wwise.core.object.get",
+    "ak.wwise.waapi.getFunctions",
+    "ak.wwise.waapi.getSchema",
+    "ak.wwise.waapi.getTopics"
+)
+
+DEFAULT_INVALIDATION_TOPICS = (
+    "ak.wwise.core.object.created",
+    "ak.wwise.core.object.nameChanged",
+    "ak.wwise.core.object.propertyChanged",
+    "ak.wwise.core.object.preDeleted",
+    "ak.wwise.core.object.postDeleted",
+    "ak.wwise.core.object.childAdded",
+    "ak.wwise.core.object.childRemoved",
+    "ak.wwise.core.object.referenceChanged",
+    "ak.wwise.core.object.notesChanged",
+    "ak.wwise.core.project.loaded",
+    "ak.wwise.core.project.preClosed"
+)
+
+
+class ResultCache:
+    """
+    Read-through cache of the results of read-only calls of a WaapiClient, opt-in with WaapiClient(result_cache=...)
+
+    Results are keyed on the URI and the arguments (including options) of the call, and evicted in least recently used
+    order to remain within a memory budget. The whole cache is invalidated when the server publishes on any of the
+    invalidation topics, to which the client subscribes internally, and when the client calls any URI that is not
+    cached, as it may modify the project. Topics the server refuses are skipped, changes they report do not
+    invalidate the cache.
+
+    Each hit returns a new copy of the result, which the caller may freely modify.
+
+    Import as:
+      from waapi import ResultCache
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024, uris=DEFAULT_CACHED_URIS, invalidation_topics=DEFAULT_INVALIDATION_TOPICS):
+        """
+        :param max_bytes: Memory budget of the cached results, measured as their JSON size
+        :type max_bytes: int
+        :param uris: URIs of the read-only procedures whose results are cached
+        :type uris: collections.abc.Iterable[str]
+        :param invalidation_topics: Topics whose events invalidate the cache
+        :type invalidation_topics: collections.abc.Iterable[str]
+        """
+        self.max_bytes = max_bytes
+        self.uris = frozenset(uris)
+        self.invalidation_topics = tuple(invalidation_topics)
+
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        """:type: OrderedDict[(str, str), str]"""
+        self._size = 0
+
+        # Incremented on each invalidation: a result requested before an invalidation may be outdated
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._subscribed_topics = []
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def is_cached(self, _uri):
+        """
+        :type _uri: str
+        :rtype: bool
+        """
+        return _uri in self.uris
+
+    @staticmethod
+    def key(_uri, kwargs):
+        """
+        :type _uri: str
+        :param kwargs: Arguments of the call, including options
+        :type kwargs: dict
+        :return: Key of the call, None if the arguments cannot be canonicalized
+        :rtype: (str, str) | None
+        """
+        try:
+            return _uri, json.dumps(kwargs, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, key):
+        """
+        :type key: (str, str)
+        :return: A copy of the cached result, None on a miss
+        :rtype: dict | None
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return json.loads(payload)
+
+    def put(self, key, result, generation):
+        """
+        Cache the result of a call, unless the cache was invalidated since the call was made
+
+        :type key: (str, str)
+        :type result: dict
+        :param generation: Generation of the cache when the call was made
+        :type generation: int
+        """
+        try:
+            payload = json.dumps(result, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[key] = payload
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._evictions += 1
+
+    def invalidate(self, *args, **kwargs):
+        """
+        Discard all the cached results. Accepts any arguments, to be used directly as an event callback.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._generation += 1
+            self._invalidations += 1
+
+    def statistics(self):
+        """
+        :return: Counters of the cache: hits, misses, evictions, invalidations, entries, size_bytes and the
+                 invalidation topics effectively subscribed to
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "subscribed_topics": list(self._subscribed_topics)
+            }
+
+    def _set_subscribed_topics(self, topics):
+        with self._lock:
+            self._subscribed_topics = list(topics)
+
+
+class _InlineExecutor(CallbackExecutor):
+    """
+    Runs callbacks directly on the client thread, for internal callbacks that must take effect before any other
+    callback of the same event runs
+    """
+    def execute(self, callback, kwargs):
+        callback(**kwargs)
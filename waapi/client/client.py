@@ -1,16 +1,28 @@
 import logging
-from sys import platform, stdout
-from copy import copy
+import time
+from sys import stdout
+from threading import Thread, Event, Lock, current_thread
+import concurrent.futures
+from collections import deque
+from itertools import islice
 
 from waapi.client.event import EventHandler
 from waapi.client.interface import UnsubscribeHandler
-from waapi.client.executor import SequentialThreadExecutor
-from waapi.wamp.interface import WampRequest, WampRequestType, CannotConnectToWaapiException, WaapiRequestFailed
-from waapi.wamp.async_decoupled_client import WampClientAutobahn
+from waapi.client.executor import SequentialThreadExecutor, _executor_factory
+from waapi.client.reconnect import ReconnectPolicy
+from waapi.client.cache import ResultCache, _InlineExecutor
+from waapi.client.metrics import ClientMetrics, _MeteredSerializer
+from waapi.client.runtime import WaapiRuntime, _new_event_loop
+from waapi.wamp.interface import WampRequest, WampRequestType, CannotConnectToWaapiException, WaapiRequestFailed, \
+    WaapiRequestTimeout, OverflowPolicy, QueueOverflowError, DEFAULT_MAX_IN_FLIGHT
 from waapi.wamp.async_compatibility import asyncio
-from waapi.wamp.ak_autobahn import start_decoupled_autobahn_client
 
 
+DEFAULT_CHUNK_SIZE = 500
+
+# Keys of ak.wwise.core.object.get "from" argument whose list can be split without changing the result
+_SPLITTABLE_FROM_KEYS = ("id", "path", "name")
+
 def connect(url=None):
     """
     Factory for uniform API across languages.
@@ -24,7 +36,106 @@ def connect(url=None):
     except CannotConnectToWaapiException:
         return None
 
+def _merge_args_to_kwargs(args, kwargs):
+    """
+    Merged a single dictionary passed as argument to a kwargs dictionary, if it exists.
+
+    :type args: tuple[dict] | tuple[]
+    :param kwargs: dict
+    :return: Updated kwargs
+    :rtype: dict
+    """
+    if len(args) > 0 and isinstance(args[0], dict):
+        kwargs.update(args[0])
+    return kwargs
+
+def wait_all(futures, timeout=None):
+    """
+    Wait for the completion of futures returned by WaapiClient.call_async.
+
+    :param futures: Futures to wait for
+    :type futures: list[concurrent.futures.Future]
+    :param timeout: Maximum number of seconds to wait, None to wait indefinitely
+    :type timeout: float | None
+    :return: Results of the futures, in the same order
+    :rtype: list[dict | None]
+    :raises: concurrent.futures.TimeoutError, WaapiRequestFailed
+    """
+    done, not_done = concurrent.futures.wait(futures, timeout)
+    if not_done:
+        raise concurrent.futures.TimeoutError("{} of {} requests did not complete in time".format(len(not_done), len(futures)))
+    return [future.result() for future in futures]
+
+def as_completed(futures, timeout=None):
+    """
+    Iterate over futures returned by WaapiClient.call_async as they complete.
+
+    :param futures: Futures to iterate over
+    :type futures: list[concurrent.futures.Future]
+    :param timeout: Maximum number of seconds to wait, None to wait indefinitely
+    :type timeout: float | None
+    :return: Iterator yielding each future once completed
+    :rtype: collections.abc.Iterator[concurrent.futures.Future]
+    :raises: concurrent.futures.TimeoutError
+    """
+    return concurrent.futures.as_completed(futures, timeout)
+
+def _completed_future(result):
+    """
+    :return: A future already completed with the result
+    :rtype: concurrent.futures.Future
+    """
+    future = concurrent.futures.Future()
+    future.set_result(result)
+    return future
+
+def _is_running_loop(loop):
+    """
+    :type loop: asyncio.AbstractEventLoop
+    :return: True if the loop is running on the current thread
+    :rtype: bool
+    """
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+def _chain_future(source, destination):
+    """
+    Complete a future with the outcome of another
+
+    :type source: concurrent.futures.Future
+    :type destination: concurrent.futures.Future
+    """
+    def on_done(done_future):
+        if not destination.set_running_or_notify_cancel():
+            return  # Cancelled by its owner
+        if done_future.cancelled():
+            destination.set_result(None)
+        elif done_future.exception() is not None:
+            destination.set_exception(done_future.exception())
+        else:
+            destination.set_result(done_future.result())
+
+    source.add_done_callback(on_done)
+
+def _chain_future_after(source, action):
+    """
+    Chain a future to the outcome of another once an action ran on it, cancelling the source with the new future
+
+    :type source: concurrent.futures.Future
+    :param action: Called with the completed source before the new future completes
+    :type action: (concurrent.futures.Future) -> None
+    :rtype: concurrent.futures.Future
+    """
+    destination = concurrent.futures.Future()
+    source.add_done_callback(action)  # Callbacks run in order: the action runs before the destination completes
+    _chain_future(source, destination)
+    destination.add_done_callback(lambda future: source.cancel() if future.cancelled() else None)
+    return destination
+
 def enable_debug_log():
+    from waapi.wamp.async_decoupled_client import WampClientAutobahn
     logging.basicConfig(stream=stdout, level=logging.DEBUG)
     WampClientAutobahn.enable_debug_log()
 
@@ -35,6 +146,7 @@ class WaapiClient(UnsubscribeHandler):
     Uses asyncio under the hood in a separate thread to which WAMP requests are dispatched.
     Use as a normal API for interacting with Wwise, requires no other special setup.
     Each subscription to a topic is managed by a EventHandler instance for a reference is kept in this client.
+    An instance can be shared by any number of threads calling, subscribing and unsubscribing concurrently.
 
     The lifetime of the connection is the lifetime of the instance.
     Creating a global instance will automatically disconnect the client at the end of the program execution.
@@ -45,46 +157,128 @@ class WaapiClient(UnsubscribeHandler):
     def __init__(self,
         url=None,
         allow_exception=False,
-        callback_executor=SequentialThreadExecutor
+        callback_executor=SequentialThreadExecutor,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        serializers=None,
+        reconnect_policy=None,
+        timeout=None,
+        result_cache=None,
+        metrics=None,
+        max_queued_requests=0,
+        request_overflow=OverflowPolicy.BLOCK,
+        runtime=None
         ):
         """
         :param url: URL of the Wwise Authoring API WAMP server, defaults to ws://127.0.0.1:8080/waapi
         :type: str
         :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
         :type allow_exception: bool
-        :param callback_executor: Executor strategy for event callbacks
-        :type callback_executor: CallbackExecutor
-        :raises: CannotConnectToWaapiException
+        :param callback_executor: Executor strategy for event callbacks, as a class instantiated for each connection or
+                                  as an instance, e.g. ThreadPoolCallbackExecutor(max_workers=8)
+        :type callback_executor: type | CallbackExecutor
+        :param max_in_flight: Maximum number of requests sent to the server and awaiting a reply at the same time.
+                              Requests issued from multiple threads are pipelined on the connection up to this limit.
+        :type max_in_flight: int
+        :param serializers: Serializers to offer to the server in order of preference, by name ("msgpack", "cbor",
+                            "ubjson" or "json") or as autobahn serializer instances. JSON is always offered last as
+                            the fallback, and is the only serializer used by default.
+        :type serializers: list[str | ISerializer] | None
+        :param reconnect_policy: Policy to automatically reconnect when the connection is lost, None to never
+                                 reconnect. Subscriptions are restored on the same EventHandler instances.
+                                 A client with a reconnect policy must be disconnected explicitly.
+        :type reconnect_policy: ReconnectPolicy | None
+        :param timeout: Default timeout in seconds of calls and subscriptions, None to wait indefinitely
+        :type timeout: float | None
+        :param result_cache: Cache of the results of read-only calls, None to always call the server
+        :type result_cache: ResultCache | None
+        :param metrics: Metrics to collect on the requests and callbacks, None to not measure them
+        :type metrics: ClientMetrics | None
+        :param max_queued_requests: Maximum number of requests waiting for an in-flight slot, 0 for no limit
+        :type max_queued_requests: int
+        :param request_overflow: Behavior when a request is made while max_queued_requests are waiting: block the
+                                 caller until there is room, complete the oldest or the new request with None, or
+                                 raise QueueOverflowError to the new request's caller
+        :type request_overflow: OverflowPolicy | str
+        :param runtime: Runtime hosting the connection on its shared thread, started if needed, None for a thread of
+                        this client. A client attached to a runtime never touches the event loop of its caller.
+        :type runtime: WaapiRuntime | None
+        :raises: CannotConnectToWaapiException, ValueError
         """
         super(WaapiClient, self).__init__()
 
         self._url = url or "ws://127.0.0.1:8080/waapi"
         self._allow_exception = allow_exception
-        self._callback_executor = callback_executor
+        self._callback_executor = _executor_factory(callback_executor)
+        self._max_in_flight = max_in_flight
+        self._reconnect_policy = reconnect_policy
+        self._timeout = timeout
+        self._result_cache = result_cache
+        self._metrics = metrics
+        self._max_queued_requests = max_queued_requests
+        self._request_overflow = OverflowPolicy(request_overflow)
+        self._request_overflow_counts = {"dropped": 0, "rejected": 0}
+        self._runtime = runtime
         self._client_thread = None
-        """:type: Thread"""
-
-        self._loop = asyncio.get_event_loop()
-        if not self._loop.is_running():
-            if not self._loop.is_closed():
-                self._loop.close()
-            if platform == 'win32':
-                #  Prefer the ProactorEventLoop event loop on Windows
-                self._loop = asyncio.ProactorEventLoop()
-            else:
-                self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
+        """:type: Thread | _WampConnection"""
 
         self._decoupler = None
         """:type: AutobahnClientDecoupler"""
 
-        self._subscriptions = set()
-        """:type: set[EventHandler]"""
+        # Requests deferred while reconnecting, with the futures returned to their callers
+        self._pending_requests = []
+        self._pending_lock = Lock()
+        self._reconnecting = False
+        self._closed = Event()
+        self._supervisor_thread = None
+        """:type: Thread"""
+
+        # autobahn is only imported once a client is created, keeping the import of the package cheap
+        from waapi.wamp.ak_autobahn import create_serializers
+        self._serializers = create_serializers(serializers)
+        if self._metrics is not None:
+            self._serializers = [_MeteredSerializer(serializer, self._metrics) for serializer in self._serializers]
+
+        if self._runtime is not None:
+            self._loop = self._runtime.start().loop
+        else:
+            self.__set_up_loop()
+
+        # Subscriptions with the topic and options they were made with, to restore them on reconnection
+        self._subscriptions = {}
+        """:type: dict[EventHandler, (str, dict)]"""
+        self._subscriptions_lock = Lock()
 
         # Connect on instantiation (RAII idiom)
         if not self.__connect():
             raise CannotConnectToWaapiException("Could not connect to " + self._url)
 
+        if self._result_cache is not None:
+            self.__subscribe_cache_invalidation(self._loop, self._decoupler)
+
+        if self._reconnect_policy is not None:
+            self._reconnecting = True
+            self._supervisor_thread = Thread(target=self.__supervise, daemon=True)
+            self._supervisor_thread.start()
+
+    def __set_up_loop(self):
+        """
+        Create the loop of the client thread, which becomes the current loop of the caller if it has none running
+        """
+        try:
+            self._loop = asyncio.get_event_loop()
+        except RuntimeError:
+            # No current loop in this thread, e.g. after asyncio.run() returned
+            self._loop = asyncio.new_event_loop()
+        if self._loop.is_running():
+            # The current loop is already run by another client's thread or by the caller:
+            # the client thread needs a loop of its own
+            self._loop = _new_event_loop()
+        else:
+            if not self._loop.is_closed():
+                self._loop.close()
+            self._loop = _new_event_loop()
+            asyncio.set_event_loop(self._loop)
+
     def __connect(self):
         """
         Connect to the Waapi server.
@@ -93,20 +287,41 @@ class WaapiClient(UnsubscribeHandler):
         :return: True if connection succeeded, False otherwise.
         :rtype: bool
         """
-        self._client_thread, self._decoupler = start_decoupled_autobahn_client(
+        self._client_thread, self._decoupler = self.__start_connection(self._loop)
+        return self._client_thread.is_alive()
+
+    def __start_connection(self, loop):
+        """
+        Start a client thread connecting to the Waapi server on the loop, or the connection on the loop of the runtime,
+        and wait for the connection to be made
+
+        :type loop: asyncio.AbstractEventLoop
+        :return: The client thread or connection, which is terminated if the connection failed, and its decoupler
+        :rtype: (Thread | _WampConnection, AutobahnClientDecoupler)
+        """
+        from waapi.wamp.ak_autobahn import start_decoupled_autobahn_client
+        from waapi.wamp.async_decoupled_client import WampClientAutobahn
+
+        client_thread, decoupler = start_decoupled_autobahn_client(
             self._url,
-            self._loop,
+            loop,
             WampClientAutobahn,
             self._callback_executor(),
             self._allow_exception,
-            queue_size=0
+            queue_size=self._max_queued_requests,
+            max_in_flight=self._max_in_flight,
+            serializers=self._serializers,
+            metrics=self._metrics,
+            overflow=self._request_overflow,
+            overflow_counts=self._request_overflow_counts,
+            shared=self._runtime is not None
         )
 
         # Return upon connection success
-        self._decoupler.wait_for_joined()
+        decoupler.wait_for_joined()
 
         # A failure is indicated by the runner client thread being terminated
-        return self._client_thread.is_alive()
+        return client_thread, decoupler
 
     def disconnect(self):
         """
@@ -115,15 +330,24 @@ class WaapiClient(UnsubscribeHandler):
         :return: True if the call caused a successful disconnection, False otherwise.
         :rtype: bool
         """
+        # Disconnecting also stops any reconnection, even while the connection is lost
+        self._closed.set()
+        if self._supervisor_thread is not None and self._supervisor_thread is not current_thread() and \
+                not self._client_thread.is_alive():
+            self._supervisor_thread.join()
+
         if self.is_connected() and self.__do_request(WampRequestType.STOP):
             # Wait for the runner thread to gracefully exit and the asyncio loop to close
             if self._client_thread.is_alive():
                 self._client_thread.join()
+            if self._supervisor_thread is not None and self._supervisor_thread is not current_thread():
+                self._supervisor_thread.join()
 
-            self._subscriptions.clear()  # No need to unsubscribe, subscriptions will be dropped anyways
+            with self._subscriptions_lock:
+                self._subscriptions.clear()  # No need to unsubscribe, subscriptions will be dropped anyways
 
             # Create a new loop for upcoming uses
-            if asyncio.get_event_loop().is_closed():
+            if self._runtime is None and asyncio.get_event_loop().is_closed():
                 asyncio.set_event_loop(asyncio.new_event_loop())
 
             return True
@@ -138,7 +362,30 @@ class WaapiClient(UnsubscribeHandler):
         """
         return self._decoupler and self._decoupler.has_joined() and self._client_thread.is_alive()
 
-    def call(self, _uri, *args, **kwargs):
+    def queue_statistics(self):
+        """
+        :return: Number of requests waiting in the request queue, its limit (0 for none), and the numbers of requests
+                 dropped or rejected by the full queue
+        :rtype: dict
+        """
+        return {
+            "queue_depth": self._decoupler.queue_depth() if self.is_connected() else 0,
+            "max_queued_requests": self._max_queued_requests,
+            "dropped": self._request_overflow_counts["dropped"],
+            "rejected": self._request_overflow_counts["rejected"]
+        }
+
+    def metrics(self):
+        """
+        :return: Snapshot of the metrics of the client, see ClientMetrics.snapshot. None if the client was not created
+                 with metrics.
+        :rtype: dict | None
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot(self._decoupler.queue_depth() if self.is_connected() else 0)
+
+    def call(self, _uri, *args, timeout=None, raw=False, **kwargs):
         """
         Do a Remote Procedure Call (RPC) to the Waapi server.
         Arguments can be specified as named arguments (unless the argument is a reserved keyword), e.g.:
@@ -157,17 +404,175 @@ class WaapiClient(UnsubscribeHandler):
         Note that any named arguments passed take precedence on the values of a dictionary passed as
         a positional argument.
 
+        The named arguments timeout and raw are reserved for the client, arguments with these names of the remote
+        procedure must be passed in the dictionary.
+
+        With raw=True, the result is the JSON of the result as bytes, e.g. to write it to a file or forward it
+        without decoding and encoding it again. The reply is not decoded with the JSON serializer, the default.
+
         :param _uri: URI of the remote procedure to be called
         :type _uri: str
+        :param timeout: Seconds to wait for the result, defaults to the client's timeout. On expiration, the request
+                        is cancelled and its reply will be ignored.
+        :type timeout: float | None
+        :param raw: Return the JSON of the result as bytes instead of a dictionary
+        :type raw: bool
         :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
         :return: Result from the remote procedure call, None if failed.
-        :rtype: dict | None
+        :rtype: dict | bytes | None
+        :raises: WaapiRequestFailed, WaapiRequestTimeout
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        if self._result_cache is not None:
+            return self.__wait_for(self.__cached_call(_uri, kwargs, raw), _uri, timeout)
+        return self.__wait_for(self.__submit_request(WampRequestType.CALL, _uri, raw=raw, **kwargs), _uri, timeout)
+
+    def call_async(self, _uri, *args, raw=False, **kwargs):
+        """
+        Do a Remote Procedure Call (RPC) to the Waapi server without waiting for the result.
+        Arguments and options are specified the same way as the call method.
+
+        The request is sent as soon as possible by the client thread: any number of calls can be issued from a single
+        thread to overlap their round trips, e.g.:
+          futures = [client.call_async("ak.wwise.core.object.get", args) for args in queries]
+          results = wait_all(futures)
+
+        Cancelling the returned future cancels the request, whose reply will then be ignored.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param raw: Complete the future with the JSON of the result as bytes instead of a dictionary, see call
+        :type raw: bool
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Future to the result from the remote procedure call, which is None if failed.
+                 Getting the result raises WaapiRequestFailed if the client allows exceptions.
+        :rtype: concurrent.futures.Future
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        if self._result_cache is not None:
+            return self.__cached_call(_uri, kwargs, raw)
+        return self.__submit_request(WampRequestType.CALL, _uri, raw=raw, **kwargs)
+
+    def call_many(self, calls, stop_on_error=False):
+        """
+        Do a batch of Remote Procedure Calls (RPC) to the Waapi server.
+        The whole batch is forwarded to the client thread at once and sent in a single burst, e.g.:
+          client.call_many([
+              ("ak.wwise.core.object.setProperty", {"object": object_id, "property": "Volume", "value": -6}),
+              ("ak.wwise.core.object.setReference", {"object": object_id, "reference": "OutputBus", "value": bus}),
+          ])
+
+        Arguments of each call are a single dictionary, which may contain options using the key "options".
+        With a result cache, the batch is sent to the server, and invalidates the cache if it calls an URI whose
+        results are not cached.
+
+        :param calls: Calls to do, as (uri, arguments) pairs or an URI alone for a call without arguments
+        :type calls: list[(str, dict) | str]
+        :param stop_on_error: If True, the calls of the batch not yet sent when a call fails are not sent and have
+                              a None result, and WaapiRequestFailed is raised if the client allows exceptions.
+                              Otherwise all calls are sent and, if the client allows exceptions, the result of a
+                              failed call is its WaapiRequestFailed exception.
+        :type stop_on_error: bool
+        :return: Results from the remote procedure calls in the order of the calls, None for failed calls.
+        :rtype: list[dict | WaapiRequestFailed | None]
         :raises: WaapiRequestFailed
         """
-        kwargs = self.__merge_args_to_kwargs(args, kwargs)
-        return self.__do_request(WampRequestType.CALL, _uri, **kwargs)
+        requests = []
+        for call in calls:
+            _uri, kwargs = (call, {}) if isinstance(call, str) else call
+            # The request consumes the options of its arguments: never alter the caller's dictionary
+            requests.append((_uri, dict(kwargs or {}), None, None))
+
+        if not requests:
+            return []
+
+        cache = self._result_cache
+        try:
+            results = self.__submit_batch(requests, stop_on_error).result()
+        finally:
+            if cache is not None and not all(cache.is_cached(_uri) for _uri, _, _, _ in requests):
+                cache.invalidate()  # Any other call may modify the project
+        if results is None:
+            return [None] * len(requests)  # The client terminated before the completion of the batch
 
-    def subscribe(self, _uri, callback_or_handler=None, *args, **kwargs):
+        if stop_on_error:
+            for result in results:
+                if isinstance(result, WaapiRequestFailed):
+                    raise result
+        return results
+
+    def iter_objects(self, from_=None, options=None, transform=None, waql=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                     max_pending=4):
+        """
+        Iterate over the objects returned by ak.wwise.core.object.get for a very large selection, e.g.:
+          for obj in client.iter_objects({"path": paths}, options={"return": ["id", "name"]}):
+              ...
+
+        The selection is split into chunks of objects requested separately: a "from" argument listing objects by id,
+        path or name is split directly, any other selection (transform, ofType, search, WAQL, ...) is first resolved
+        to the ids of its objects, with the same options except the properties returned. Up to max_pending chunk
+        requests are pipelined, and the objects of each chunk are yielded in order as soon as it arrives, so memory
+        use remains bounded by the chunk size besides the list of ids or names selecting the objects.
+
+        :param from_: "from" argument of ak.wwise.core.object.get
+        :type from_: dict | None
+        :param options: Options of ak.wwise.core.object.get, e.g. the properties to return
+        :type options: dict | None
+        :param transform: "transform" argument of ak.wwise.core.object.get
+        :type transform: list | None
+        :param waql: WAQL query selecting the objects, instead of from_
+        :type waql: str | None
+        :param chunk_size: Maximum number of objects requested at once
+        :type chunk_size: int
+        :param max_pending: Maximum number of chunk requests awaiting a reply at the same time
+        :type max_pending: int
+        :return: Generator of the objects. If a request fails and the client does not allow exceptions, the
+                 iteration stops.
+        :rtype: collections.abc.Iterator[dict]
+        :raises: ValueError, WaapiRequestFailed
+        """
+        if (from_ is None) == (waql is None):
+            raise ValueError("Objects must be selected by either from_ or waql")
+
+        options = options or {}
+        from_key, values = next(iter(from_.items())) if from_ is not None and len(from_) == 1 else (None, None)
+        if waql is not None or transform or from_key not in _SPLITTABLE_FROM_KEYS or not isinstance(values, list):
+            # Resolve the selection to the ids of its objects, which are small compared to the objects
+            args = {"waql": waql} if waql is not None else {"from": from_}
+            if transform:
+                args["transform"] = transform
+            # Other options, e.g. platform or language, may change the objects selected
+            resolve_options = {key: value for key, value in options.items() if key != "return"}
+            resolve_options["return"] = ["id"]
+            result = self.call("ak.wwise.core.object.get", args, options=resolve_options)
+            if result is None:
+                return
+            from_key, values = "id", [obj["id"] for obj in result.get("return", [])]
+
+        starts = iter(range(0, len(values), chunk_size))
+        pending = deque()
+        try:
+            while True:
+                # Keep the pipeline full while the objects of the oldest chunk are consumed
+                for start in islice(starts, max_pending - len(pending)):
+                    pending.append(self.call_async(
+                        "ak.wwise.core.object.get",
+                        {"from": {from_key: values[start:start + chunk_size]}},
+                        options=dict(options)
+                    ))
+                if not pending:
+                    return
+
+                result = pending.popleft().result()
+                if result is None:
+                    return
+                yield from result.get("return", [])
+        finally:
+            # The iteration was stopped early: the remaining chunks are no longer needed
+            for future in pending:
+                future.cancel()
+
+    def subscribe(self, _uri, callback_or_handler=None, *args, timeout=None, **kwargs):
         """
         Subscribe to a topic on the Waapi server.
         Named arguments are options to be passed for the subscription.
@@ -192,28 +597,87 @@ class WaapiClient(UnsubscribeHandler):
                                     EventHandler (or subclass).
                                     Note: use a generic signature to support any topic: def fct(*args, **kwargs):
         :type callback_or_handler: callable | EventHandler
+        :param timeout: Seconds to wait for the subscription, defaults to the client's timeout. On expiration, the
+                        request is cancelled and a subscription made by the server afterwards is undone.
+        :type timeout: float | None
         :rtype: EventHandler | None
-        :raises: WaapiRequestFailed
+        :raises: WaapiRequestFailed, WaapiRequestTimeout
         """
-        kwargs = self.__merge_args_to_kwargs(args, kwargs)
+        kwargs = _merge_args_to_kwargs(args, kwargs)
 
         if callback_or_handler is not None and isinstance(callback_or_handler, EventHandler):
             event_handler = callback_or_handler
         else:
             event_handler = EventHandler(self, callback_or_handler)
 
-        subscription = self.__do_request(
-            WampRequestType.SUBSCRIBE,
+        options = dict(kwargs)
+        subscription = self.__wait_for(
+            self.__submit_request(
+                WampRequestType.SUBSCRIBE, _uri, event_handler.on_event, None, event_handler._executor, **kwargs
+            ),
             _uri,
-            event_handler.on_event,
-            **kwargs
+            timeout
         )
         if subscription is not None:
             event_handler.subscription = subscription
             event_handler._unsubscribe_handler = self
-            self._subscriptions.add(event_handler)
+            with self._subscriptions_lock:
+                self._subscriptions[event_handler] = (_uri, options)
             return event_handler
 
+    def subscribe_many(self, subscriptions, timeout=None):
+        """
+        Subscribe to many topics on the Waapi server at once.
+        All the subscriptions are sent in a single burst and their replies are awaited together, e.g.:
+          handlers = client.subscribe_many([
+              ("ak.wwise.core.object.created", on_created),
+              ("ak.wwise.core.object.nameChanged", on_renamed, {"return": ["id", "name"]}),
+          ])
+
+        Subscriptions are specified as with the subscribe method, with their options as a single dictionary.
+        A failed subscription does not prevent the others: its result is None or, if the client allows exceptions,
+        its WaapiRequestFailed exception.
+
+        :param subscriptions: Subscriptions to make, as (uri, callback_or_handler) or
+                              (uri, callback_or_handler, options) tuples
+        :type subscriptions: list[(str, callable | EventHandler) | (str, callable | EventHandler, dict)]
+        :param timeout: Seconds to wait for the subscriptions, defaults to the client's timeout. On expiration, the
+                        subscriptions not yet made are cancelled and their result is None.
+        :type timeout: float | None
+        :return: Event handler of each subscription, in order, None for the failed or expired subscriptions
+        :rtype: list[EventHandler | WaapiRequestFailed | None]
+        """
+        event_handlers = []
+        topics = []
+        requests = []
+        for _uri, callback_or_handler, *options in subscriptions:
+            if callback_or_handler is not None and isinstance(callback_or_handler, EventHandler):
+                event_handler = callback_or_handler
+            else:
+                event_handler = EventHandler(self, callback_or_handler)
+            options = dict(options[0] or {}) if options else {}
+            event_handlers.append(event_handler)
+            topics.append((_uri, options))
+            requests.append((_uri, dict(options), event_handler.on_event, event_handler._executor))
+
+        if not requests:
+            return []
+
+        timeout = self._timeout if timeout is None else timeout
+        results = self.__submit_batch(requests, False, WampRequestType.SUBSCRIBE, timeout).result()
+        if results is None:
+            return [None] * len(requests)  # The client terminated before the completion of the batch
+
+        for index, (event_handler, topic, subscription) in enumerate(zip(event_handlers, topics, results)):
+            if subscription is None or isinstance(subscription, WaapiRequestFailed):
+                continue
+            event_handler.subscription = subscription
+            event_handler._unsubscribe_handler = self
+            with self._subscriptions_lock:
+                self._subscriptions[event_handler] = topic
+            results[index] = event_handler
+        return results
+
     def unsubscribe(self, event_handler):
         """
         Unsubscribe from a topic managed by the passed EventHandler instance.
@@ -225,13 +689,20 @@ class WaapiClient(UnsubscribeHandler):
         :return: True if successfully unsubscribed, False otherwise.
         :rtype: bool
         """
-        if event_handler not in self._subscriptions:
-            return False
+        with self._subscriptions_lock:
+            if event_handler not in self._subscriptions:
+                return False
+            # Claim the handler so that concurrent unsubscriptions of the same handler do not all reach the server
+            topic = self._subscriptions.pop(event_handler)
 
-        success = self.__do_request(WampRequestType.UNSUBSCRIBE, subscription=event_handler.subscription)
+        success = self.__do_request(
+            WampRequestType.UNSUBSCRIBE, subscription=event_handler.subscription, executor=event_handler._executor
+        )
         if success:
-            self._subscriptions.remove(event_handler)
             event_handler.subscription = None
+        else:
+            with self._subscriptions_lock:
+                self._subscriptions[event_handler] = topic
         return success
 
     def subscriptions(self):
@@ -239,56 +710,354 @@ class WaapiClient(UnsubscribeHandler):
         :return: A copy of the set of subscriptions belonging to client instance.
         :rtype: set[EventHandler]
         """
-        return copy(self._subscriptions)
+        with self._subscriptions_lock:
+            return set(self._subscriptions)
 
-    @staticmethod
-    def __merge_args_to_kwargs(args, kwargs):
+    def __do_request(self, request_type, _uri=None, callback=None, subscription=None, **kwargs):
         """
-        Merged a single dictionary passed as argument to a kwargs dictionary, if it exists.
+        Create and forward a generic WAMP request to the decoupler, then wait for its completion
 
-        :type args: tuple[dict] | tuple[]
-        :param kwargs: dict
-        :return: Updated kwargs
-        :rtype: dict
+        :type request_type: WampRequestType
+        :type _uri: str | None
+        :type callback: (*Any) -> None | None
+        :type subscription: Subscription | None
+        :return: Result from WampRequest, None if request failed.
+        :rtype: dict | None
         """
-        if len(args) > 0 and isinstance(args[0], dict):
-            kwargs.update(args[0])
-        return kwargs
+        return self.__submit_request(request_type, _uri, callback, subscription, **kwargs).result()
 
-    def __do_request(self, request_type, _uri=None, callback=None, subscription=None, **kwargs):
+    def __cached_call(self, _uri, kwargs, raw=False):
         """
-        Create and forward a generic WAMP request to the decoupler
+        Do a call through the result cache without waiting for its completion
+
+        :type _uri: str
+        :type kwargs: dict
+        :type raw: bool
+        :return: Future to the result from the remote procedure call, which is None if failed.
+        :rtype: concurrent.futures.Future
+        """
+        cache = self._result_cache
+        if not cache.is_cached(_uri):
+            # Any other call may modify the project: the cache is invalidated before the caller sees the result
+            return _chain_future_after(
+                self.__submit_request(WampRequestType.CALL, _uri, raw=raw, **kwargs), lambda _: cache.invalidate()
+            )
+
+        if raw:
+            # Only decoded results are cached
+            return self.__submit_request(WampRequestType.CALL, _uri, raw=True, **kwargs)
+
+        # The key is computed first, the request consumes the options of the arguments
+        key = cache.key(_uri, kwargs)
+        if key is not None:
+            result = cache.get(key)
+            if result is not None:
+                return _completed_future(result)
+
+        generation = cache.generation
+
+        def put(future):
+            if key is not None and not future.cancelled() and future.exception() is None and \
+                    future.result() is not None:
+                cache.put(key, future.result(), generation)
+
+        return _chain_future_after(self.__submit_request(WampRequestType.CALL, _uri, **kwargs), put)
+
+    def __subscribe_cache_invalidation(self, loop, decoupler):
+        """
+        Subscribe to the topics invalidating the result cache, without exposing these subscriptions.
+        The cache is invalidated on the client thread, before any callback of the same event runs.
+
+        :type loop: asyncio.AbstractEventLoop
+        :type decoupler: AutobahnClientDecoupler
+        """
+        cache = self._result_cache
+        executor = _InlineExecutor()
+        futures = [
+            (topic, self.__send_request(
+                loop, decoupler, WampRequestType.SUBSCRIBE, topic, cache.invalidate, None, {}, executor
+            ))
+            for topic in cache.invalidation_topics
+        ]
+
+        subscribed_topics = []
+        for topic, future in futures:
+            try:
+                if future.result() is not None:
+                    subscribed_topics.append(topic)
+            except WaapiRequestFailed:
+                pass
+        cache._set_subscribed_topics(subscribed_topics)
+
+    def __wait_for(self, concurrent_future, _uri, timeout):
+        """
+        Wait for the result of a request, cancelling it on timeout
+
+        :type concurrent_future: concurrent.futures.Future
+        :type _uri: str
+        :param timeout: Seconds to wait, None for the client's timeout
+        :type timeout: float | None
+        :return: Result from WampRequest, None if request failed.
+        :rtype: dict | Subscription | None
+        :raises: WaapiRequestTimeout
+        """
+        timeout = self._timeout if timeout is None else timeout
+        try:
+            return concurrent_future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            if not concurrent_future.cancel():
+                return concurrent_future.result()  # Completed in the meantime
+            if self._metrics is not None:
+                self._metrics._record_timeout()
+            raise WaapiRequestTimeout(_uri, timeout) from None
+
+    def __submit_request(self, request_type, _uri=None, callback=None, subscription=None, executor=None, raw=False,
+                         **kwargs):
+        """
+        Create and forward a generic WAMP request to the decoupler without waiting for its completion
 
         :type request_type: WampRequestType
         :type _uri: str | None
         :type callback: (*Any) -> None | None
         :type subscription: Subscription | None
-        :return: Result from WampRequest, None if request failed.
-        :rtype: dict | None
+        :param executor: Executor of the callback, None for the executor of the client
+        :type executor: CallbackExecutor | None
+        :param raw: For a CALL, complete the future with the JSON of the result as bytes
+        :type raw: bool
+        :return: Future to the result from WampRequest, completed with None if request failed.
+        :rtype: concurrent.futures.Future
         """
+        loop, decoupler = self._loop, self._decoupler
         if not self._client_thread.is_alive():
-            return
-
-        # Make sure the current thread has the event loop set
-        asyncio.set_event_loop(self._loop)
-
-        async def _async_request(future):
-            """
-            :type future: asyncio.Future
-            """
-            request = WampRequest(request_type, _uri, kwargs, callback, subscription, future)
-            await self._decoupler.put_request(request)
-            await future  # The client worker is responsible for completing the future
-
-        forwarded_future = asyncio.Future()
-        concurrent_future = asyncio.run_coroutine_threadsafe(_async_request(forwarded_future), self._loop)
-        self._decoupler.set_caller_future(concurrent_future)
-        concurrent_future.result()
-        self._decoupler.set_caller_future(None)
-
-        # If the decoupled client worker never set the future, it failed and/or died and we return None
-        if forwarded_future.done():
-            return forwarded_future.result()
+            return self.__defer_request(request_type, _uri, callback, subscription, kwargs, executor, raw)
+
+        return self.__send_request(loop, decoupler, request_type, _uri, callback, subscription, kwargs, executor, raw)
+
+    @staticmethod
+    def __send_request(loop, decoupler, request_type, _uri, callback, subscription, kwargs, executor=None,
+                       raw=False):
+        """
+        Forward a generic WAMP request to the decoupler of a connection
+
+        :type loop: asyncio.AbstractEventLoop
+        :type decoupler: AutobahnClientDecoupler
+        :type request_type: WampRequestType
+        :type _uri: str | None
+        :type callback: (*Any) -> None | None
+        :type subscription: Subscription | None
+        :type kwargs: dict
+        :param executor: Executor of the callback, None for the executor of the client
+        :type executor: CallbackExecutor | None
+        :param raw: For a CALL, complete the future with the JSON of the result as bytes
+        :type raw: bool
+        :rtype: concurrent.futures.Future
+        """
+        # The client worker completes the future of the caller directly, the request is handed to the loop with a
+        # single callback instead of a coroutine wrapping an asyncio future
+        concurrent_future = concurrent.futures.Future()
+        request = WampRequest(request_type, _uri, kwargs, callback, subscription, concurrent_future, executor, raw)
+        if decoupler.metrics is not None and request_type != WampRequestType.STOP:
+            request.submitted = time.perf_counter()
+
+        # Back-pressure on the caller's thread when the queue is bounded and blocks, except on the loop itself which
+        # drains the queue
+        if request_type != WampRequestType.STOP and not _is_running_loop(loop):
+            decoupler.admit(request)
+
+        try:
+            loop.call_soon_threadsafe(decoupler.submit, request)
+        except RuntimeError:
+            return _completed_future(None)  # The loop was closed by a concurrent disconnection
+
+        # If the decoupled client worker never completes the request, it failed and/or died and
+        # the decoupler completes the future with None
+        decoupler.add_caller_future(concurrent_future)
+        return concurrent_future
+
+    def __defer_request(self, request_type, _uri, callback, subscription, kwargs, executor, raw):
+        """
+        Queue a request made while the connection is lost, to be sent once reconnected
+
+        :return: Future to the result from WampRequest, completed with None if the request cannot be queued.
+        :rtype: concurrent.futures.Future
+        """
+        with self._pending_lock:
+            if self._reconnecting and not self._closed.is_set():
+                if request_type == WampRequestType.UNSUBSCRIBE:
+                    # The subscription was dropped by the server with the connection, it must not be restored
+                    return _completed_future(True)
+
+                if len(self._pending_requests) < self._reconnect_policy.max_queued_calls:
+                    future = concurrent.futures.Future()
+                    self._pending_requests.append(
+                        (request_type, _uri, callback, subscription, kwargs, executor, raw, future)
+                    )
+                    return future
+
+        return _completed_future(None)
+
+    def __supervise(self):
+        """
+        Wait for the loss of the connection and reconnect according to the reconnect policy, until disconnected
+        """
+        while True:
+            self._client_thread.join()
+            if self._closed.is_set() or not self.__reconnect():
+                break
+
+        with self._pending_lock:
+            self._reconnecting = False
+            pending, self._pending_requests = self._pending_requests, []
+        for *_, future in pending:
+            if future.set_running_or_notify_cancel():
+                future.set_result(None)
+
+    def __reconnect(self):
+        """
+        Reconnect to the Waapi server, restore the subscriptions then send the requests deferred in the meantime
+
+        :return: True if reconnected, False if the policy gave up or the client was disconnected
+        :rtype: bool
+        """
+        for delay in self._reconnect_policy.delays():
+            if self._closed.wait(delay):
+                return False
+
+            loop = self._runtime.start().loop if self._runtime is not None else _new_event_loop()
+            client_thread, decoupler = self.__start_connection(loop)
+            if not client_thread.is_alive():
+                continue
+
+            restored = self.__restore_subscriptions(loop, decoupler)
+            if self._result_cache is not None:
+                self.__subscribe_cache_invalidation(loop, decoupler)
+
+            with self._pending_lock:
+                self._loop, self._decoupler, self._client_thread = loop, decoupler, client_thread
+                if self._closed.is_set():
+                    # Disconnected during the reconnection: the disconnecting caller no longer sees this connection
+                    self.__send_request(loop, decoupler, WampRequestType.STOP, None, None, None, {}).result()
+                    client_thread.join()
+                    return False
+                pending, self._pending_requests = self._pending_requests, []
+
+            if self._result_cache is not None:
+                self._result_cache.invalidate()  # Changes may have been missed during the outage
+
+            orphans = []
+            with self._subscriptions_lock:
+                for event_handler, subscription in restored.items():
+                    if event_handler in self._subscriptions:
+                        event_handler.subscription = subscription
+                    else:
+                        orphans.append(subscription)  # Unsubscribed during the reconnection
+            for subscription in orphans:
+                self.__send_request(loop, decoupler, WampRequestType.UNSUBSCRIBE, None, None, subscription, {})
+
+            for request_type, _uri, callback, subscription, kwargs, executor, raw, future in pending:
+                if future.cancelled():
+                    continue  # Timed out while reconnecting
+                _chain_future(
+                    self.__send_request(
+                        loop, decoupler, request_type, _uri, callback, subscription, kwargs, executor, raw
+                    ),
+                    future
+                )
+            return True
+
+        return False
+
+    def __restore_subscriptions(self, loop, decoupler):
+        """
+        Subscribe again on a new connection with the topic and options of each subscription.
+        Subscriptions that cannot be restored are removed.
+
+        :type loop: asyncio.AbstractEventLoop
+        :type decoupler: AutobahnClientDecoupler
+        :return: New subscription of each restored event handler
+        :rtype: dict[EventHandler, Subscription]
+        """
+        with self._subscriptions_lock:
+            subscriptions = list(self._subscriptions.items())
+
+        # Send all the subscriptions before waiting for any of them
+        futures = [
+            (event_handler, self.__send_request(
+                loop, decoupler, WampRequestType.SUBSCRIBE, _uri, event_handler.on_event, None, dict(options),
+                event_handler._executor
+            ))
+            for event_handler, (_uri, options) in subscriptions
+        ]
+
+        restored = {}
+        for event_handler, future in futures:
+            try:
+                subscription = future.result()
+            except WaapiRequestFailed:
+                subscription = None
+
+            if subscription is not None:
+                restored[event_handler] = subscription
+            else:
+                with self._subscriptions_lock:
+                    self._subscriptions.pop(event_handler, None)
+                event_handler.subscription = None
+        return restored
+
+    def __submit_batch(self, requests, stop_on_error, request_type=WampRequestType.CALL, timeout=None):
+        """
+        Forward a batch of requests to the decoupler in a single hop without waiting for their completion
+
+        :param requests: URI, arguments, callback and executor of the callback of each request
+        :type requests: list[(str, dict, callable | None, CallbackExecutor | None)]
+        :type stop_on_error: bool
+        :type request_type: WampRequestType
+        :param timeout: Seconds after which the requests not completed are cancelled, None to wait indefinitely
+        :type timeout: float | None
+        :return: Future to the list of results, in order, completed with None if the client terminated
+        :rtype: concurrent.futures.Future
+        """
+        if not self._client_thread.is_alive():
+            return _completed_future(None)
+
+        submitted = time.perf_counter() if self._metrics is not None else None
+
+        async def _async_batch():
+            futures = [self._loop.create_future() for _ in requests]
+
+            if stop_on_error:
+                def on_done(done_future):
+                    if done_future.cancelled():
+                        return
+                    if done_future.exception() is not None or done_future.result() is None:
+                        # Calls still in the queue are skipped once their future is cancelled
+                        for future in futures:
+                            if not future.done():
+                                future.cancel()
+
+                for future in futures:
+                    future.add_done_callback(on_done)
+
+            for (_uri, kwargs, callback, executor), future in zip(requests, futures):
+                request = WampRequest(request_type, _uri, kwargs, callback, future=future, executor=executor)
+                request.submitted = submitted
+                await self._decoupler.put_request(request)
+
+            if timeout is not None:
+                await asyncio.wait(futures, timeout=timeout)
+                for future in futures:
+                    future.cancel()  # No effect on the completed requests
+
+            results = await asyncio.gather(*futures, return_exceptions=True)
+            return [None if isinstance(result, asyncio.CancelledError) else result for result in results]
+
+        try:
+            concurrent_future = asyncio.run_coroutine_threadsafe(_async_batch(), self._loop)
+        except RuntimeError:
+            return _completed_future(None)  # The loop was closed by a concurrent disconnection
+
+        self._decoupler.add_caller_future(concurrent_future)
+        return concurrent_future
 
     def __del__(self):
         self.disconnect()
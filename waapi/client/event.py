@@ -1,4 +1,4 @@
-from autobahn.wamp.request import Subscription
+from waapi.client.interface import ForwardingExecutor
 
 
 class EventHandler:
@@ -14,6 +14,10 @@ class EventHandler:
 
     An instance of this class is also callable and can therefore be use as if it were a function reference.
     """
+    # Executor applying the delivery policy of the handler on the client thread, None to hand each event directly
+    # to the executor of the client
+    _executor = None
+
     def __init__(self, unsubscribe_handler=None, callback=None):
         """
         :param unsubscribe_handler: UnsubscribeHandler | None
@@ -35,13 +39,18 @@ class EventHandler:
 
     @subscription.setter
     def subscription(self, value):
+        # Imported on use: subscriptions only exist once a connection has loaded autobahn
+        from autobahn.wamp.request import Subscription
         if value is None or isinstance(value, Subscription):
             self._subscription = value
 
     def unsubscribe(self):
         """
+        With an AsyncWaapiClient, the unsubscription is scheduled on the loop of the client and its task is returned
+        instead, resolving to that result once awaited.
+
         :return: True if the EventHandler was unsubscribed successfully, False otherwise.
-        :rtype: bool
+        :rtype: bool | asyncio.Task
         """
         if not self._unsubscribe_handler:
             return False
@@ -74,3 +83,177 @@ class EventHandler:
         Delegate to on_event
         """
         self.on_event(*args, **kwargs)
+
+
+def _call_later(delay, callback, *args):
+    """
+    Schedule a callback on the loop of the client thread.
+    asyncio is imported on use, so that importing event handlers remains cheap.
+
+    :rtype: asyncio.TimerHandle
+    """
+    from waapi.wamp.async_compatibility import asyncio
+    return asyncio.get_event_loop().call_later(delay, callback, *args)
+
+
+def object_property_key(kwargs):
+    """
+    Coalescing key of an event: the id of its object and the name of its property, if any.
+    Events without an object, e.g. ak.wwise.ui.selectionChanged, all share the same key.
+
+    :param kwargs: Arguments of the event
+    :type kwargs: dict
+    :rtype: (str | None, str | None)
+    """
+    obj = kwargs.get("object")
+    return obj.get("id") if isinstance(obj, dict) else None, kwargs.get("propertyName")
+
+
+class CoalescingEventHandler(EventHandler):
+    """
+    Event handler delivering only the latest event of each key received within a window, for topics firing many
+    times per second while only the latest state matters, e.g.:
+      client.subscribe("ak.wwise.core.object.propertyChanged", CoalescingEventHandler(callback=on_change, window=0.1))
+
+    The first event of a key opens a window, at the end of which the latest event of the key is delivered.
+    Events are coalesced on the client thread, before being handed to the callback executor.
+
+    Import as:
+      from waapi import CoalescingEventHandler
+    """
+    def __init__(self, unsubscribe_handler=None, callback=None, window=0.1, key=object_property_key):
+        """
+        :param unsubscribe_handler: UnsubscribeHandler | None
+        :param callback: (*Any) -> None | None
+        :param window: Seconds during which the events of a key are coalesced, 0 to only coalesce the events
+                       received together
+        :type window: float
+        :param key: Function of the arguments of an event returning its coalescing key, defaults to the object id and
+                    property name
+        :type key: (dict) -> Hashable
+        """
+        super(CoalescingEventHandler, self).__init__(unsubscribe_handler, callback)
+        self.window = window
+        self.key = key
+        self._executor = _CoalescingExecutor(self)
+
+    @property
+    def coalesced(self):
+        """
+        :return: Number of events replaced by a later event of the same key
+        :rtype: int
+        """
+        return self._executor.coalesced
+
+
+class _CoalescingExecutor(ForwardingExecutor):
+    def __init__(self, handler):
+        """
+        :type handler: CoalescingEventHandler
+        """
+        super(_CoalescingExecutor, self).__init__()
+        self._handler = handler
+        self._pending = {}
+        """:type: dict[Hashable, (callable, dict)]"""
+        self._windows = {}
+        """:type: dict[Hashable, asyncio.TimerHandle]"""
+        self.coalesced = 0
+
+    def execute(self, callback, kwargs):
+        key = self._handler.key(kwargs)
+        if key in self._pending:
+            self.coalesced += 1
+        else:
+            self._windows[key] = _call_later(self._handler.window, self._flush, key)
+        self._pending[key] = (callback, kwargs)
+
+    def _flush(self, key):
+        del self._windows[key]
+        callback, kwargs = self._pending.pop(key)
+        self.forward(callback, kwargs)
+
+    def flush(self):
+        # The latest event of each open window is delivered without waiting for the end of the window
+        for window in self._windows.values():
+            window.cancel()
+        self._windows.clear()
+        pending, self._pending = self._pending, {}
+        for callback, kwargs in pending.values():
+            self.forward(callback, kwargs)
+
+
+class BatchingEventHandler(EventHandler):
+    """
+    Event handler delivering events in batches, to amortize the cost of each event, e.g. to write them in bulk:
+      client.subscribe("ak.wwise.core.object.created", BatchingEventHandler(callback=store_all, max_batch_size=500))
+
+    The callback is called with the list of the arguments of the events of a batch, in order. A batch is delivered
+    once it holds max_batch_size events, or max_linger seconds after its first event.
+    Events are batched on the client thread: each batch is handed to the callback executor as a whole.
+
+    Import as:
+      from waapi import BatchingEventHandler
+    """
+    def __init__(self, unsubscribe_handler=None, callback=None, max_batch_size=100, max_linger=0.05):
+        """
+        :param unsubscribe_handler: UnsubscribeHandler | None
+        :param callback: Function called with the arguments of the events of each batch
+        :type callback: (list[dict]) -> None | None
+        :param max_batch_size: Maximum number of events of a batch
+        :type max_batch_size: int
+        :param max_linger: Maximum number of seconds an event waits for its batch to be delivered
+        :type max_linger: float
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        super(BatchingEventHandler, self).__init__(unsubscribe_handler, callback)
+        self.max_batch_size = max_batch_size
+        self.max_linger = max_linger
+        self._executor = _BatchingExecutor(self)
+
+    def on_event(self, events):
+        """
+        Callback on reception of a batch of events related to the subscribed topic
+
+        :param events: Arguments of each event
+        :type events: list[dict]
+        """
+        if self._callback:
+            self._callback(events)
+
+    def __call__(self, events):
+        self.on_event(events)
+
+
+class _BatchingExecutor(ForwardingExecutor):
+    def __init__(self, handler):
+        """
+        :type handler: BatchingEventHandler
+        """
+        super(_BatchingExecutor, self).__init__()
+        self._handler = handler
+        self._callback = None
+        self._batch = []
+        self._linger = None
+        """:type: asyncio.TimerHandle | None"""
+
+    def execute(self, callback, kwargs):
+        self._callback = callback
+        self._batch.append(kwargs)
+        if len(self._batch) >= self._handler.max_batch_size:
+            self._flush()
+        elif self._linger is None:
+            self._linger = _call_later(self._handler.max_linger, self._flush)
+
+    def _flush(self):
+        if self._linger is not None:
+            self._linger.cancel()
+            self._linger = None
+        batch, self._batch = self._batch, []
+        self.forward(self._callback, {"events": batch})
+
+    def flush(self):
+        # The partial batch is delivered without waiting for its linger time
+        if self._batch:
+            self._flush()
@@ -1,36 +1,179 @@
-from threading import Thread
-from queue import Queue
+import traceback
+from collections import deque
+from threading import Thread, Lock, BoundedSemaphore
+from queue import Queue, Full, Empty
 
 from waapi.client.interface import CallbackExecutor
 from waapi.wamp.async_compatibility import asyncio
+from waapi.wamp.interface import OverflowPolicy, QueueOverflowError
+
+
+def _executor_factory(callback_executor):
+    """
+    :param callback_executor: Executor class, or an executor instance to share between all the connections
+    :type callback_executor: type | CallbackExecutor
+    :return: Factory of the executor of each connection
+    :rtype: () -> CallbackExecutor
+    """
+    if isinstance(callback_executor, CallbackExecutor):
+        return lambda: callback_executor
+    return callback_executor
+
+
+def _run_callback(callback, kwargs):
+    try:
+        callback(**kwargs)
+    except Exception:
+        # Keep the thread alive for the other callbacks
+        traceback.print_exc()
 
 
 class PerCallbackThreadExecutor(CallbackExecutor):
     def execute(self, callback, kwargs):
         Thread(target=lambda: callback(**kwargs)).start()
 
-class SequentialThreadExecutor(CallbackExecutor):
+class PartitionedThreadExecutor(CallbackExecutor):
+    """
+    Runs callbacks on a fixed number of threads, each with its own queue. The events of a subscription always go to
+    the same thread: they run in order, while the events of other subscriptions may run in parallel on other threads.
+
+    The executor can be shared by several clients: it runs from the first start() until as many stop(), after which
+    the threads complete the callbacks already queued and exit.
+
+    With a queue_limit, the overflow policy applies when the queue of a thread is full: the client thread blocks until
+    a callback completes, the oldest or the new callback is dropped, or execute raises QueueOverflowError, which the
+    client logs.
+
+    Import as:
+      from waapi import PartitionedThreadExecutor
+    """
     class ThreadQueuePoison:
         pass
     poison = ThreadQueuePoison()
-    publish_queue = Queue()
 
-    @classmethod
-    def sequential_executor(cls):
-        while True:
-            publish = cls.publish_queue.get()
-            if publish is cls.poison:
-                break
-            publish()
+    def __init__(self, workers=4, queue_limit=0, overflow=OverflowPolicy.BLOCK):
+        """
+        :param workers: Number of threads
+        :type workers: int
+        :param queue_limit: Maximum number of callbacks waiting for each thread, 0 for no limit
+        :type queue_limit: int
+        :param overflow: Behavior when a callback is executed while the queue of its thread is full
+        :type overflow: OverflowPolicy | str
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.overflow = OverflowPolicy(overflow)
+        self.dropped = 0
+        self.rejected = 0
+        self._queues = [Queue(queue_limit) for _ in range(workers)]
+        self._lock = Lock()
+        self._users = 0
+        self._threads = []
+        """:type: list[Thread]"""
 
     def start(self):
-        Thread(target=SequentialThreadExecutor.sequential_executor).start()
+        with self._lock:
+            self._users += 1
+            if self._users > 1:
+                return
+            self._threads = [Thread(target=self.sequential_executor, args=(queue,)) for queue in self._queues]
+            threads = self._threads
+        for thread in threads:
+            thread.start()
 
     def stop(self):
-        SequentialThreadExecutor.publish_queue.put(SequentialThreadExecutor.poison)
+        with self._lock:
+            if self._users == 0:
+                return
+            self._users -= 1
+            if self._users > 0:
+                return
+        for queue in self._queues:
+            queue.put(self.poison)
+
+    def join(self, timeout=None):
+        """
+        Wait for the threads to complete the callbacks queued before the last stop()
+
+        :param timeout: Maximum number of seconds to wait for each thread, None to wait indefinitely
+        :type timeout: float | None
+        """
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(timeout)
+
+    def sequential_executor(self, queue):
+        """
+        Run the callbacks of a queue in order until poisoned
+
+        :type queue: Queue
+        """
+        while True:
+            publish = queue.get()
+            if publish is self.poison:
+                break
+            callback, kwargs = publish
+            _run_callback(callback, kwargs)
+
+    def statistics(self):
+        """
+        :return: Number of callbacks waiting for a thread, and numbers of callbacks dropped or rejected by a full queue
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "queued": sum(queue.qsize() for queue in self._queues),
+                "dropped": self.dropped,
+                "rejected": self.rejected
+            }
 
     def execute(self, callback, kwargs):
-        self.publish_queue.put(lambda: callback(**kwargs))
+        # The callback identifies the subscription: its event handler is bound to a single subscription
+        queue = self._queues[hash(callback) % self.workers] if self.workers > 1 else self._queues[0]
+        if self.overflow is OverflowPolicy.BLOCK:
+            queue.put((callback, kwargs))
+            return
+
+        with self._lock:
+            while True:
+                try:
+                    queue.put_nowait((callback, kwargs))
+                    return
+                except Full:
+                    pass
+
+                if self.overflow is OverflowPolicy.RAISE:
+                    self.rejected += 1
+                    raise QueueOverflowError("The callback queue is full")
+
+                if self.overflow is OverflowPolicy.DROP_OLDEST:
+                    try:
+                        oldest = queue.get_nowait()
+                    except Empty:
+                        continue  # Emptied by the thread meanwhile
+                    if oldest is not self.poison:
+                        self.dropped += 1
+                        continue
+                    queue.put_nowait(oldest)  # Stopping: keep the poison
+                self.dropped += 1
+                return
+
+class SequentialThreadExecutor(PartitionedThreadExecutor):
+    """
+    Runs all callbacks in order on a single thread, owned by the executor instance
+    """
+    def __init__(self, queue_limit=0, overflow=OverflowPolicy.BLOCK):
+        """
+        :param queue_limit: Maximum number of callbacks waiting for the thread, 0 for no limit
+        :type queue_limit: int
+        :param overflow: Behavior when a callback is executed while the queue is full
+        :type overflow: OverflowPolicy | str
+        """
+        super(SequentialThreadExecutor, self).__init__(workers=1, queue_limit=queue_limit, overflow=overflow)
 
 class AsyncioLoopExecutor(CallbackExecutor):
     def execute(self, callback, kwargs):
@@ -48,3 +191,193 @@ class AsyncioLoopExecutor(CallbackExecutor):
                 _async_request(callback, handler_future),
                 asyncio.get_event_loop()
             )
+
+class ThreadPoolCallbackExecutor(CallbackExecutor):
+    """
+    Runs callbacks on a bounded pool of worker threads, instead of a new thread per callback.
+
+    With ordered=True, the events of each subscription are delivered in order, one at a time, while the events of
+    different subscriptions run in parallel.
+
+    With a queue_limit, the overflow policy applies when the limit is reached: the client thread blocks until a
+    callback completes, the oldest queued or the new callback is dropped, or execute raises QueueOverflowError, which
+    the client logs. When every slot is taken by running callbacks, or by callbacks waiting for the previous callback
+    of their subscription, DROP_OLDEST drops the new callback instead.
+
+    The executor can be shared by several clients: it runs from the first start() until as many stop(), after which
+    the workers complete the callbacks already queued and exit.
+
+    Import as:
+      from waapi import ThreadPoolCallbackExecutor
+    """
+    class _Poison:
+        pass
+    _poison = _Poison()
+
+    def __init__(self, max_workers=4, queue_limit=0, ordered=False, overflow=OverflowPolicy.BLOCK):
+        """
+        :param max_workers: Number of worker threads
+        :type max_workers: int
+        :param queue_limit: Maximum number of callbacks queued or running, 0 for no limit. When the limit is reached
+                            with the BLOCK policy, the client thread waits for a callback to complete before receiving
+                            any other message: callbacks must then not wait for requests of the same client.
+        :type queue_limit: int
+        :param ordered: True to run the callbacks of each subscription in order, one at a time
+        :type ordered: bool
+        :param overflow: Behavior when a callback is executed while queue_limit callbacks are queued or running
+        :type overflow: OverflowPolicy | str
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.ordered = ordered
+        self.overflow = OverflowPolicy(overflow)
+        self.dropped = 0
+        self.rejected = 0
+
+        self._queue = Queue()
+        self._slots = BoundedSemaphore(queue_limit) if queue_limit else None
+        self._lock = Lock()
+        self._users = 0
+        self._workers = []
+        """:type: list[Thread]"""
+
+        # Callbacks waiting for the previous callback of the same subscription, for ordered execution
+        self._ordered_pending = {}
+        """:type: dict[callable, deque[(callable, dict)]]"""
+
+    def start(self):
+        with self._lock:
+            self._users += 1
+            if self._users > 1:
+                return
+            self._workers = [Thread(target=self._work, daemon=True) for _ in range(self.max_workers)]
+            workers = self._workers
+        for worker in workers:
+            worker.start()
+
+    def stop(self):
+        with self._lock:
+            if self._users == 0:
+                return
+            self._users -= 1
+            if self._users > 0:
+                return
+        for _ in range(self.max_workers):
+            self._queue.put(self._poison)
+
+    def join(self, timeout=None):
+        """
+        Wait for the workers to complete the callbacks queued before the last stop()
+
+        :param timeout: Maximum number of seconds to wait for each worker, None to wait indefinitely
+        :type timeout: float | None
+        """
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            worker.join(timeout)
+
+    def statistics(self):
+        """
+        :return: Number of callbacks waiting for a worker, and numbers of callbacks dropped or rejected by the full
+                 queue
+        :rtype: dict
+        """
+        with self._lock:
+            queued = self._queue.qsize() + sum(len(pending) for pending in self._ordered_pending.values())
+            return {"queued": queued, "dropped": self.dropped, "rejected": self.rejected}
+
+    def execute(self, callback, kwargs):
+        if self._slots is not None and not self._acquire_slot():
+            return
+
+        if self.ordered:
+            with self._lock:
+                pending = self._ordered_pending.get(callback)
+                if pending is not None:
+                    # The worker running the previous callback of the subscription runs this one next
+                    pending.append((callback, kwargs))
+                    return
+                self._ordered_pending[callback] = deque()
+
+        self._queue.put((callback, kwargs))
+
+    def _acquire_slot(self):
+        """
+        Take a slot for a new callback according to the overflow policy
+
+        :return: False if the new callback is dropped
+        :rtype: bool
+        :raises: QueueOverflowError
+        """
+        if self.overflow is OverflowPolicy.BLOCK:
+            self._slots.acquire()
+            return True
+
+        while not self._slots.acquire(blocking=False):
+            if self.overflow is OverflowPolicy.RAISE:
+                with self._lock:
+                    self.rejected += 1
+                raise QueueOverflowError("The callback queue is full")
+
+            if self.overflow is OverflowPolicy.DROP_NEWEST or not self._drop_oldest():
+                with self._lock:
+                    self.dropped += 1
+                return False
+        return True
+
+    def _drop_oldest(self):
+        """
+        Drop the oldest callback waiting for a worker, releasing its slot
+
+        :return: False if no callback is waiting for a worker
+        :rtype: bool
+        """
+        with self._lock:
+            try:
+                task = self._queue.get_nowait()
+            except Empty:
+                return False
+            if task is self._poison:
+                self._queue.put(task)
+                return False
+
+            callback, _ = task
+            if self.ordered:
+                # The next callback of the subscription takes the place of the dropped one
+                pending = self._ordered_pending[callback]
+                if pending:
+                    self._queue.put(pending.popleft())
+                else:
+                    del self._ordered_pending[callback]
+            self.dropped += 1
+        self._slots.release()
+        return True
+
+    def _work(self):
+        while True:
+            task = self._queue.get()
+            if task is self._poison:
+                break
+
+            callback, kwargs = task
+            while True:
+                self._run(callback, kwargs)
+                if not self.ordered:
+                    break
+                with self._lock:
+                    pending = self._ordered_pending[callback]
+                    if not pending:
+                        del self._ordered_pending[callback]
+                        break
+                    callback, kwargs = pending.popleft()
+
+    def _run(self, callback, kwargs):
+        try:
+            _run_callback(callback, kwargs)
+        finally:
+            if self._slots is not None:
+                self._slots.release()
@@ -31,3 +31,30 @@ class CallbackExecutor:
         :type callback: () -> Any
         """
         raise NotImplementedError()
+
+class ForwardingExecutor(CallbackExecutor):
+    """
+    Executor of a subscription that runs on the client thread and forwards callbacks to the executor of the connection,
+    e.g. to apply a delivery policy before any callback is queued.
+    The target and metrics are set by the connection whenever the subscription is made.
+    """
+    def __init__(self):
+        self.target = None
+        """:type: CallbackExecutor"""
+        self.metrics = None
+        """:type: ClientMetrics | None"""
+
+    def forward(self, callback, kwargs):
+        """
+        Hand a callback to the executor of the connection
+        """
+        if self.metrics is not None:
+            callback = self.metrics._wrap_callback(callback)
+        self.target.execute(callback, kwargs)
+
+    def flush(self):
+        """
+        Forward the callbacks held back by the delivery policy, on the client thread.
+        Called once the subscription is unsubscribed, and when the connection closes.
+        """
+        pass
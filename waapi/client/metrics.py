@@ -0,0 +1,286 @@
+import bisect
+import time
+from copy import copy
+from threading import Lock
+
+
+# Upper bounds in milliseconds of the buckets of the latency histograms, the last bucket is unbounded
+DEFAULT_LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1., 2.5, 5., 10., 25., 50., 100., 250., 500., 1000., 2500., 5000., 10000.)
+
+
+class LatencyHistogram:
+    """
+    Counts of durations in fixed buckets, not thread-safe
+    """
+    def __init__(self, buckets_ms=DEFAULT_LATENCY_BUCKETS_MS):
+        """
+        :param buckets_ms: Upper bounds of the buckets in milliseconds, in ascending order
+        :type buckets_ms: tuple[float]
+        """
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.sum_ms = 0.
+        self.max_ms = 0.
+
+    def add(self, duration):
+        """
+        :param duration: Duration in seconds
+        :type duration: float
+        """
+        duration_ms = duration * 1000.
+        self.counts[bisect.bisect_left(self.buckets_ms, duration_ms)] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def percentile(self, percent):
+        """
+        :type percent: float
+        :return: Upper bound in milliseconds of the bucket holding the percentile, the maximum for the last bucket
+        :rtype: float
+        """
+        if not self.count:
+            return 0.
+        rank = percent / 100. * self.count
+        cumulated = 0
+        for index, count in enumerate(self.counts):
+            cumulated += count
+            if cumulated >= rank and count:
+                return min(self.buckets_ms[index], self.max_ms) if index < len(self.buckets_ms) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self):
+        """
+        :rtype: dict
+        """
+        return {
+            "count": self.count,
+            "sum_ms": self.sum_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "buckets_ms": list(self.buckets_ms),
+            "counts": list(self.counts)
+        }
+
+
+class ClientMetrics:
+    """
+    Timings and counters of the requests of a WaapiClient, opt-in with WaapiClient(metrics=...)
+
+    Each request is timed from the moment it is submitted by the caller:
+      - queued: waiting to be sent, in the request queue or for an in-flight slot
+      - wire: sent and awaiting the reply of the server
+      - total: until the result is available to the caller, kept per URI as a latency histogram
+    Event callbacks are timed while waiting for the callback executor.
+
+    The sink, if any, is called with a dictionary describing each completed request, on the client thread: it must
+    return quickly, e.g. by forwarding the record to a queue or a metrics library.
+
+    Without metrics, the client does not measure anything.
+
+    Import as:
+      from waapi import ClientMetrics
+    """
+    def __init__(self, sink=None, buckets_ms=DEFAULT_LATENCY_BUCKETS_MS):
+        """
+        :param sink: Called with a dict of the uri, type, queued_ms, wire_ms, total_ms and error of each completed
+                     request. The error is None or one of "failed", "lost" or "cancelled".
+        :type sink: (dict) -> None | None
+        :param buckets_ms: Upper bounds of the buckets of the latency histograms in milliseconds, in ascending order
+        :type buckets_ms: tuple[float]
+        """
+        self.sink = sink
+        self.buckets_ms = tuple(buckets_ms)
+
+        self._lock = Lock()
+        self._uris = {}
+        """:type: dict[str, dict]"""
+        self._queued = LatencyHistogram(self.buckets_ms)
+        self._wire = LatencyHistogram(self.buckets_ms)
+        self._executor_wait = LatencyHistogram(self.buckets_ms)
+        self._errors = {"failed": 0, "lost": 0, "cancelled": 0, "timeouts": 0}
+
+        self._in_flight = 0
+        self._executor_backlog = 0
+        self._bytes_sent = 0
+        self._bytes_received = 0
+        self._messages_sent = 0
+        self._messages_received = 0
+
+    def snapshot(self, queue_depth=0):
+        """
+        :param queue_depth: Number of requests in the request queue of the connection
+        :type queue_depth: int
+        :return: Per URI counts, errors and latency histograms, histograms of the queued, wire and callback executor
+                 wait times, current queue depth, in-flight requests and callback executor backlog, bytes and messages
+                 sent and received, and error counts
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "uris": {
+                    _uri: {
+                        "count": entry["count"],
+                        "errors": entry["errors"],
+                        "latency": entry["latency"].snapshot()
+                    }
+                    for _uri, entry in self._uris.items()
+                },
+                "queued": self._queued.snapshot(),
+                "wire": self._wire.snapshot(),
+                "executor_wait": self._executor_wait.snapshot(),
+                "queue_depth": queue_depth,
+                "in_flight": self._in_flight,
+                "executor_backlog": self._executor_backlog,
+                "bytes_sent": self._bytes_sent,
+                "bytes_received": self._bytes_received,
+                "messages_sent": self._messages_sent,
+                "messages_received": self._messages_received,
+                "errors": dict(self._errors)
+            }
+
+    def reset(self):
+        """
+        Reset the histograms and the counters, except the current queue depth, in-flight and backlog counts
+        """
+        with self._lock:
+            self._uris.clear()
+            self._queued = LatencyHistogram(self.buckets_ms)
+            self._wire = LatencyHistogram(self.buckets_ms)
+            self._executor_wait = LatencyHistogram(self.buckets_ms)
+            self._errors = dict.fromkeys(self._errors, 0)
+            self._bytes_sent = self._bytes_received = 0
+            self._messages_sent = self._messages_received = 0
+
+    def _record_request(self, request, sent, replied, error):
+        """
+        Record a request completed by the client thread
+
+        :type request: WampRequest
+        :param sent: Time when the request was sent, None if it was not
+        :type sent: float | None
+        :param replied: Time when the request completed
+        :type replied: float
+        :param error: None, "failed", "lost" or "cancelled"
+        :type error: str | None
+        """
+        submitted = request.submitted
+        queued = (sent if sent is not None else replied) - submitted
+        wire = replied - sent if sent is not None else 0.
+        _uri = request.uri or request.request_type.name.lower()
+
+        with self._lock:
+            entry = self._uris.get(_uri)
+            if entry is None:
+                entry = self._uris[_uri] = {"count": 0, "errors": 0, "latency": LatencyHistogram(self.buckets_ms)}
+            entry["count"] += 1
+            entry["latency"].add(replied - submitted)
+            self._queued.add(queued)
+            if sent is not None:
+                self._wire.add(wire)
+            if error is not None:
+                entry["errors"] += 1
+                self._errors[error] += 1
+
+        if self.sink is not None:
+            self.sink({
+                "uri": _uri,
+                "type": request.request_type.name.lower(),
+                "queued_ms": queued * 1000.,
+                "wire_ms": wire * 1000.,
+                "total_ms": (replied - submitted) * 1000.,
+                "error": error
+            })
+
+    def _record_timeout(self):
+        with self._lock:
+            self._errors["timeouts"] += 1
+
+    def _add_in_flight(self, count):
+        with self._lock:
+            self._in_flight += count
+
+    def _wrap_callback(self, callback):
+        """
+        :return: Callback recording the time it waited for the callback executor
+        :rtype: _MeteredCallback
+        """
+        with self._lock:
+            self._executor_backlog += 1
+        return _MeteredCallback(callback, self, time.perf_counter())
+
+    def _callback_started(self, scheduled):
+        waited = time.perf_counter() - scheduled
+        with self._lock:
+            self._executor_backlog -= 1
+            self._executor_wait.add(waited)
+
+    def _add_sent(self, size):
+        with self._lock:
+            self._bytes_sent += size
+            self._messages_sent += 1
+
+    def _add_received(self, size):
+        with self._lock:
+            self._bytes_received += size
+            self._messages_received += 1
+
+
+class _MeteredCallback:
+    """
+    Callback recording the time it waited for the callback executor.
+    Equal to the callback it wraps, so that executors ordering the callbacks of each subscription still recognize it.
+    """
+    __slots__ = ("callback", "_metrics", "_scheduled")
+
+    def __init__(self, callback, metrics, scheduled):
+        """
+        :type callback: callable
+        :type metrics: ClientMetrics
+        :param scheduled: Time when the callback was given to the executor
+        :type scheduled: float
+        """
+        self.callback = callback
+        self._metrics = metrics
+        self._scheduled = scheduled
+
+    def __call__(self, **kwargs):
+        self._metrics._callback_started(self._scheduled)
+        return self.callback(**kwargs)
+
+    def __hash__(self):
+        return hash(self.callback)
+
+    def __eq__(self, other):
+        return self.callback == (other.callback if isinstance(other, _MeteredCallback) else other)
+
+
+class _MeteredSerializer:
+    """
+    WAMP serializer counting the bytes sent and received through another serializer
+    """
+    def __init__(self, serializer, metrics):
+        """
+        :type serializer: ISerializer
+        :type metrics: ClientMetrics
+        """
+        self._serializer = serializer
+        self._metrics = metrics
+        self.SERIALIZER_ID = serializer.SERIALIZER_ID
+        self.MIME_TYPE = serializer.MIME_TYPE
+
+    def __copy__(self):
+        # autobahn copies the serializer for each connection, which must not share the state of the one wrapped
+        return _MeteredSerializer(copy(self._serializer), self._metrics)
+
+    def serialize(self, msg):
+        payload, is_binary = self._serializer.serialize(msg)
+        self._metrics._add_sent(len(payload))
+        return payload, is_binary
+
+    def unserialize(self, payload, isBinary=None):
+        self._metrics._add_received(len(payload))
+        return self._serializer.unserialize(payload, isBinary)
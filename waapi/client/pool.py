@@ -0,0 +1,306 @@
+import weakref
+from enum import Enum
+from threading import Thread, Event, Lock, current_thread
+
+from waapi.client.client import WaapiClient
+from waapi.client.executor import SequentialThreadExecutor
+from waapi.wamp.interface import CannotConnectToWaapiException, DEFAULT_MAX_IN_FLIGHT
+
+
+class PoolStrategy(Enum):
+    ROUND_ROBIN = 0
+    LEAST_OUTSTANDING = 1
+
+
+class _PoolMember:
+    """
+    Connection of a pool with the count of its requests awaiting a reply
+    """
+    def __init__(self, client):
+        """
+        :type client: WaapiClient
+        """
+        self.client = client
+        self.outstanding = 0
+
+
+class WaapiClientPool:
+    """
+    Pool of WaapiClient connections to the same Waapi server, spreading calls across connections.
+
+    Calls are dispatched to a member connection according to the pool strategy.
+    A subscription is pinned to a single member connection, so its events are received only once: the EventHandler
+    returned by subscribe unsubscribes from that member.
+    Members that get disconnected are replaced in the background, their subscriptions are not restored.
+
+    The lifetime of the connections is the lifetime of the instance, as for WaapiClient.
+
+    Import as:
+      from waapi import WaapiClientPool
+    """
+    def __init__(self,
+        url=None,
+        size=4,
+        strategy=PoolStrategy.LEAST_OUTSTANDING,
+        allow_exception=False,
+        callback_executor=SequentialThreadExecutor,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        serializers=None,
+        health_check_interval=1.0,
+        runtime=None
+        ):
+        """
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to ws://127.0.0.1:8080/waapi
+        :type: str
+        :param size: Number of connections
+        :type size: int
+        :param strategy: Strategy choosing the connection of a call
+        :type strategy: PoolStrategy
+        :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+        :type allow_exception: bool
+        :param callback_executor: Executor strategy for event callbacks of each connection, an instance is shared by
+                                  all the connections
+        :type callback_executor: type | CallbackExecutor
+        :param max_in_flight: Maximum number of requests awaiting a reply at the same time, per connection
+        :type max_in_flight: int
+        :param serializers: Serializers to offer to the server in order of preference, see WaapiClient
+        :type serializers: list[str | ISerializer] | None
+        :param health_check_interval: Interval in seconds between checks for disconnected members to replace
+        :type health_check_interval: float
+        :param runtime: Runtime hosting the connections on its shared thread, None for a thread per connection
+        :type runtime: WaapiRuntime | None
+        :raises: CannotConnectToWaapiException
+        """
+        if size < 1:
+            raise ValueError("A pool needs at least one connection")
+
+        self._client_kwargs = {
+            "url": url,
+            "allow_exception": allow_exception,
+            "callback_executor": callback_executor,
+            "max_in_flight": max_in_flight,
+            "serializers": serializers,
+            "runtime": runtime
+        }
+        self._strategy = strategy
+        self._next_index = 0
+        self._lock = Lock()
+
+        self._members = []
+        """:type: list[_PoolMember]"""
+        try:
+            for _ in range(size):
+                self._members.append(_PoolMember(WaapiClient(**self._client_kwargs)))
+        except CannotConnectToWaapiException:
+            for member in self._members:
+                member.client.disconnect()
+            raise
+
+        self._health_check_interval = health_check_interval
+        self._stop_event = Event()
+        # The thread only holds a weak reference to the pool, which is disconnected once no longer referenced
+        self._health_thread = Thread(
+            target=WaapiClientPool._check_health,
+            args=(weakref.ref(self), self._stop_event, health_check_interval),
+            daemon=True
+        )
+        self._health_thread.start()
+
+    @property
+    def size(self):
+        return len(self._members)
+
+    def disconnect(self):
+        """
+        Gracefully disconnect all the connections of the pool.
+
+        :return: True if the call caused a successful disconnection, False otherwise.
+        :rtype: bool
+        """
+        if self._stop_event.is_set():
+            return False
+
+        self._stop_event.set()
+        if self._health_thread is not current_thread():  # The last reference may be released by the health check
+            self._health_thread.join()
+        with self._lock:
+            members = list(self._members)
+        for member in members:
+            member.client.disconnect()
+        return True
+
+    def is_connected(self):
+        """
+        :return: True if at least one connection of the pool is connected, False otherwise.
+        :rtype: bool
+        """
+        return not self._stop_event.is_set() and any(member.client.is_connected() for member in self._members)
+
+    def call(self, _uri, *args, **kwargs):
+        """
+        Do a Remote Procedure Call (RPC) on one of the connections, see WaapiClient.call
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :return: Result from the remote procedure call, None if failed.
+        :rtype: dict | None
+        :raises: WaapiRequestFailed
+        """
+        member = self.__acquire()
+        if member is None:
+            return
+        try:
+            return member.client.call(_uri, *args, **kwargs)
+        finally:
+            self.__release(member)
+
+    def call_async(self, _uri, *args, **kwargs):
+        """
+        Do a Remote Procedure Call (RPC) on one of the connections without waiting, see WaapiClient.call_async
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :return: Future to the result from the remote procedure call, which is None if failed.
+        :rtype: concurrent.futures.Future
+        """
+        member = self.__acquire()
+        if member is None:
+            member = self._members[0]  # Completes immediately with None, as any disconnected client
+            return member.client.call_async(_uri, *args, **kwargs)
+
+        future = member.client.call_async(_uri, *args, **kwargs)
+        future.add_done_callback(lambda _: self.__release(member))
+        return future
+
+    def call_many(self, calls, stop_on_error=False):
+        """
+        Do a batch of Remote Procedure Calls (RPC) on one of the connections, see WaapiClient.call_many
+
+        :type calls: list[(str, dict) | str]
+        :type stop_on_error: bool
+        :rtype: list[dict | WaapiRequestFailed | None]
+        :raises: WaapiRequestFailed
+        """
+        member = self.__acquire()
+        if member is None:
+            return [None] * len(calls)
+        try:
+            return member.client.call_many(calls, stop_on_error)
+        finally:
+            self.__release(member)
+
+    def subscribe(self, _uri, callback_or_handler=None, *args, **kwargs):
+        """
+        Subscribe to a topic on the connection with the fewest subscriptions, see WaapiClient.subscribe
+
+        :param _uri: URI of the topic to subscribe to
+        :type _uri: str
+        :type callback_or_handler: callable | EventHandler
+        :rtype: EventHandler | None
+        :raises: WaapiRequestFailed
+        """
+        with self._lock:
+            connected = [member for member in self._members if member.client.is_connected()]
+        if not connected:
+            return
+
+        member = min(connected, key=lambda candidate: len(candidate.client.subscriptions()))
+        return member.client.subscribe(_uri, callback_or_handler, *args, **kwargs)
+
+    def unsubscribe(self, event_handler):
+        """
+        Unsubscribe from a topic managed by the passed EventHandler instance.
+
+        :type event_handler: EventHandler
+        :return: True if successfully unsubscribed, False otherwise.
+        :rtype: bool
+        """
+        with self._lock:
+            members = list(self._members)
+        for member in members:
+            if event_handler in member.client.subscriptions():
+                return member.client.unsubscribe(event_handler)
+        return False
+
+    def subscriptions(self):
+        """
+        :return: The set of subscriptions of all the connections of the pool.
+        :rtype: set[EventHandler]
+        """
+        with self._lock:
+            members = list(self._members)
+        subscriptions = set()
+        for member in members:
+            subscriptions.update(member.client.subscriptions())
+        return subscriptions
+
+    def __acquire(self):
+        """
+        Choose a connected member according to the strategy and count the request as outstanding on it
+
+        :return: The member, None if no member is connected
+        :rtype: _PoolMember | None
+        """
+        with self._lock:
+            count = len(self._members)
+            # Rotate the starting member so that ties are spread across the pool
+            start = self._next_index
+            self._next_index = (self._next_index + 1) % count
+            candidates = [self._members[(start + offset) % count] for offset in range(count)]
+            candidates = [member for member in candidates if member.client.is_connected()]
+            if not candidates:
+                return None
+
+            if self._strategy == PoolStrategy.LEAST_OUTSTANDING:
+                member = min(candidates, key=lambda candidate: candidate.outstanding)
+            else:
+                member = candidates[0]
+            member.outstanding += 1
+            return member
+
+    def __release(self, member):
+        with self._lock:
+            member.outstanding -= 1
+
+    @staticmethod
+    def _check_health(pool_ref, stop_event, interval):
+        """
+        :param pool_ref: Weak reference to the pool
+        :type pool_ref: weakref.ref
+        :type stop_event: Event
+        :param interval: Seconds between checks
+        :type interval: float
+        """
+        while not stop_event.wait(interval):
+            pool = pool_ref()
+            if pool is None:
+                return
+            pool.__replace_disconnected_members()
+            del pool
+
+    def __replace_disconnected_members(self):
+        for index, member in enumerate(list(self._members)):
+            if member.client.is_connected():
+                continue
+            try:
+                replacement = _PoolMember(WaapiClient(**self._client_kwargs))
+            except CannotConnectToWaapiException:
+                continue  # Retry on next check
+
+            with self._lock:
+                stopping = self._stop_event.is_set()
+                if not stopping:
+                    self._members[index] = replacement
+            if stopping:
+                replacement.client.disconnect()
+                return
+
+    def __del__(self):
+        if hasattr(self, "_health_thread"):
+            self.disconnect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
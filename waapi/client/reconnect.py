@@ -0,0 +1,57 @@
+import random
+
+
+class ReconnectPolicy:
+    """
+    Policy of a WaapiClient to automatically reconnect when the connection is lost, e.g. when Wwise restarts.
+
+    Attempts are spaced by an exponential backoff: the first attempt waits initial_delay, then each failed attempt
+    multiplies the delay by multiplier, up to max_delay. A random jitter is applied to avoid many clients
+    reconnecting in lockstep.
+
+    Calls made while the connection is lost are queued and sent once reconnected, up to max_queued_calls.
+    Beyond this bound, or with max_queued_calls=0, calls fail fast with a None result.
+
+    Import as:
+      from waapi import ReconnectPolicy
+    """
+    def __init__(self,
+        initial_delay=0.5,
+        max_delay=30.0,
+        multiplier=2.0,
+        jitter=0.1,
+        max_attempts=None,
+        max_queued_calls=100
+        ):
+        """
+        :param initial_delay: Delay in seconds before the first reconnection attempt
+        :type initial_delay: float
+        :param max_delay: Maximum delay in seconds between two attempts
+        :type max_delay: float
+        :param multiplier: Factor applied to the delay after each failed attempt
+        :type multiplier: float
+        :param jitter: Fraction of the delay randomly added or removed from each delay
+        :type jitter: float
+        :param max_attempts: Number of attempts before giving up, None to never give up
+        :type max_attempts: int | None
+        :param max_queued_calls: Maximum number of calls queued while disconnected, 0 to fail fast
+        :type max_queued_calls: int
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self.max_queued_calls = max_queued_calls
+
+    def delays(self):
+        """
+        :return: Generator of the delays before each reconnection attempt, exhausted when giving up
+        :rtype: collections.abc.Iterator[float]
+        """
+        delay = self.initial_delay
+        attempt = 0
+        while self.max_attempts is None or attempt < self.max_attempts:
+            attempt += 1
+            yield max(0.0, delay * (1.0 + random.uniform(-self.jitter, self.jitter)))
+            delay = min(delay * self.multiplier, self.max_delay)
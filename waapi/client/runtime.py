@@ -0,0 +1,101 @@
+from sys import platform
+from threading import Thread, Event, Lock
+
+from waapi.wamp.async_compatibility import asyncio
+
+
+def _new_event_loop():
+    """
+    :rtype: asyncio.AbstractEventLoop
+    """
+    if platform == 'win32':
+        #  Prefer the ProactorEventLoop event loop on Windows
+        return asyncio.ProactorEventLoop()
+    return asyncio.new_event_loop()
+
+
+class WaapiRuntime:
+    """
+    Background thread running a single asyncio loop that hosts the connections of many clients, instead of a thread
+    and a loop per client, e.g. for a process keeping connections to many Wwise instances:
+      runtime = WaapiRuntime()
+      clients = [WaapiClient(url, runtime=runtime) for url in urls]
+
+    Clients attached to a runtime never touch the event loop of their caller.
+    The runtime starts with its first client, and runs until stop() is called, once its clients are disconnected.
+
+    Import as:
+      from waapi import WaapiRuntime
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self._loop = None
+        """:type: asyncio.AbstractEventLoop"""
+        self._thread = None
+        """:type: Thread"""
+
+    @property
+    def loop(self):
+        """
+        :return: Loop of the runtime, None until started
+        :rtype: asyncio.AbstractEventLoop | None
+        """
+        return self._loop
+
+    def is_running(self):
+        """
+        :rtype: bool
+        """
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Start the thread of the runtime, if not running
+
+        :return: self
+        :rtype: WaapiRuntime
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._loop = _new_event_loop()
+            started = Event()
+            self._thread = Thread(target=self._run, args=(self._loop, started), name="WaapiRuntime")
+            self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self):
+        """
+        Stop the loop and wait for the thread of the runtime to terminate.
+        Connections still open are closed without notice to the server.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        thread.join()
+
+    @staticmethod
+    def _run(loop, started):
+        """
+        :type loop: asyncio.AbstractEventLoop
+        :type started: Event
+        """
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        loop.run_forever()
+
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
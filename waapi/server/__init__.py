@@ -0,0 +1 @@
+from waapi.server.fake_server import *
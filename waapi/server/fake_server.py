@@ -0,0 +1,643 @@
+"""
+In-memory stand-in for the Wwise Authoring API server, to test and benchmark the client without Wwise.
+
+Implements the WAMP messages used by the client (no router), and a subset of WAAPI over an in-memory object tree:
+ak.wwise.core.getInfo, ak.wwise.core.object.get/create/delete/setProperty/setName/setNotes and
+ak.wwise.waapi.getSchema, with the matching ak.wwise.core.object topics. More procedures can be scripted with
+FakeWaapiServer.register.
+"""
+import itertools
+import uuid
+import concurrent.futures
+from threading import Thread, Event
+
+from autobahn.asyncio.websocket import WebSocketServerProtocol, WebSocketServerFactory
+from autobahn.wamp import message
+from autobahn.wamp.serializer import JsonObjectSerializer
+
+from waapi.wamp.async_compatibility import asyncio
+
+FAKE_PAYLOAD_URI = "ak.wwise.fake.payload"
+FAKE_TICK_TOPIC = "ak.wwise.fake.tick"
+
+
+def _object_serializers():
+    """
+    :return: Object serializer classes by WebSocket subprotocol, for the serializers whose package is installed
+    :rtype: dict[str, type]
+    """
+    from autobahn.wamp import serializer as wamp_serializer
+
+    serializers = {"wamp.2.json": JsonObjectSerializer}
+    for name, class_name in (("msgpack", "MsgPackObjectSerializer"), ("cbor", "CBORObjectSerializer"),
+                             ("ubjson", "UBJSONObjectSerializer")):
+        serializer_class = getattr(wamp_serializer, class_name, None)
+        if serializer_class is not None:
+            serializers["wamp.2." + name] = serializer_class
+    return serializers
+
+
+class FakeWaapiError(Exception):
+    """
+    Raised by a procedure of the fake server to reply with a WAMP error
+    """
+    def __init__(self, error_uri, message, details=None):
+        """
+        :param error_uri: URI of the error, e.g. ak.wwise.invalid_object
+        :type error_uri: str
+        :type message: str
+        :type details: dict | None
+        """
+        super(FakeWaapiError, self).__init__(message)
+        self.error_uri = error_uri
+        self.kwargs = {"message": message}
+        if details is not None:
+            self.kwargs["details"] = details
+
+
+class FakeObject:
+    """
+    Object of the fake project
+    """
+    def __init__(self, name, type, parent=None):
+        """
+        :type name: str
+        :type type: str
+        :type parent: FakeObject | None
+        """
+        self.id = "{" + str(uuid.uuid4()).upper() + "}"
+        self.name = name
+        self.type = type
+        self.parent = parent
+        self.children = []
+        """:type: list[FakeObject]"""
+        self.properties = {}
+        self.notes = ""
+        if parent is not None:
+            parent.children.append(self)
+
+    @property
+    def path(self):
+        if self.parent is None:
+            return "\\"
+        return (self.parent.path if self.parent.parent is not None else "") + "\\" + self.name
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+    def ancestors(self):
+        parent = self.parent
+        while parent is not None:
+            yield parent
+            parent = parent.parent
+
+    def fields(self, returned=None):
+        """
+        :param returned: Names of the fields to return as with the "return" option, defaults to id and name
+        :type returned: list[str] | None
+        :rtype: dict
+        """
+        result = {}
+        for field in returned or ["id", "name"]:
+            if field == "id":
+                result[field] = self.id
+            elif field == "name":
+                result[field] = self.name
+            elif field == "type":
+                result[field] = self.type
+            elif field == "path":
+                result[field] = self.path
+            elif field == "notes":
+                result[field] = self.notes
+            elif field == "parent" and self.parent is not None:
+                result[field] = {"id": self.parent.id, "name": self.parent.name}
+            elif field == "childrenCount":
+                result[field] = len(self.children)
+            elif field == "classId":
+                result[field] = abs(hash(self.type)) % 0xFFFF
+            elif field == "isPlayable":
+                result[field] = self.type in ("Sound", "RandomSequenceContainer", "SwitchContainer", "BlendContainer")
+            elif field == "filePath":
+                result[field] = "/fake/WaapiClientPython.wproj" if self.type == "Project" else ""
+            elif field == "workunit:isDirty":
+                result[field] = False
+            elif field.startswith("@") and field[1:] in self.properties:
+                result[field] = self.properties[field[1:]]
+        return result
+
+
+class FakeProject:
+    """
+    In-memory object tree of the fake server
+    """
+    def __init__(self, name="WaapiClientPython"):
+        self.root = FakeObject(name, "Project")
+        self._objects = {self.root.id: self.root}
+        for folder in ("Actor-Mixer Hierarchy", "Events", "Game Parameters", "Master-Mixer Hierarchy", "Switches"):
+            self.add(FakeObject("Default Work Unit", "WorkUnit", self.add(FakeObject(folder, "Folder", self.root))))
+
+    def add(self, obj):
+        """
+        :type obj: FakeObject
+        :rtype: FakeObject
+        """
+        self._objects[obj.id] = obj
+        return obj
+
+    def remove(self, obj):
+        """
+        :type obj: FakeObject
+        """
+        for removed in [obj] + list(obj.descendants()):
+            self._objects.pop(removed.id, None)
+        obj.parent.children.remove(obj)
+
+    def objects(self):
+        return list(self._objects.values())
+
+    def find(self, reference):
+        """
+        :param reference: Id, path or "Type:Name" of an object
+        :type reference: str
+        :rtype: FakeObject | None
+        """
+        if reference.startswith("{"):
+            return self._objects.get(reference.upper())
+        if reference.startswith("\\"):
+            obj = self.root
+            for name in reference.strip("\\").split("\\"):
+                obj = next((child for child in obj.children if child.name == name), None)
+                if obj is None:
+                    return None
+            return obj
+        type, _, name = reference.partition(":")
+        return next((obj for obj in self._objects.values() if obj.type == type and obj.name == name), None)
+
+
+def _validate_arguments(kwargs, allowed, required=()):
+    unexpected = [key for key in kwargs if key not in allowed]
+    missing = [key for key in required if key not in kwargs]
+    if unexpected or missing:
+        raise FakeWaapiError(
+            "ak.wwise.schema_validation_failed",
+            "Invalid arguments: unexpected {}, missing {}".format(unexpected, missing),
+            {"typeUri": "ak.wwise.schema_validation_failed"}
+        )
+
+
+class _FakeWaapiProtocol(WebSocketServerProtocol):
+    def onConnect(self, request):
+        for protocol in request.protocols:
+            if protocol in self.factory.fake_server.serializers:
+                self._serializer = self.factory.fake_server.serializers[protocol]()
+                return protocol
+        raise Exception("No supported serializer among " + str(request.protocols))
+
+    def onOpen(self):
+        self.fake_server = self.factory.fake_server
+        self.fake_server._protocols.add(self)
+        self.subscriptions = set()
+
+    def onClose(self, wasClean, code, reason):
+        fake_server = getattr(self, "fake_server", None)
+        if fake_server is not None:
+            fake_server._protocols.discard(self)
+            for subscription_id in self.subscriptions:
+                fake_server._subscriptions.pop(subscription_id, None)
+
+    def send(self, msg):
+        self.sendMessage(self._serializer.serialize(msg), self._serializer.BINARY)
+
+    def onMessage(self, payload, isBinary):
+        for msg in self._serializer.unserialize(payload):
+            message_type = msg[0]
+            if message_type == message.Hello.MESSAGE_TYPE:
+                self.send([message.Welcome.MESSAGE_TYPE, next(self.fake_server._ids), {"roles": {"broker": {}, "dealer": {}}}])
+            elif message_type == message.Goodbye.MESSAGE_TYPE:
+                self.send([message.Goodbye.MESSAGE_TYPE, {}, "wamp.close.goodbye_and_out"])
+                self.sendClose()
+            elif message_type == message.Call.MESSAGE_TYPE:
+                asyncio.ensure_future(self.fake_server._handle_call(self, msg))
+            elif message_type == message.Subscribe.MESSAGE_TYPE:
+                self.fake_server._handle_subscribe(self, msg)
+            elif message_type == message.Unsubscribe.MESSAGE_TYPE:
+                self.fake_server._handle_unsubscribe(self, msg)
+
+
+class FakeWaapiServer:
+    """
+    Stand-in for the Wwise Authoring API server running on an asyncio loop in a background thread.
+
+    Knobs for performance measurements:
+      - latency: Seconds waited before replying to each call
+      - payload_size: Size in characters of the "payload" of FAKE_PAYLOAD_URI results and FAKE_TICK_TOPIC events
+      - event_rate: Events per second published on FAKE_TICK_TOPIC while running, 0 to only publish on demand
+
+    Use as a context manager:
+      with FakeWaapiServer(port=0) as server:
+          client = WaapiClient(server.url)
+
+    Import as:
+      from waapi.server import FakeWaapiServer
+    """
+    TOPICS = (
+        "ak.wwise.core.object.created",
+        "ak.wwise.core.object.nameChanged",
+        "ak.wwise.core.object.notesChanged",
+        "ak.wwise.core.object.propertyChanged",
+        "ak.wwise.core.object.preDeleted",
+        "ak.wwise.core.object.postDeleted",
+        "ak.wwise.core.object.childAdded",
+        "ak.wwise.core.object.childRemoved",
+        "ak.wwise.ui.selectionChanged",
+        FAKE_TICK_TOPIC
+    )
+
+    def __init__(self, host="127.0.0.1", port=8080, latency=0.0, payload_size=0, event_rate=0.0, serializers=None):
+        """
+        :param host: Interface to listen on
+        :type host: str
+        :param port: Port to listen on, 0 for any free port
+        :type port: int
+        :param latency: Seconds waited before replying to each call
+        :type latency: float
+        :param payload_size: Size of the payloads of FAKE_PAYLOAD_URI results and FAKE_TICK_TOPIC events
+        :type payload_size: int
+        :param event_rate: Events per second published on FAKE_TICK_TOPIC, 0 to disable
+        :type event_rate: float
+        :param serializers: Names of the serializers accepted ("json", "msgpack", "cbor" or "ubjson"), defaults to all
+                            the installed ones
+        :type serializers: list[str] | None
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.payload_size = payload_size
+        self.event_rate = event_rate
+        available = _object_serializers()
+        self.serializers = {
+            protocol: serializer for protocol, serializer in available.items()
+            if serializers is None or protocol[len("wamp.2."):] in serializers
+        }
+
+        self.project = FakeProject()
+        self.call_count = 0
+        self.max_concurrent_calls = 0
+        self.subscribe_count = 0
+        self._concurrent_calls = 0
+
+        self._procedures = {
+            "ak.wwise.core.getInfo": self._get_info,
+            "ak.wwise.core.object.get": self._object_get,
+            "ak.wwise.core.object.create": self._object_create,
+            "ak.wwise.core.object.delete": self._object_delete,
+            "ak.wwise.core.object.setProperty": self._object_set_property,
+            "ak.wwise.core.object.setName": self._object_set_name,
+            "ak.wwise.core.object.setNotes": self._object_set_notes,
+            "ak.wwise.waapi.getSchema": self._get_schema,
+            FAKE_PAYLOAD_URI: self._payload
+        }
+        self._subscriptions = {}
+        """:type: dict[int, (_FakeWaapiProtocol, str, dict)]"""
+        self._protocols = set()
+        self._ids = itertools.count(1)
+
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._tick_task = None
+
+    @property
+    def url(self):
+        return "ws://{}:{}/waapi".format(self.host, self.port)
+
+    def register(self, _uri, procedure):
+        """
+        Add or replace a procedure. Thread-safe.
+
+        :param _uri: URI of the procedure
+        :type _uri: str
+        :param procedure: Function of the arguments and options of a call returning its result, which may raise
+                          FakeWaapiError to reply with an error
+        :type procedure: (dict, dict) -> dict
+        """
+        self._procedures[_uri] = procedure
+
+    def publish(self, topic, kwargs):
+        """
+        Publish an event to the subscribers of a topic. Thread-safe.
+
+        :type topic: str
+        :param kwargs: Arguments of the event, or a function of the options of a subscription returning them
+        :type kwargs: dict | (dict) -> dict
+        """
+        self._loop.call_soon_threadsafe(self._publish, topic, kwargs)
+
+    def publish_burst(self, count, topic=FAKE_TICK_TOPIC):
+        """
+        Publish events as fast as possible. Thread-safe.
+
+        :param count: Number of events
+        :type count: int
+        :type topic: str
+        :return: Future completed once all the events are sent
+        :rtype: concurrent.futures.Future
+        """
+        async def burst():
+            for index in range(count):
+                self._publish(topic, {"index": index, "payload": "x" * self.payload_size})
+                if index % 100 == 99:
+                    await asyncio.sleep(0)  # Let the transport flush
+        return asyncio.run_coroutine_threadsafe(burst(), self._loop)
+
+    def start(self):
+        """
+        Start listening in a background thread
+
+        :return: self
+        :rtype: FakeWaapiServer
+        """
+        started = Event()
+        errors = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                factory = WebSocketServerFactory()
+                factory.protocol = _FakeWaapiProtocol
+                factory.fake_server = self
+                self._server = self._loop.run_until_complete(self._loop.create_server(factory, self.host, self.port))
+            except Exception as e:
+                errors.append(e)
+                self._loop.close()
+                started.set()
+                return
+
+            self.port = self._server.sockets[0].getsockname()[1]
+            if self.event_rate:
+                self._tick_task = self._loop.create_task(self._tick())
+            started.set()
+            self._loop.run_forever()
+
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.close()
+
+        self._thread = Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            self._thread.join()
+            self._thread = None
+            raise errors[0]
+        return self
+
+    def stop(self):
+        """
+        Close all the connections and stop listening
+        """
+        if self._thread is None:
+            return
+
+        async def close():
+            self._server.close()
+            for protocol in list(self._protocols):
+                protocol.dropConnection(abort=True)
+            await self._server.wait_closed()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close(), self._loop).result(5)
+        except concurrent.futures.TimeoutError:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    async def _handle_call(self, protocol, msg):
+        request_id, options, procedure_uri = msg[1], msg[2], msg[3]
+        kwargs = msg[5] if len(msg) > 5 else {}
+
+        self.call_count += 1
+        self._concurrent_calls += 1
+        self.max_concurrent_calls = max(self.max_concurrent_calls, self._concurrent_calls)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+
+            procedure = self._procedures.get(procedure_uri)
+            if procedure is None:
+                raise FakeWaapiError("wamp.error.no_such_procedure", "The procedure URI is unknown.")
+            result = procedure(kwargs, options)
+            protocol.send([message.Result.MESSAGE_TYPE, request_id, {}, [], result or {}])
+        except Exception as e:
+            # Every call is answered: any other failure of a procedure comes from arguments it does not expect
+            if not isinstance(e, FakeWaapiError):
+                e = FakeWaapiError("ak.wwise.schema_validation_failed", "{}: {}".format(type(e).__name__, e))
+            protocol.send([message.Error.MESSAGE_TYPE, message.Call.MESSAGE_TYPE, request_id, {}, e.error_uri, [], e.kwargs])
+        finally:
+            self._concurrent_calls -= 1
+
+    def _handle_subscribe(self, protocol, msg):
+        request_id, options, topic = msg[1], msg[2], msg[3]
+        if topic not in self.TOPICS:
+            protocol.send([
+                message.Error.MESSAGE_TYPE, message.Subscribe.MESSAGE_TYPE, request_id, {},
+                "ak.wwise.invalid_topic", [], {"message": "The topic URI is unknown."}
+            ])
+            return
+
+        self.subscribe_count += 1
+        subscription_id = next(self._ids)
+        self._subscriptions[subscription_id] = (protocol, topic, options)
+        protocol.subscriptions.add(subscription_id)
+        protocol.send([message.Subscribed.MESSAGE_TYPE, request_id, subscription_id])
+
+    def _handle_unsubscribe(self, protocol, msg):
+        request_id, subscription_id = msg[1], msg[2]
+        if subscription_id not in protocol.subscriptions:
+            protocol.send([
+                message.Error.MESSAGE_TYPE, message.Unsubscribe.MESSAGE_TYPE, request_id, {},
+                "wamp.error.no_such_subscription", [], {}
+            ])
+            return
+
+        protocol.subscriptions.discard(subscription_id)
+        self._subscriptions.pop(subscription_id, None)
+        protocol.send([message.Unsubscribed.MESSAGE_TYPE, request_id])
+
+    def _publish(self, topic, kwargs, accept=None):
+        """
+        :type topic: str
+        :type kwargs: dict | (dict) -> dict
+        :param accept: Filter of the subscriptions by their options
+        :type accept: (dict) -> bool | None
+        """
+        for subscription_id, (protocol, subscribed_topic, options) in list(self._subscriptions.items()):
+            if subscribed_topic != topic or (accept is not None and not accept(options)):
+                continue
+            event_kwargs = kwargs(options) if callable(kwargs) else kwargs
+            protocol.send([message.Event.MESSAGE_TYPE, subscription_id, next(self._ids), {}, [], event_kwargs])
+
+    def _publish_object(self, topic, obj, accept=None, **kwargs):
+        """
+        Publish an event about an object, returning the fields requested by each subscription
+        """
+        self._publish(topic, lambda options: dict(kwargs, object=obj.fields(options.get("return"))), accept)
+
+    async def _tick(self):
+        index = 0
+        while True:
+            await asyncio.sleep(1.0 / self.event_rate)
+            self._publish(FAKE_TICK_TOPIC, {"index": index, "payload": "x" * self.payload_size})
+            index += 1
+
+    def _find(self, reference):
+        obj = self.project.find(reference) if isinstance(reference, str) else None
+        if obj is None:
+            raise FakeWaapiError("ak.wwise.invalid_object", "Object not found: " + str(reference))
+        return obj
+
+    def _get_info(self, kwargs, options):
+        _validate_arguments(kwargs, ())
+        return {
+            "apiVersion": 4,
+            "displayName": "Wwise (fake)",
+            "branch": "fake",
+            "version": {"displayName": "v2023.1.0", "year": 2023, "major": 1, "minor": 0, "build": 8000},
+            "platform": "linux",
+            "isCommandLine": True
+        }
+
+    def _get_schema(self, kwargs, options):
+        _validate_arguments(kwargs, ("uri",), ("uri",))
+        return {"argsSchema": {"type": "object"}, "resultSchema": {"type": "object"}, "optionsSchema": {"type": "object"}}
+
+    def _payload(self, kwargs, options):
+        _validate_arguments(kwargs, ("size",))
+        return {"payload": "x" * kwargs.get("size", self.payload_size)}
+
+    def _object_get(self, kwargs, options):
+        _validate_arguments(kwargs, ("from", "transform"), ("from",))
+        selection = []
+        for source, references in kwargs["from"].items():
+            if source == "ofType":
+                selection += [obj for obj in self.project.objects() if obj.type in references]
+            elif source in ("id", "path", "name"):
+                selection += [obj for obj in map(self.project.find, references) if obj is not None]
+            else:
+                raise FakeWaapiError("ak.wwise.invalid_arguments", "Unsupported from: " + source)
+
+        for transform in kwargs.get("transform", []):
+            select = transform.get("select", [])
+            if "children" in select:
+                selection = [child for obj in selection for child in obj.children]
+            elif "descendants" in select:
+                selection = [descendant for obj in selection for descendant in obj.descendants()]
+            elif "parent" in select:
+                selection = [obj.parent for obj in selection if obj.parent is not None]
+            elif "ancestors" in select:
+                selection = [ancestor for obj in selection for ancestor in obj.ancestors()]
+
+        return {"return": [obj.fields(options.get("return")) for obj in selection]}
+
+    def _object_create(self, kwargs, options):
+        _validate_arguments(kwargs, ("parent", "type", "name", "onNameConflict", "notes"), ("parent", "type", "name"))
+        parent = self._find(kwargs["parent"])
+        existing = next((child for child in parent.children if child.name == kwargs["name"]), None)
+        if existing is not None:
+            conflict = kwargs.get("onNameConflict", "fail")
+            if conflict == "fail":
+                raise FakeWaapiError("ak.wwise.invalid_arguments", "An object with this name already exists.")
+            if conflict == "merge":
+                return {"id": existing.id, "name": existing.name}
+            if conflict == "replace":
+                self._object_delete({"object": existing.id}, {})
+
+        name = kwargs["name"]
+        if existing is not None and kwargs.get("onNameConflict") == "rename":
+            suffix = next(n for n in itertools.count(1) if not any(c.name == "{}_{:02d}".format(name, n) for c in parent.children))
+            name = "{}_{:02d}".format(name, suffix)
+
+        obj = self.project.add(FakeObject(name, kwargs["type"], parent))
+        obj.notes = kwargs.get("notes", "")
+        self._publish_object("ak.wwise.core.object.created", obj)
+        self._publish_object("ak.wwise.core.object.childAdded", obj, parent=parent.fields())
+        self._publish_object("ak.wwise.core.object.nameChanged", obj, newName=obj.name, oldName="")
+        return {"id": obj.id, "name": obj.name}
+
+    def _object_delete(self, kwargs, options):
+        _validate_arguments(kwargs, ("object",), ("object",))
+        obj = self._find(kwargs["object"])
+        if obj.parent is None or obj.type in ("Folder", "WorkUnit"):
+            raise FakeWaapiError("ak.wwise.invalid_arguments", "This object cannot be deleted.")
+        self._publish_object("ak.wwise.core.object.preDeleted", obj)
+        parent = obj.parent
+        self.project.remove(obj)
+        self._publish_object("ak.wwise.core.object.childRemoved", obj, parent=parent.fields())
+        self._publish("ak.wwise.core.object.postDeleted", {"object": {"id": obj.id, "name": obj.name}})
+        return {}
+
+    def _object_set_property(self, kwargs, options):
+        _validate_arguments(kwargs, ("object", "property", "value", "platform"), ("object", "property", "value"))
+        obj = self._find(kwargs["object"])
+        property_name = kwargs["property"]
+        old_value = obj.properties.get(property_name)
+        obj.properties[property_name] = kwargs["value"]
+
+        def accept(subscription_options):
+            return subscription_options.get("property") in (None, property_name) and \
+                subscription_options.get("object") in (None, obj.id, obj.path)
+
+        self._publish_object(
+            "ak.wwise.core.object.propertyChanged", obj, accept,
+            propertyName=property_name, oldValue=old_value, newValue=kwargs["value"]
+        )
+        return {}
+
+    def _object_set_name(self, kwargs, options):
+        _validate_arguments(kwargs, ("object", "value"), ("object", "value"))
+        obj = self._find(kwargs["object"])
+        old_name, obj.name = obj.name, kwargs["value"]
+        self._publish_object("ak.wwise.core.object.nameChanged", obj, newName=obj.name, oldName=old_name)
+        return {}
+
+    def _object_set_notes(self, kwargs, options):
+        _validate_arguments(kwargs, ("object", "value"), ("object", "value"))
+        obj = self._find(kwargs["object"])
+        old_notes, obj.notes = obj.notes, kwargs["value"]
+        self._publish_object("ak.wwise.core.object.notesChanged", obj, newNotes=obj.notes, oldNotes=old_notes)
+        return {}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds waited before replying to each call")
+    parser.add_argument("--payload-size", type=int, default=0, help="Size of the fake payloads")
+    parser.add_argument("--event-rate", type=float, default=0.0, help="Events per second on " + FAKE_TICK_TOPIC)
+    args = parser.parse_args()
+
+    server = FakeWaapiServer(args.host, args.port, args.latency, args.payload_size, args.event_rate).start()
+    print("Listening on " + server.url)
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
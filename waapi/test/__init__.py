@@ -0,0 +1,6 @@
+import os
+
+if os.environ.get("WAAPI_FAKE_SERVER"):
+    # Run the tests against the fake server of this package rather than Wwise
+    from waapi.server import FakeWaapiServer
+    fake_server = FakeWaapiServer(port=int(os.environ.get("WAAPI_FAKE_SERVER_PORT", 8080))).start()
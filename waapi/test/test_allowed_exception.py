@@ -23,3 +23,28 @@ class AllowedException(unittest.TestCase):
                 return
 
             self.fail("Should have thrown an exception")
+
+    def test_exception_on_call_async_result(self):
+        with WaapiClient(allow_exception=True) as client:
+            future = client.call_async("i.dont.exist", someArg=True)
+            with self.assertRaises(WaapiRequestFailed) as context:
+                future.result()
+            self.assertEqual(context.exception.kwargs.get("message"), "The procedure URI is unknown.")
+
+    def test_exception_on_call_many(self):
+        with WaapiClient(allow_exception=True) as client:
+            calls = ["ak.wwise.core.getInfo", ("i.dont.exist", {"someArg": True}), "ak.wwise.core.getInfo"]
+
+            results = client.call_many(calls)
+            self.assertIn("version", results[0])
+            self.assertIsInstance(results[1], WaapiRequestFailed)
+            self.assertIn("version", results[2])
+
+            with self.assertRaises(WaapiRequestFailed):
+                client.call_many(calls, stop_on_error=True)
+
+    def test_exception_on_subscribe_many(self):
+        with WaapiClient(allow_exception=True) as client:
+            handlers = client.subscribe_many([("ak.wwise.core.object.created", None), ("i.dont.exist", None)])
+            self.assertTrue(handlers[0].unsubscribe())
+            self.assertIsInstance(handlers[1], WaapiRequestFailed)
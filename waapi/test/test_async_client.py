@@ -0,0 +1,88 @@
+import unittest
+
+from waapi import AsyncWaapiClient, EventHandler, CannotConnectToWaapiException
+from waapi.wamp.async_compatibility import asyncio
+
+
+class AsyncClient(unittest.IsolatedAsyncioTestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    async def test_connect_disconnect(self):
+        client = await AsyncWaapiClient().connect()
+        self.assertTrue(client.is_connected())
+        self.assertTrue(await client.disconnect())
+        self.assertFalse(client.is_connected())
+        self.assertFalse(await client.disconnect())
+
+    async def test_with_statement(self):
+        async with AsyncWaapiClient() as client:
+            self.assertTrue(client.is_connected())
+        self.assertFalse(client.is_connected())
+
+    async def test_cannot_connect(self):
+        bad_address = "ws://bad_address/waapi"
+        with self.assertRaises(CannotConnectToWaapiException) as context:
+            await AsyncWaapiClient(bad_address).connect()
+        self.assertIn(bad_address, str(context.exception))
+
+    async def test_call(self):
+        async with AsyncWaapiClient() as client:
+            result = await client.call("ak.wwise.core.getInfo")
+            self.assertIsNotNone(result)
+            self.assertIn("version", result)
+
+            self.assertIsNone(await client.call("ak.wwise.idontexist"))  # Noexcept
+
+    async def test_concurrent_calls(self):
+        async with AsyncWaapiClient() as client:
+            results = await asyncio.gather(*[client.call("ak.wwise.core.getInfo") for _ in range(200)])
+            for result in results:
+                self.assertIsNotNone(result)
+                self.assertIn("version", result)
+
+    async def test_subscribe(self):
+        async with AsyncWaapiClient() as client:
+            object_name = "AsyncClientSubscribe"
+            event = asyncio.Event()
+
+            def on_object_created(object):
+                self.assertEqual(object.get("name"), object_name)
+                event.set()
+
+            handler = await client.subscribe(
+                "ak.wwise.core.object.created",
+                on_object_created,
+                {"return": ["id", "name"]}
+            )
+            self.assertIsInstance(handler, EventHandler)
+            self.assertEqual(len(client.subscriptions()), 1)
+
+            created = await client.call(
+                "ak.wwise.core.object.create",
+                parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                type="Sound",
+                name=object_name
+            )
+            await asyncio.wait_for(event.wait(), self.TIMEOUT_VALUE)
+
+            self.assertTrue(await handler.unsubscribe())
+            self.assertEqual(len(client.subscriptions()), 0)
+            self.assertFalse(await handler.unsubscribe())
+
+            await client.call("ak.wwise.core.object.delete", object=created.get("id"))
+
+    async def test_unsubscribe_not_awaited(self):
+        async with AsyncWaapiClient() as client:
+            handler = await client.subscribe("ak.wwise.core.object.created", lambda *args, **kwargs: None)
+            handler.unsubscribe()
+            for _ in range(100):
+                if not client.subscriptions():
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(len(client.subscriptions()), 0)
+            self.assertIsNone(handler.subscription)
+
+    async def test_invalid_subscribe(self):
+        async with AsyncWaapiClient() as client:
+            self.assertIsNone(await client.subscribe("ak.wwise.idontexist"))
+            self.assertEqual(len(client.subscriptions()), 0)
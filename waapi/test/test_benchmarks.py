@@ -0,0 +1,49 @@
+import unittest
+
+import waapi
+from waapi.benchmarks import call_overhead, client, imports, serializers
+
+
+class Benchmarks(unittest.TestCase):
+    def test_client(self):
+        results = client.run(calls=20, large_calls=2, large_size=1024, events=50, connections=2)
+        self.assertEqual(results["small_call"]["count"], 20)
+        self.assertGreater(results["small_call"]["per_sec"], 0)
+        self.assertLessEqual(results["small_call"]["p50_ms"], results["small_call"]["p99_ms"])
+        self.assertEqual(results["large_call"]["count"], 2)
+        for name in client.EXECUTORS:
+            self.assertTrue(results["events"][name]["complete"])
+        self.assertTrue(results["events_batched"]["complete"])
+        self.assertEqual(results["connect"]["count"], 2)
+
+    def test_serializers(self):
+        results = serializers.run(count=10, repeat=1)
+        self.assertIn("json", results)
+
+    def test_call_overhead(self):
+        results = call_overhead.run(count=20, repeat=1)
+        self.assertGreater(results["sync_call_us"], 0)
+        self.assertGreater(results["async_call_us"], 0)
+
+    def test_imports(self):
+        results = imports.run(repeat=1)
+        for name in ("package", "exceptions", "event_handler"):
+            self.assertListEqual(results[name]["loaded"], [])
+        self.assertNotIn("autobahn", results["client"]["loaded"])  # Only imported once a client is created
+        self.assertLess(results["package"]["ms"], results["autobahn"]["ms"])
+
+    def test_lazy_attributes(self):
+        self.assertIn("WaapiClient", dir(waapi))
+        self.assertIs(waapi.EventHandler, waapi.client.event.EventHandler)
+        with self.assertRaises(AttributeError):
+            waapi.NotAnArtifact
+
+    def test_compatibility_attributes(self):
+        from waapi import WampRequestType, WampRequest, Subscription, start_decoupled_autobahn_client
+        from waapi.wamp.interface import WampRequestType as interface_request_type
+        self.assertIs(WampRequestType, interface_request_type)
+        self.assertTrue(callable(start_decoupled_autobahn_client))
+
+
+if __name__ == "__main__":
+    unittest.main()
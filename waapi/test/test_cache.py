@@ -0,0 +1,137 @@
+import unittest
+from threading import Event
+
+from waapi import WaapiClient, ResultCache
+from waapi.test.fixture import CleanConnectedClientTestCase
+
+
+class Cache(CleanConnectedClientTestCase):
+    TIMEOUT_VALUE = 5  # seconds
+    QUERY = {
+        "from": {"path": ["\\Actor-Mixer Hierarchy\\Default Work Unit"]},
+        "transform": [{"select": ["children"]}]
+    }
+
+    def setUp(self):
+        super(Cache, self).setUp()
+        self.cache = ResultCache()
+        self.cached_client = WaapiClient(result_cache=self.cache)
+
+    def tearDown(self):
+        self.cached_client.disconnect()
+        self._delete_objects_if_exists()
+        super(Cache, self).tearDown()
+
+    def _wait_for_invalidations(self, count):
+        for _ in range(int(self.TIMEOUT_VALUE / 0.05)):
+            if self.cache.statistics()["invalidations"] >= count:
+                return True
+            Event().wait(0.05)
+        return False
+
+    def test_repeated_reads_hit(self):
+        first = self.cached_client.call("ak.wwise.core.getInfo")
+        for _ in range(10):
+            self.assertEqual(self.cached_client.call("ak.wwise.core.getInfo"), first)
+
+        statistics = self.cache.statistics()
+        self.assertEqual(statistics["misses"], 1)
+        self.assertEqual(statistics["hits"], 10)
+        self.assertEqual(statistics["entries"], 1)
+        self.assertIn("ak.wwise.core.object.created", statistics["subscribed_topics"])
+
+        # Internal subscriptions are not exposed
+        self.assertEqual(len(self.cached_client.subscriptions()), 0)
+
+    def test_arguments_are_part_of_key(self):
+        self.cached_client.call("ak.wwise.core.object.get", self.QUERY, options={"return": ["id"]})
+        self.cached_client.call("ak.wwise.core.object.get", self.QUERY, options={"return": ["id", "name"]})
+        self.cached_client.call("ak.wwise.core.object.get", self.QUERY, options={"return": ["id", "name"]})
+
+        statistics = self.cache.statistics()
+        self.assertEqual(statistics["misses"], 2)
+        self.assertEqual(statistics["hits"], 1)
+
+    def test_hit_is_a_copy(self):
+        self.cached_client.call("ak.wwise.core.getInfo")["version"] = None
+        self.assertIsNotNone(self.cached_client.call("ak.wwise.core.getInfo")["version"])
+
+    def test_invalidated_by_events(self):
+        before = self.cached_client.call("ak.wwise.core.object.get", self.QUERY)["return"]
+
+        # Modified by another client: the cache learns about it through its subscriptions
+        invalidations = self.cache.statistics()["invalidations"]
+        self._create_object()
+        self.assertTrue(self._wait_for_invalidations(invalidations + 1))
+
+        after = self.cached_client.call("ak.wwise.core.object.get", self.QUERY)["return"]
+        self.assertEqual(len(after), len(before) + 1)
+
+    def test_invalidated_by_own_calls(self):
+        self.cached_client.call("ak.wwise.core.object.get", self.QUERY)
+        self.cached_client.call(
+            "ak.wwise.core.object.create",
+            parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+            type="Sound",
+            name="Some Name"
+        )
+        # No need to wait for the events: the call itself invalidated the cache
+        self.assertEqual(len(self.cached_client.call("ak.wwise.core.object.get", self.QUERY)["return"]), 1)
+
+    def _without_event_invalidation(self):
+        # Only the calls of the client invalidate the cache
+        self.cached_client.disconnect()
+        self.cache = ResultCache(invalidation_topics=[])
+        self.cached_client = WaapiClient(result_cache=self.cache)
+
+    def test_call_async(self):
+        self._without_event_invalidation()
+        first = self.cached_client.call_async("ak.wwise.core.getInfo").result(self.TIMEOUT_VALUE)
+        self.assertEqual(self.cached_client.call_async("ak.wwise.core.getInfo").result(self.TIMEOUT_VALUE), first)
+        self.assertEqual(self.cache.statistics()["hits"], 1)
+
+        self.cached_client.call("ak.wwise.core.object.get", self.QUERY)
+        self.cached_client.call_async(
+            "ak.wwise.core.object.create",
+            parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+            type="Sound",
+            name="Some Name"
+        ).result(self.TIMEOUT_VALUE)
+        # No need to wait for the events: the call itself invalidated the cache
+        self.assertEqual(len(self.cached_client.call("ak.wwise.core.object.get", self.QUERY)["return"]), 1)
+
+    def test_call_many(self):
+        self._without_event_invalidation()
+        self.cached_client.call("ak.wwise.core.object.get", self.QUERY)
+        self.cached_client.call_many([
+            ("ak.wwise.core.object.create", {
+                "parent": "\\Actor-Mixer Hierarchy\\Default Work Unit",
+                "type": "Sound",
+                "name": "Some Name"
+            })
+        ])
+        self.assertEqual(len(self.cached_client.call("ak.wwise.core.object.get", self.QUERY)["return"]), 1)
+
+        # Batches of cached URIs do not invalidate the cache
+        invalidations = self.cache.statistics()["invalidations"]
+        self.cached_client.call_many(["ak.wwise.core.getInfo"])
+        self.assertEqual(self.cache.statistics()["invalidations"], invalidations)
+
+    def test_memory_budget(self):
+        self.cache.max_bytes = 200
+        fields = ["id", "name", "type", "path", "classId", "filePath"]
+        for count in range(1, len(fields) + 1):
+            self.cached_client.call(
+                "ak.wwise.core.object.get",
+                {"from": {"ofType": ["Project"]}},
+                options={"return": fields[:count]}
+            )
+
+        statistics = self.cache.statistics()
+        self.assertLessEqual(statistics["size_bytes"], self.cache.max_bytes)
+        self.assertGreater(statistics["evictions"], 0)
+        self.assertGreater(statistics["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
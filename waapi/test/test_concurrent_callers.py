@@ -0,0 +1,73 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, Event
+
+from waapi import WaapiClient
+from waapi.test.fixture import CleanConnectedClientTestCase
+
+
+class ConcurrentCallers(CleanConnectedClientTestCase):
+    THREAD_COUNT = 16
+    CALL_COUNT = 1000
+
+    def test_shared_client_stress(self):
+        project_query = {"from": {"ofType": ["Project"]}}
+
+        def call(index):
+            if index % 2:
+                return "getInfo", self.client.call("ak.wwise.core.getInfo")
+            return "get", self.client.call("ak.wwise.core.object.get", project_query)
+
+        with ThreadPoolExecutor(self.THREAD_COUNT) as pool:
+            results = list(pool.map(call, range(self.CALL_COUNT)))
+
+        self.assertEqual(len(results), self.CALL_COUNT)
+        for kind, result in results:
+            # Each caller must receive the reply to its own request
+            self.assertIsNotNone(result)
+            if kind == "getInfo":
+                self.assertIn("version", result)
+            else:
+                self.assertEqual(len(result.get("return")), 1)
+
+    def test_concurrent_subscribe_unsubscribe(self):
+        def subscribe_unsubscribe(_):
+            for _ in range(10):
+                handler = self.client.subscribe("ak.wwise.core.object.created")
+                self.assertIsNotNone(handler)
+                self.assertTrue(handler.unsubscribe())
+
+        with ThreadPoolExecutor(self.THREAD_COUNT) as pool:
+            list(pool.map(subscribe_unsubscribe, range(self.THREAD_COUNT)))
+
+        self.assertEqual(len(self.client.subscriptions()), 0)
+
+
+class DisconnectConcurrentCallers(unittest.TestCase):
+    THREAD_COUNT = 16
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_disconnect_wakes_all_callers(self):
+        client = WaapiClient()
+        started = Event()
+        results = []
+
+        def call_until_disconnected():
+            while True:
+                started.set()
+                result = client.call("ak.wwise.core.getInfo")
+                if result is None:
+                    break
+                results.append(result)
+
+        threads = [Thread(target=call_until_disconnected) for _ in range(self.THREAD_COUNT)]
+        for thread in threads:
+            thread.start()
+
+        self.assertTrue(started.wait(self.TIMEOUT_VALUE))
+        self.assertTrue(client.disconnect())
+
+        for thread in threads:
+            thread.join(self.TIMEOUT_VALUE)
+            self.assertFalse(thread.is_alive())
+        self.assertFalse(client.is_connected())
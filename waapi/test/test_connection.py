@@ -42,3 +42,15 @@ class Connection(unittest.TestCase):
             self.assertIn(bad_address, str(e))
         except Exception:
             self.fail("Should not throw any other error types")
+
+    def test_serializers(self):
+        # The server picks the serializer it supports, falling back on JSON
+        with WaapiClient(serializers=["msgpack", "cbor", "ubjson"]) as client:
+            self.assertTrue(client.is_connected())
+            result = client.call("ak.wwise.core.getInfo")
+            self.assertIsNotNone(result)
+            self.assertIn("version", result)
+
+    def test_unknown_serializer(self):
+        with self.assertRaises(ValueError):
+            WaapiClient(serializers=["idontexist"])
@@ -0,0 +1,217 @@
+import time
+import unittest
+from threading import Event
+
+from waapi import WaapiClient, CoalescingEventHandler, BatchingEventHandler
+from waapi.client.interface import CallbackExecutor
+from waapi.test.fixture import CleanConnectedClientTestCase
+from waapi.wamp.async_compatibility import asyncio
+
+
+def _wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class _RecordingExecutor(CallbackExecutor):
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, callback, kwargs):
+        self.executed.append(kwargs)
+        callback(**kwargs)
+
+
+class Coalescing(CleanConnectedClientTestCase):
+    OBJECT = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Some Name"
+
+    def setUp(self):
+        super(Coalescing, self).setUp()
+        self._delete_objects_if_exists()
+        self._create_object()
+
+    def tearDown(self):
+        self._delete_objects_if_exists()
+        super(Coalescing, self).tearDown()
+
+    def test_latest_value(self):
+        received = []
+        last = Event()
+
+        def on_change(*args, **kwargs):
+            received.append(kwargs["newValue"])
+            if kwargs["newValue"] == -19:
+                last.set()
+
+        handler = self.client.subscribe(
+            "ak.wwise.core.object.propertyChanged",
+            CoalescingEventHandler(callback=on_change, window=1.0),
+            property="Volume",
+            object=self.OBJECT
+        )
+        self.client.call_many([
+            ("ak.wwise.core.object.setProperty", {"object": self.OBJECT, "property": "Volume", "value": -n})
+            for n in range(20)
+        ])
+
+        self.assertTrue(last.wait(self.TIMEOUT_VALUE))
+        self.assertEqual(received[-1], -19)
+        self.assertLess(len(received), 20)
+        self.assertEqual(handler.coalesced, 20 - len(received))
+
+    def _subscribe_long_window(self, client, received, delivered):
+        def on_change(*args, **kwargs):
+            received.append(kwargs["newValue"])
+            delivered.set()
+
+        handler = client.subscribe(
+            "ak.wwise.core.object.propertyChanged",
+            CoalescingEventHandler(callback=on_change, window=30.0),
+            property="Volume",
+            object=self.OBJECT
+        )
+        self.client.call_many([
+            ("ak.wwise.core.object.setProperty", {"object": self.OBJECT, "property": "Volume", "value": -n})
+            for n in range(3)
+        ])
+        self.assertTrue(_wait_until(lambda: handler.coalesced == 2))
+        return handler
+
+    def test_flushed_on_unsubscribe(self):
+        received, delivered = [], Event()
+        handler = self._subscribe_long_window(self.client, received, delivered)
+        self.assertTrue(handler.unsubscribe())
+        self.assertTrue(delivered.wait(self.TIMEOUT_VALUE))
+        self.assertEqual(received, [-2])
+
+    def test_flushed_on_disconnect(self):
+        received, delivered = [], Event()
+        client = WaapiClient()
+        self._subscribe_long_window(client, received, delivered)
+        client.disconnect()
+        self.assertTrue(delivered.wait(self.TIMEOUT_VALUE))
+        self.assertEqual(received, [-2])
+
+
+class CoalescingExecutor(unittest.TestCase):
+    def test_keys(self):
+        handler = CoalescingEventHandler(window=0.01)
+        handler._executor.target = target = _RecordingExecutor()
+        received = []
+        handler.bind(lambda **kwargs: received.append(kwargs))
+
+        async def publish():
+            for value in range(3):
+                for object_id in ("{A}", "{B}"):
+                    handler._executor.execute(handler.on_event, {
+                        "object": {"id": object_id}, "propertyName": "Volume", "newValue": value
+                    })
+            await asyncio.sleep(0.05)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(publish())
+        finally:
+            loop.close()
+
+        self.assertEqual([(event["object"]["id"], event["newValue"]) for event in received], [("{A}", 2), ("{B}", 2)])
+        self.assertEqual(len(target.executed), 2)
+        self.assertEqual(handler.coalesced, 4)
+
+
+
+class Batching(CleanConnectedClientTestCase):
+    NAMES = ["Batch" + str(n) for n in range(5)]
+
+    def tearDown(self):
+        self._delete_objects_if_exists(self.NAMES)
+        super(Batching, self).tearDown()
+
+    def test_batches(self):
+        batches = []
+        done = Event()
+
+        def on_batch(events):
+            batches.append([event["newName"] for event in events])
+            if sum(len(batch) for batch in batches) == len(self.NAMES):
+                done.set()
+
+        self._delete_objects_if_exists(self.NAMES)
+        self.client.subscribe(
+            "ak.wwise.core.object.nameChanged",
+            BatchingEventHandler(callback=on_batch, max_batch_size=2, max_linger=0.5)
+        )
+        self.client.call_many([
+            ("ak.wwise.core.object.create", {
+                "parent": "\\Actor-Mixer Hierarchy\\Default Work Unit", "type": "Sound", "name": name
+            })
+            for name in self.NAMES
+        ])
+
+        self.assertTrue(done.wait(self.TIMEOUT_VALUE))
+        self.assertEqual([name for batch in batches for name in batch], self.NAMES)
+        self.assertTrue(all(0 < len(batch) <= 2 for batch in batches))
+
+    def _subscribe_long_linger(self, client, batches, delivered):
+        def on_batch(events):
+            batches.append([event["newName"] for event in events])
+            delivered.set()
+
+        self._delete_objects_if_exists(self.NAMES)
+        handler = client.subscribe(
+            "ak.wwise.core.object.nameChanged",
+            BatchingEventHandler(callback=on_batch, max_batch_size=100, max_linger=30.0)
+        )
+        self.client.call_many([
+            ("ak.wwise.core.object.create", {
+                "parent": "\\Actor-Mixer Hierarchy\\Default Work Unit", "type": "Sound", "name": name
+            })
+            for name in self.NAMES
+        ])
+        self.assertTrue(_wait_until(lambda: len(handler._executor._batch) == len(self.NAMES)))
+        return handler
+
+    def test_flushed_on_unsubscribe(self):
+        batches, delivered = [], Event()
+        handler = self._subscribe_long_linger(self.client, batches, delivered)
+        self.assertTrue(handler.unsubscribe())
+        self.assertTrue(delivered.wait(self.TIMEOUT_VALUE))
+        self.assertEqual(batches, [self.NAMES])
+
+    def test_flushed_on_disconnect(self):
+        batches, delivered = [], Event()
+        client = WaapiClient()
+        self._subscribe_long_linger(client, batches, delivered)
+        client.disconnect()
+        self.assertTrue(delivered.wait(self.TIMEOUT_VALUE))
+        self.assertEqual(batches, [self.NAMES])
+
+
+class BatchingExecutor(unittest.TestCase):
+    def test_size_and_linger(self):
+        handler = BatchingEventHandler(max_batch_size=3, max_linger=0.01)
+        handler._executor.target = target = _RecordingExecutor()
+        batches = []
+        handler.bind(batches.append)
+
+        async def publish():
+            for value in range(7):
+                handler._executor.execute(handler.on_event, {"value": value})
+            self.assertEqual(len(batches), 2)  # The full batches are delivered immediately
+            await asyncio.sleep(0.05)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(publish())
+        finally:
+            loop.close()
+
+        self.assertEqual([[event["value"] for event in batch] for batch in batches], [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(len(target.executed), 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,19 @@
-from threading import Event
+import io
+import random
+import time
+import unittest
+from contextlib import redirect_stderr
+from threading import Event, Lock, Thread, current_thread
 
 from waapi.test.fixture import CleanConnectedClientTestCase
 from waapi import WaapiClient, \
     PerCallbackThreadExecutor, \
     SequentialThreadExecutor, \
-    AsyncioLoopExecutor
+    AsyncioLoopExecutor, \
+    ThreadPoolCallbackExecutor, \
+    PartitionedThreadExecutor, \
+    OverflowPolicy, \
+    QueueOverflowError
 
 
 def _executor_test(self):
@@ -53,3 +62,228 @@ class AsyncioLoopClient(CleanConnectedClientTestCase):
 
     def test_subscribe(self):
         _executor_test(self)
+
+class ThreadPoolClient(CleanConnectedClientTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = WaapiClient(callback_executor=ThreadPoolCallbackExecutor(max_workers=4, ordered=True))
+
+    def test_subscribe(self):
+        _executor_test(self)
+
+class ThreadPool(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_bounded_workers(self):
+        executor = ThreadPoolCallbackExecutor(max_workers=2)
+        executor.start()
+        threads = set()
+        lock = Lock()
+        done = Event()
+
+        def callback(index):
+            with lock:
+                threads.add(current_thread())
+            if index == 99:
+                done.set()
+
+        for index in range(100):
+            executor.execute(callback, {"index": index})
+        executor.stop()
+        executor.join(self.TIMEOUT_VALUE)
+        self.assertTrue(done.is_set())
+        self.assertLessEqual(len(threads), 2)
+
+    def test_ordered(self):
+        executor = ThreadPoolCallbackExecutor(max_workers=4, ordered=True)
+        executor.start()
+        first, second = [], []
+
+        # One callback per subscription, whose jitter would reorder its events on an unordered pool
+        def append_to(values):
+            def callback(value):
+                time.sleep(random.random() * 0.002)
+                values.append(value)
+            return callback
+
+        first_callback, second_callback = append_to(first), append_to(second)
+        for index in range(200):
+            executor.execute(first_callback, {"value": index})
+            executor.execute(second_callback, {"value": index})
+        executor.stop()
+        executor.join(self.TIMEOUT_VALUE)
+        self.assertEqual(first, list(range(200)))
+        self.assertEqual(second, list(range(200)))
+
+    def test_queue_limit(self):
+        executor = ThreadPoolCallbackExecutor(max_workers=1, queue_limit=2)
+        executor.start()
+        release = Event()
+        executor.execute(lambda: release.wait(self.TIMEOUT_VALUE), {})
+        executor.execute(lambda: None, {})
+
+        blocked = Thread(target=executor.execute, args=(lambda: None, {}))
+        blocked.start()
+        blocked.join(0.1)
+        self.assertTrue(blocked.is_alive())  # Waits for a free slot
+
+        release.set()
+        blocked.join(self.TIMEOUT_VALUE)
+        self.assertFalse(blocked.is_alive())
+        executor.stop()
+        executor.join(self.TIMEOUT_VALUE)
+
+    def test_failing_callback(self):
+        executor = ThreadPoolCallbackExecutor(max_workers=1)
+        executor.start()
+        done = Event()
+        with redirect_stderr(io.StringIO()):
+            executor.execute(lambda: 1 / 0, {})
+            executor.execute(done.set, {})
+            self.assertTrue(done.wait(self.TIMEOUT_VALUE))
+        executor.stop()
+
+    def test_shared(self):
+        executor = ThreadPoolCallbackExecutor(max_workers=1)
+        executor.start()
+        executor.start()
+        executor.stop()
+
+        done = Event()
+        executor.execute(done.set, {})
+        self.assertTrue(done.wait(self.TIMEOUT_VALUE))  # Still running for the other user
+        executor.stop()
+        executor.join(self.TIMEOUT_VALUE)
+        self.assertFalse(any(worker.is_alive() for worker in executor._workers))
+
+class PartitionedThreadClient(CleanConnectedClientTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = WaapiClient(callback_executor=PartitionedThreadExecutor(workers=4))
+
+    def test_subscribe(self):
+        _executor_test(self)
+
+class Partitioned(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_ordered_per_subscription(self):
+        executor = PartitionedThreadExecutor(workers=4)
+        executor.start()
+        subscriptions = [[] for _ in range(8)]
+        threads = [set() for _ in subscriptions]
+        callbacks = [
+            lambda value, received=received, used=used: (received.append(value), used.add(current_thread()))
+            for received, used in zip(subscriptions, threads)
+        ]
+        for index in range(100):
+            for callback in callbacks:
+                executor.execute(callback, {"value": index})
+        executor.stop()
+        executor.join(self.TIMEOUT_VALUE)
+
+        for received, used in zip(subscriptions, threads):
+            self.assertEqual(received, list(range(100)))
+            self.assertEqual(len(used), 1)
+        self.assertGreater(len(set.union(*threads)), 1)
+
+    def test_independent_instances(self):
+        first, second = SequentialThreadExecutor(), SequentialThreadExecutor()
+        first.start()
+        second.start()
+        first.stop()
+        first.join(self.TIMEOUT_VALUE)
+
+        # Stopping an executor does not affect the others
+        done = Event()
+        second.execute(done.set, {})
+        self.assertTrue(done.wait(self.TIMEOUT_VALUE))
+        second.stop()
+        second.join(self.TIMEOUT_VALUE)
+
+class SequentialThreadClients(CleanConnectedClientTestCase):
+    def test_stop_independently(self):
+        received = Event()
+        self.client.subscribe("ak.wwise.core.object.nameChanged", lambda *args, **kwargs: received.set())
+
+        # Each client has its own executor: disconnecting another client does not stop the callbacks of this one
+        WaapiClient().disconnect()
+
+        self._delete_objects_if_exists()
+        self._create_object()
+        self.assertTrue(received.wait(self.TIMEOUT_VALUE))
+        self._delete_object()
+
+class Overflow(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def _overflow(self, executor):
+        """
+        Block the only thread of the executor, then execute callbacks appending 0 to 3 while the queue holds two
+
+        :return: Values appended once the thread is released
+        :rtype: list[int]
+        """
+        executor.start()
+        release = Event()
+        received = []
+        executor.execute(lambda: release.wait(self.TIMEOUT_VALUE), {})
+        time.sleep(0.1)  # Running, no longer queued
+        try:
+            for index in range(4):
+                executor.execute(lambda value: received.append(value), {"value": index})
+        finally:
+            release.set()
+            executor.stop()
+            executor.join(self.TIMEOUT_VALUE)
+        return received
+
+    def test_sequential(self):
+        executor = SequentialThreadExecutor(queue_limit=2, overflow=OverflowPolicy.DROP_NEWEST)
+        self.assertEqual(self._overflow(executor), [0, 1])
+        self.assertEqual(executor.statistics()["dropped"], 2)
+
+        executor = SequentialThreadExecutor(queue_limit=2, overflow="drop_oldest")
+        self.assertEqual(self._overflow(executor), [2, 3])
+        self.assertEqual(executor.statistics()["dropped"], 2)
+
+        executor = SequentialThreadExecutor(queue_limit=2, overflow=OverflowPolicy.RAISE)
+        with self.assertRaises(QueueOverflowError):
+            self._overflow(executor)
+        self.assertEqual(executor.statistics()["rejected"], 1)
+
+    def test_thread_pool(self):
+        # The slot of the running callback counts in the limit
+        executor = ThreadPoolCallbackExecutor(max_workers=1, queue_limit=3, overflow=OverflowPolicy.DROP_NEWEST)
+        self.assertEqual(self._overflow(executor), [0, 1])
+        self.assertEqual(executor.statistics()["dropped"], 2)
+
+        executor = ThreadPoolCallbackExecutor(max_workers=1, queue_limit=3, overflow=OverflowPolicy.DROP_OLDEST)
+        self.assertEqual(self._overflow(executor), [2, 3])
+
+        executor = ThreadPoolCallbackExecutor(max_workers=1, queue_limit=3, overflow=OverflowPolicy.RAISE)
+        with self.assertRaises(QueueOverflowError):
+            self._overflow(executor)
+        self.assertEqual(executor.statistics()["rejected"], 1)
+
+    def test_thread_pool_ordered(self):
+        executor = ThreadPoolCallbackExecutor(
+            max_workers=2, queue_limit=4, ordered=True, overflow=OverflowPolicy.DROP_OLDEST
+        )
+        executor.start()
+        release = Event()
+        received = []
+        executor.execute(lambda: release.wait(self.TIMEOUT_VALUE), {})
+        executor.execute(lambda: release.wait(self.TIMEOUT_VALUE), {})  # Another subscription, on the other worker
+        time.sleep(0.1)
+
+        append = lambda value: received.append(value)
+        for index in range(4):
+            executor.execute(append, {"value": index})
+        release.set()
+        executor.stop()
+        executor.join(self.TIMEOUT_VALUE)
+
+        # The subscription keeps its order: the oldest event is replaced by its next one
+        self.assertEqual(received, [2, 3])
+        self.assertEqual(executor.statistics(), {"queued": 0, "dropped": 2, "rejected": 0})
@@ -0,0 +1,77 @@
+import time
+import unittest
+
+from waapi import WaapiClient, WaapiRequestFailed, EventHandler
+from waapi.server import FakeWaapiServer, FakeWaapiError, FAKE_PAYLOAD_URI, FAKE_TICK_TOPIC
+
+
+class FakeServer(unittest.TestCase):
+    def test_object_tree(self):
+        with FakeWaapiServer(port=0) as server, WaapiClient(server.url) as client:
+            created = client.call("ak.wwise.core.object.create", {
+                "parent": "\\Actor-Mixer Hierarchy\\Default Work Unit", "type": "Sound", "name": "FakeSound"
+            })
+            result = client.call(
+                "ak.wwise.core.object.get",
+                {"from": {"id": [created["id"]]}},
+                options={"return": ["name", "type", "path"]}
+            )
+            self.assertEqual(result["return"], [{
+                "name": "FakeSound", "type": "Sound", "path": "\\Actor-Mixer Hierarchy\\Default Work Unit\\FakeSound"
+            }])
+            client.call("ak.wwise.core.object.delete", {"object": created["id"]})
+            result = client.call("ak.wwise.core.object.get", {"from": {"id": [created["id"]]}})
+            self.assertEqual(result["return"], [])
+
+    def test_register(self):
+        def procedure(kwargs, options):
+            if kwargs.get("fail"):
+                raise FakeWaapiError("ak.wwise.fake.failed", "Asked to fail")
+            return {"echo": kwargs["value"]}
+
+        with FakeWaapiServer(port=0) as server, WaapiClient(server.url, allow_exception=True) as client:
+            server.register("ak.wwise.fake.echo", procedure)
+            self.assertEqual(client.call("ak.wwise.fake.echo", value=3), {"echo": 3})
+            with self.assertRaises(WaapiRequestFailed) as context:
+                client.call("ak.wwise.fake.echo", value=3, fail=True)
+            self.assertEqual(context.exception.kwargs["message"], "Asked to fail")
+
+    def test_malformed_arguments(self):
+        # Arguments a procedure does not expect are answered with an error instead of no reply
+        with FakeWaapiServer(port=0) as server, WaapiClient(server.url, allow_exception=True, timeout=5) as client:
+            for arguments in ({"from": {"path": 5}}, {"from": 3}):
+                with self.assertRaises(WaapiRequestFailed) as context:
+                    client.call("ak.wwise.core.object.get", arguments)
+                self.assertEqual(context.exception.uri, "ak.wwise.schema_validation_failed")
+
+    def test_knobs(self):
+        with FakeWaapiServer(port=0, latency=0.2, payload_size=1000, event_rate=50) as server:
+            with WaapiClient(server.url) as client:
+                start = time.perf_counter()
+                result = client.call(FAKE_PAYLOAD_URI)
+                self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+                self.assertEqual(len(result["payload"]), 1000)
+
+                handler = EventHandler()
+                received = []
+                handler.bind(lambda *args, **kwargs: received.append(kwargs))
+                client.subscribe(FAKE_TICK_TOPIC, handler)
+                deadline = time.time() + 5
+                while len(received) < 5 and time.time() < deadline:
+                    time.sleep(0.05)
+                self.assertGreaterEqual(len(received), 5)
+                self.assertEqual(len(received[0]["payload"]), 1000)
+
+    def test_publish_burst(self):
+        with FakeWaapiServer(port=0) as server, WaapiClient(server.url) as client:
+            received = []
+            client.subscribe(FAKE_TICK_TOPIC, lambda *args, **kwargs: received.append(kwargs["index"]))
+            server.publish_burst(500).result(5)
+            deadline = time.time() + 5
+            while len(received) < 500 and time.time() < deadline:
+                time.sleep(0.05)
+            self.assertEqual(received, list(range(500)))
+
+
+if __name__ == "__main__":
+    unittest.main()
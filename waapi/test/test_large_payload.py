@@ -1,6 +1,7 @@
 import unittest
 
 from waapi import WaapiClient, connect, CannotConnectToWaapiException
+from waapi.test.fixture import CleanConnectedClientTestCase
 
 
 class LargePayload(unittest.TestCase):
@@ -13,5 +14,68 @@ class LargePayload(unittest.TestCase):
             })
             self.assertTrue(client.is_connected())
 
+
+class IterObjects(CleanConnectedClientTestCase):
+    OBJECT_COUNT = 50
+    PARENT = "\\Actor-Mixer Hierarchy\\Default Work Unit"
+
+    def setUp(self):
+        super(IterObjects, self).setUp()
+        self.names = ["IterObjects" + str(n) for n in range(self.OBJECT_COUNT)]
+        self.client.call_many([
+            ("ak.wwise.core.object.create", {"parent": self.PARENT, "type": "Sound", "name": name})
+            for name in self.names
+        ])
+
+    def tearDown(self):
+        self._delete_objects_if_exists(self.names)
+        super(IterObjects, self).tearDown()
+
+    def test_split_from_list(self):
+        paths = [self.PARENT + "\\" + name for name in self.names]
+        objects = list(self.client.iter_objects({"path": paths}, options={"return": ["name"]}, chunk_size=7))
+        self.assertEqual([obj["name"] for obj in objects], self.names)
+
+    def test_split_query(self):
+        objects = self.client.iter_objects(
+            {"path": [self.PARENT]},
+            options={"return": ["name", "type"]},
+            transform=[{"select": ["children"]}],
+            chunk_size=10,
+            max_pending=2
+        )
+        names = [obj["name"] for obj in objects]
+        self.assertLessEqual(set(self.names), set(names))
+
+    def test_query_options(self):
+        # The selection is resolved with the options of the caller, except the properties returned
+        calls = []
+        call = self.client.call
+
+        def record_call(*args, **kwargs):
+            calls.append(kwargs.get("options"))
+            return call(*args, **kwargs)
+
+        self.client.call = record_call
+        objects = list(self.client.iter_objects(
+            {"path": [self.PARENT]},
+            options={"return": ["name"], "platform": "Windows"},
+            transform=[{"select": ["children"]}]
+        ))
+        self.assertTrue(objects)
+        self.assertEqual(calls, [{"return": ["id"], "platform": "Windows"}])
+
+    def test_stop_early(self):
+        paths = [self.PARENT + "\\" + name for name in self.names]
+        objects = self.client.iter_objects({"path": paths}, chunk_size=5)
+        self.assertEqual(next(objects)["name"], self.names[0])
+        objects.close()  # Cancels the chunks still pending
+        self.assertIsNotNone(self.client.call("ak.wwise.core.getInfo"))
+
+    def test_invalid_selection(self):
+        with self.assertRaises(ValueError):
+            next(self.client.iter_objects())
+
+
 if __name__ == "__main__":
     LargePayload().test_large_rpc()
\ No newline at end of file
@@ -0,0 +1,84 @@
+import unittest
+from threading import Event
+
+from waapi import WaapiClient, ClientMetrics, LatencyHistogram
+from waapi.test.fixture import CleanConnectedClientTestCase
+
+
+class Metrics(CleanConnectedClientTestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def setUp(self):
+        super(Metrics, self).setUp()
+        self.records = []
+        self.client_metrics = ClientMetrics(sink=self.records.append)
+        self.metered_client = WaapiClient(metrics=self.client_metrics)
+
+    def tearDown(self):
+        self.metered_client.disconnect()
+        self._delete_objects_if_exists()
+        super(Metrics, self).tearDown()
+
+    def test_calls(self):
+        for _ in range(5):
+            self.assertIsNotNone(self.metered_client.call("ak.wwise.core.getInfo"))
+        self.metered_client.call_many(["ak.wwise.core.getInfo"] * 3)
+
+        metrics = self.metered_client.metrics()
+        info = metrics["uris"]["ak.wwise.core.getInfo"]
+        self.assertEqual(info["count"], 8)
+        self.assertEqual(info["errors"], 0)
+        self.assertEqual(info["latency"]["count"], 8)
+        self.assertEqual(sum(info["latency"]["counts"]), 8)
+        self.assertLessEqual(info["latency"]["p50_ms"], info["latency"]["p99_ms"])
+        self.assertEqual(metrics["wire"]["count"], 8)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertEqual(metrics["in_flight"], 0)
+        self.assertGreater(metrics["bytes_sent"], 0)
+        self.assertGreater(metrics["bytes_received"], 0)
+
+        records = [record for record in self.records if record["uri"] == "ak.wwise.core.getInfo"]
+        self.assertEqual(len(records), 8)
+        self.assertIsNone(records[0]["error"])
+        self.assertGreaterEqual(records[0]["total_ms"], records[0]["wire_ms"])
+
+    def test_errors(self):
+        self.assertIsNone(self.metered_client.call("ak.wwise.core.getInfo", {"unexpected": True}))
+        metrics = self.metered_client.metrics()
+        self.assertEqual(metrics["uris"]["ak.wwise.core.getInfo"]["errors"], 1)
+        self.assertEqual(metrics["errors"]["failed"], 1)
+        self.assertEqual(self.records[-1]["error"], "failed")
+
+    def test_callbacks(self):
+        received = Event()
+        self.metered_client.subscribe("ak.wwise.core.object.created", lambda *args, **kwargs: received.set())
+        self._create_object()
+        self.assertTrue(received.wait(self.TIMEOUT_VALUE))
+
+        for _ in range(int(self.TIMEOUT_VALUE / 0.05)):
+            metrics = self.metered_client.metrics()
+            if metrics["executor_wait"]["count"] and not metrics["executor_backlog"]:
+                break
+            Event().wait(0.05)
+        self.assertEqual(metrics["executor_wait"]["count"], 1)
+        self.assertEqual(metrics["executor_backlog"], 0)
+        self.assertEqual(metrics["uris"]["ak.wwise.core.object.created"]["count"], 1)
+
+    def test_disabled(self):
+        self.assertIsNone(self.client.metrics())
+
+
+class Histogram(unittest.TestCase):
+    def test_percentiles(self):
+        histogram = LatencyHistogram((1., 10., 100.))
+        for duration_ms in [0.5] * 90 + [5.] * 9 + [500.]:
+            histogram.add(duration_ms / 1000.)
+
+        self.assertEqual(histogram.counts, [90, 9, 0, 1])
+        self.assertEqual(histogram.percentile(50), 1.)
+        self.assertEqual(histogram.percentile(99), 10.)
+        self.assertAlmostEqual(histogram.percentile(100), 500.)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import time
+import unittest
+from threading import Thread
+
+from waapi import WaapiClient, OverflowPolicy, QueueOverflowError
+from waapi.server import FakeWaapiServer
+from waapi.wamp.ak_autobahn import AutobahnClientDecoupler
+from waapi.wamp.async_compatibility import asyncio
+from waapi.wamp.interface import WampRequest, WampRequestType
+
+
+class RequestQueue(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def _fill(self, client):
+        """
+        Make a call in flight, a call waiting for the in-flight slot, fill the queue of two requests, and overflow it
+        with two more requests
+
+        :type client: WaapiClient
+        :rtype: list[concurrent.futures.Future]
+        """
+        futures = [client.call_async("ak.wwise.core.getInfo")]
+        time.sleep(0.1)
+        futures.append(client.call_async("ak.wwise.core.getInfo"))
+        time.sleep(0.1)
+        futures.extend(client.call_async("ak.wwise.core.getInfo") for _ in range(4))
+        return futures
+
+    def _client(self, server, overflow):
+        return WaapiClient(server.url, max_in_flight=1, max_queued_requests=2, request_overflow=overflow)
+
+    def test_drop_newest(self):
+        with FakeWaapiServer(port=0, latency=0.5) as server, self._client(server, "drop_newest") as client:
+            futures = self._fill(client)
+            self.assertIsNone(futures[4].result(0.1))
+            self.assertIsNone(futures[5].result(0.1))
+            for future in futures[:4]:
+                self.assertIsNotNone(future.result(self.TIMEOUT_VALUE))
+            self.assertEqual(client.queue_statistics()["dropped"], 2)
+            self.assertEqual(server.call_count, 4)
+
+    def test_drop_oldest(self):
+        with FakeWaapiServer(port=0, latency=0.5) as server, \
+                self._client(server, OverflowPolicy.DROP_OLDEST) as client:
+            futures = self._fill(client)
+            self.assertIsNone(futures[2].result(0.1))
+            self.assertIsNone(futures[3].result(0.1))
+            for future in futures[:2] + futures[4:]:
+                self.assertIsNotNone(future.result(self.TIMEOUT_VALUE))
+            self.assertEqual(client.queue_statistics()["dropped"], 2)
+
+    def test_raise(self):
+        with FakeWaapiServer(port=0, latency=0.5) as server, self._client(server, OverflowPolicy.RAISE) as client:
+            futures = self._fill(client)
+            with self.assertRaises(QueueOverflowError):
+                futures[4].result(0.1)
+            statistics = client.queue_statistics()
+            self.assertEqual(statistics["queue_depth"], 2)
+            self.assertEqual(statistics["max_queued_requests"], 2)
+            self.assertEqual(statistics["rejected"], 2)
+            for future in futures[:4]:
+                self.assertIsNotNone(future.result(self.TIMEOUT_VALUE))
+
+    def test_block(self):
+        with FakeWaapiServer(port=0, latency=0.2) as server, self._client(server, OverflowPolicy.BLOCK) as client:
+            # One call in flight, one waiting for the in-flight slot and two queued: the next callers wait for room
+            start = time.perf_counter()
+            futures = []
+            for _ in range(8):
+                futures.append(client.call_async("ak.wwise.core.getInfo"))
+                self.assertLessEqual(client.queue_statistics()["queue_depth"], 2)
+            self.assertGreater(time.perf_counter() - start, 0.5)
+            self.assertFalse(futures[7].done())
+
+            for future in futures:
+                self.assertIsNotNone(future.result(self.TIMEOUT_VALUE))
+            self.assertEqual(client.queue_statistics()["dropped"], 0)
+
+    def test_block_released_on_disconnect(self):
+        with FakeWaapiServer(port=0, latency=0.5) as server:
+            client = self._client(server, OverflowPolicy.BLOCK)
+            futures = [client.call_async("ak.wwise.core.getInfo") for _ in range(4)]
+            blocked = Thread(target=lambda: futures.append(client.call_async("ak.wwise.core.getInfo")))
+            blocked.start()
+            time.sleep(0.1)
+            self.assertTrue(blocked.is_alive())  # Waits for room in the queue
+
+            client.disconnect()
+            blocked.join(self.TIMEOUT_VALUE)
+            self.assertFalse(blocked.is_alive())
+
+
+class Decoupler(unittest.TestCase):
+    def test_drop_oldest_drained(self):
+        async def run():
+            decoupler = AutobahnClientDecoupler(1, overflow=OverflowPolicy.DROP_OLDEST)
+            loop = asyncio.get_running_loop()
+            first = WampRequest(WampRequestType.CALL, "ak.wwise.core.getInfo", future=loop.create_future())
+            second = WampRequest(WampRequestType.CALL, "ak.wwise.core.getInfo", future=loop.create_future())
+            await decoupler.put_request(first)
+
+            # The queue is full when the request is made, and drained before it is put
+            put = decoupler.put_request(second)
+            self.assertIs(await decoupler.get_request(), first)
+            await put
+            self.assertFalse(second.future.done())
+            self.assertIs(await decoupler.get_request(), second)
+            self.assertEqual(decoupler.overflow_counts["dropped"], 0)
+
+        asyncio.run(run())
@@ -0,0 +1,90 @@
+import gc
+import unittest
+from threading import Event
+
+from waapi import WaapiClientPool, PoolStrategy, EventHandler, CannotConnectToWaapiException, wait_all
+
+
+class ClientPool(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_connect_disconnect(self):
+        pool = WaapiClientPool(size=3)
+        self.assertEqual(pool.size, 3)
+        self.assertTrue(pool.is_connected())
+        self.assertTrue(pool.disconnect())
+        self.assertFalse(pool.is_connected())
+        self.assertFalse(pool.disconnect())
+        self.assertIsNone(pool.call("ak.wwise.core.getInfo"))
+
+    def test_cannot_connect(self):
+        with self.assertRaises(CannotConnectToWaapiException):
+            WaapiClientPool("ws://bad_address/waapi", size=2)
+
+    def test_calls_across_members(self):
+        for strategy in PoolStrategy:
+            with WaapiClientPool(size=3, strategy=strategy) as pool:
+                futures = [pool.call_async("ak.wwise.core.getInfo") for _ in range(30)]
+                for result in wait_all(futures, self.TIMEOUT_VALUE):
+                    self.assertIn("version", result)
+
+                self.assertIn("version", pool.call("ak.wwise.core.getInfo"))
+                results = pool.call_many(["ak.wwise.core.getInfo"] * 5)
+                self.assertEqual(len(results), 5)
+                for member in pool._members:
+                    self.assertEqual(member.outstanding, 0)
+
+    def test_subscription_pinned_to_one_member(self):
+        with WaapiClientPool(size=3) as pool:
+            received = []
+            event = Event()
+
+            def on_name_changed(*args, **kwargs):
+                received.append(kwargs)
+                event.set()
+
+            handler = pool.subscribe("ak.wwise.core.object.nameChanged", on_name_changed)
+            self.assertIsInstance(handler, EventHandler)
+            self.assertEqual(pool.subscriptions(), {handler})
+            self.assertEqual(sum(1 for member in pool._members if handler in member.client.subscriptions()), 1)
+
+            created = pool.call(
+                "ak.wwise.core.object.create",
+                parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                type="Sound",
+                name="PoolSubscription"
+            )
+            self.assertTrue(event.wait(self.TIMEOUT_VALUE))
+            pool.call("ak.wwise.core.object.delete", object=created.get("id"))
+            self.assertEqual(len(received), 1)  # Delivered once, by a single member
+
+            self.assertTrue(handler.unsubscribe())
+            self.assertEqual(len(pool.subscriptions()), 0)
+
+    def test_disconnected_member_replaced(self):
+        with WaapiClientPool(size=2, health_check_interval=0.1) as pool:
+            lost = pool._members[0].client
+            lost.disconnect()
+            self.assertIn("version", pool.call("ak.wwise.core.getInfo"))  # Served by the remaining member
+
+            for _ in range(int(self.TIMEOUT_VALUE / 0.1)):
+                if pool._members[0].client is not lost:
+                    break
+                Event().wait(0.1)
+            self.assertIsNot(pool._members[0].client, lost)
+            self.assertTrue(pool._members[0].client.is_connected())
+
+    def test_disconnected_when_released(self):
+        pool = WaapiClientPool(size=2, health_check_interval=0.01)
+        clients = [member.client for member in pool._members]
+        health_thread = pool._health_thread
+        del pool
+        gc.collect()
+
+        health_thread.join(self.TIMEOUT_VALUE)
+        self.assertFalse(health_thread.is_alive())
+        self.assertFalse(any(client.is_connected() for client in clients))
+
+
+if __name__ == "__main__":
+    unittest.main()
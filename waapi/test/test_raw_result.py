@@ -0,0 +1,75 @@
+import json
+import unittest
+
+from waapi import WaapiClient, AsyncWaapiClient
+from waapi.server import FakeWaapiServer
+from waapi.wamp.async_compatibility import asyncio
+from waapi.wamp.json_serializer import FastJsonSerializer, JSON_BACKENDS, available_json_backends
+
+
+class JsonBackends(unittest.TestCase):
+    def test_stdlib_fallback(self):
+        self.assertIn("json", available_json_backends())
+        self.assertIn(FastJsonSerializer().backend, JSON_BACKENDS)
+
+    def test_round_trip(self):
+        message = [50, 1, {}, [], {"return": [{"name": "é/a", "id": "{A}"}]}]
+        for backend in available_json_backends():
+            object_serializer = FastJsonSerializer(backend)._serializer
+            self.assertEqual(object_serializer.unserialize(object_serializer.serialize(message)), [message])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            FastJsonSerializer("idontexist")
+
+    def test_split_result(self):
+        object_serializer = FastJsonSerializer()._serializer
+        payload = b'[50, 7, {}, ["\xc3\xa9"], {"return": [{"name": "\xc3\xa9"}]} ]'
+        object_serializer.raw_requests.add(7)
+        self.assertEqual(object_serializer.unserialize(payload), [[50, 7, {}, ["é"]]])
+        self.assertEqual(object_serializer.raw_results.pop(7), b'{"return": [{"name": "\xc3\xa9"}]}')
+        self.assertNotIn(7, object_serializer.raw_requests)
+
+        # Requests not awaited raw are fully decoded
+        self.assertEqual(object_serializer.unserialize(b'[50,8,{},[],{"a":1}]'), [[50, 8, {}, [], {"a": 1}]])
+
+
+class RawResult(unittest.TestCase):
+    def test_call(self):
+        with WaapiClient() as client:
+            result = client.call("ak.wwise.core.getInfo")
+            raw = client.call("ak.wwise.core.getInfo", raw=True)
+            self.assertIsInstance(raw, bytes)
+            self.assertEqual(json.loads(raw), result)
+            self.assertEqual(json.loads(client.call_async("ak.wwise.core.getInfo", raw=True).result()), result)
+
+    def test_binary_serializer(self):
+        # The result is encoded again to JSON
+        with WaapiClient(serializers=["msgpack", "cbor"]) as client:
+            result = client.call("ak.wwise.core.getInfo")
+            self.assertEqual(json.loads(client.call("ak.wwise.core.getInfo", raw=True)), result)
+
+    def test_shared_serializer(self):
+        # Each connection decodes raw results of its own request ids, which start at 1 in every session
+        serializer = FastJsonSerializer("json")
+        with FakeWaapiServer(port=0, latency=0.5) as slow_server, FakeWaapiServer(port=0) as server:
+            with WaapiClient(slow_server.url, serializers=[serializer]) as first, \
+                    WaapiClient(server.url, serializers=[serializer]) as second:
+                raw = first.call_async("ak.wwise.core.getInfo", raw=True)  # Still pending during the second call
+                result = second.call("ak.wwise.core.getInfo")
+                self.assertIn("version", result)
+                self.assertEqual(json.loads(raw.result()), result)
+
+    def test_async_client(self):
+        async def run():
+            async with AsyncWaapiClient() as client:
+                result = await client.call("ak.wwise.core.getInfo")
+                raw = await client.call("ak.wwise.core.getInfo", raw=True)
+                return result, raw
+
+        result, raw = asyncio.run(run())
+        self.assertEqual(json.loads(raw), result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from threading import Event
+
+from waapi import WaapiClient, ReconnectPolicy
+
+
+class Reconnect(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def _drop_connection(self, client):
+        """
+        Simulate the loss of the connection, as when Wwise is closed, by stopping the client thread's loop
+        """
+        client_thread = client._client_thread
+        client._loop.call_soon_threadsafe(client._loop.stop)
+        client_thread.join()
+
+    def _wait_for_reconnection(self, client):
+        for _ in range(int(self.TIMEOUT_VALUE / 0.05)):
+            if client.is_connected():
+                return True
+            Event().wait(0.05)
+        return False
+
+    def test_no_policy(self):
+        client = WaapiClient()
+        self._drop_connection(client)
+        self.assertFalse(client.is_connected())
+        self.assertIsNone(client.call("ak.wwise.core.getInfo"))
+        self.assertIsNone(client._supervisor_thread)
+
+    def test_reconnect_restores_subscriptions(self):
+        with WaapiClient(reconnect_policy=ReconnectPolicy(initial_delay=0.05)) as client:
+            event = Event()
+            received = []
+
+            def on_name_changed(*args, **kwargs):
+                received.append(kwargs)
+                event.set()
+
+            handler = client.subscribe("ak.wwise.core.object.nameChanged", on_name_changed, {"return": ["id", "type"]})
+            subscription = handler.subscription
+
+            self._drop_connection(client)
+            self.assertTrue(self._wait_for_reconnection(client))
+
+            # The same handler is subscribed again, with its original options
+            self.assertEqual(client.subscriptions(), {handler})
+            self.assertIsNotNone(handler.subscription)
+            self.assertIsNot(handler.subscription, subscription)
+
+            created = client.call(
+                "ak.wwise.core.object.create",
+                parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                type="Sound",
+                name="ReconnectSubscription"
+            )
+            self.assertTrue(event.wait(self.TIMEOUT_VALUE))
+            client.call("ak.wwise.core.object.delete", object=created.get("id"))
+            self.assertEqual(received[0]["object"]["type"], "Sound")
+
+            self.assertTrue(handler.unsubscribe())
+
+    def test_calls_queued_while_reconnecting(self):
+        with WaapiClient(reconnect_policy=ReconnectPolicy(initial_delay=0.5)) as client:
+            self._drop_connection(client)
+            self.assertFalse(client.is_connected())
+
+            future = client.call_async("ak.wwise.core.getInfo")
+            self.assertIn("version", future.result(self.TIMEOUT_VALUE))
+            self.assertTrue(client.is_connected())
+
+    def test_fail_fast_while_reconnecting(self):
+        with WaapiClient(reconnect_policy=ReconnectPolicy(initial_delay=0.5, max_queued_calls=0)) as client:
+            self._drop_connection(client)
+            self.assertIsNone(client.call("ak.wwise.core.getInfo"))
+            self.assertTrue(self._wait_for_reconnection(client))
+            self.assertIn("version", client.call("ak.wwise.core.getInfo"))
+
+    def test_disconnect_while_reconnecting(self):
+        client = WaapiClient(reconnect_policy=ReconnectPolicy(initial_delay=0.5))
+        self._drop_connection(client)
+        future = client.call_async("ak.wwise.core.getInfo")
+
+        client.disconnect()
+        self.assertIsNone(future.result(self.TIMEOUT_VALUE))  # Queued calls are released
+        self.assertFalse(client._supervisor_thread.is_alive())
+        self.assertFalse(client.is_connected())
+
+    def test_backoff_delays(self):
+        policy = ReconnectPolicy(initial_delay=1.0, max_delay=5.0, multiplier=2.0, jitter=0.0, max_attempts=5)
+        self.assertEqual(list(policy.delays()), [1.0, 2.0, 4.0, 5.0, 5.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
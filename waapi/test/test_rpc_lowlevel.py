@@ -1,5 +1,7 @@
 from copy import copy
+from threading import Thread
 
+from waapi import WaapiClient, wait_all, as_completed
 from waapi.test.fixture import ConnectedClientTestCase
 
 class RpcLowLevel(ConnectedClientTestCase):
@@ -97,3 +99,81 @@ class RpcLowLevel(ConnectedClientTestCase):
             self.assertIsInstance(result_return.get("name"), str)
             self.assertIn("workunit:isDirty", result_return)
             self.assertIsInstance(result_return.get("workunit:isDirty"), bool)
+
+    def test_pipelined_calls_from_threads(self):
+        results = []
+
+        def call():
+            results.append(self.client.call("ak.wwise.core.getInfo"))
+
+        threads = [Thread(target=call) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(self.TIMEOUT_VALUE)
+
+        self.assertEqual(len(results), len(threads))
+        for result in results:
+            self.assertIsNotNone(result)
+            self.assertIn("version", result)
+
+    def test_call_async(self):
+        futures = [self.client.call_async("ak.wwise.core.getInfo") for _ in range(200)]
+        futures.append(self.client.call_async("ak.wwise.core.object.get", {"from": {"ofType": ["Project"]}}))
+        futures.append(self.client.call_async("ak.wwise.idontexist"))
+
+        results = wait_all(futures, self.TIMEOUT_VALUE)
+        self.assertEqual(len(results), len(futures))
+        for result in results[:200]:
+            self.assertIn("version", result)
+        self.assertEqual(len(results[200].get("return")), 1)
+        self.assertIsNone(results[201])  # Noexcept
+
+    def test_call_async_as_completed(self):
+        futures = [self.client.call_async("ak.wwise.core.getInfo") for _ in range(50)]
+        completed = 0
+        for future in as_completed(futures, self.TIMEOUT_VALUE):
+            self.assertIn("version", future.result())
+            completed += 1
+        self.assertEqual(completed, len(futures))
+
+    def test_call_many(self):
+        calls = []
+        for index in range(100):
+            if index % 2:
+                calls.append("ak.wwise.core.getInfo")
+            else:
+                calls.append(("ak.wwise.core.object.get", {
+                    "from": {"ofType": ["Project"]},
+                    "options": {"return": ["name", "filePath"]}
+                }))
+        calls.append(("ak.wwise.idontexist", {}))
+        calls.append(("ak.wwise.waapi.getSchema", {"uri": "ak.wwise.core.getInfo"}))
+
+        results = self.client.call_many(calls)
+        self.assertEqual(len(results), len(calls))
+        for index, result in enumerate(results[:100]):
+            if index % 2:
+                self.assertIn("version", result)
+            else:
+                self.assertIn("filePath", result.get("return")[0])
+        self.assertIsNone(results[100])  # Noexcept, the remaining calls are done
+        self.assertIn("argsSchema", results[101])
+
+        # The options of the arguments are not consumed
+        self.assertIn("options", calls[0][1])
+
+    def test_call_many_stop_on_error(self):
+        # A single request in flight: the calls of the batch are all still queued when the error is received
+        with WaapiClient(max_in_flight=1) as client:
+            results = client.call_many(
+                [("ak.wwise.idontexist", {})] + ["ak.wwise.core.getInfo"] * 100,
+                stop_on_error=True
+            )
+        self.assertEqual(len(results), 101)
+        self.assertIsNone(results[0])
+        # The calls still queued when the error was received were not sent
+        self.assertEqual(results[1:], [None] * 100)
+
+    def test_call_many_empty(self):
+        self.assertEqual(self.client.call_many([]), [])
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from waapi import WaapiClient, WaapiRuntime, SequentialThreadExecutor
+from waapi.server import FakeWaapiServer
+
+
+class Runtime(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_shared_thread(self):
+        executor = SequentialThreadExecutor()
+        with FakeWaapiServer(port=0) as server, WaapiRuntime() as runtime:
+            first = WaapiClient(server.url, runtime=runtime, callback_executor=executor)
+            threads = threading.active_count()
+            clients = [WaapiClient(server.url, runtime=runtime, callback_executor=executor) for _ in range(5)]
+            self.assertEqual(threading.active_count(), threads)  # No thread per connection
+
+            for client in [first] + clients:
+                self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+            for client in [first] + clients:
+                self.assertTrue(client.disconnect())
+            self.assertTrue(runtime.is_running())
+        self.assertFalse(runtime.is_running())
+
+    def test_caller_loop(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            with FakeWaapiServer(port=0) as server, WaapiRuntime() as runtime:
+                with WaapiClient(server.url, runtime=runtime) as client:
+                    self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+            self.assertIs(asyncio.get_event_loop(), loop)
+            self.assertFalse(loop.is_closed())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    def test_connection_lost(self):
+        with WaapiRuntime() as runtime:
+            server = FakeWaapiServer(port=0).start()
+            client = WaapiClient(server.url, runtime=runtime)
+            server.stop()
+            self.assertIsNone(client.call("ak.wwise.core.getInfo"))
+            deadline = time.time() + self.TIMEOUT_VALUE
+            while client.is_connected() and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertFalse(client.is_connected())
+            self.assertFalse(client.disconnect())
+
+    def test_stopped_while_connected(self):
+        with FakeWaapiServer(port=0) as server:
+            runtime = WaapiRuntime()
+            client = WaapiClient(server.url, runtime=runtime)
+            self.assertTrue(client.is_connected())
+            runtime.stop()
+            self.assertFalse(client.is_connected())
+            self.assertIsNone(client.call("ak.wwise.core.getInfo"))
+            self.assertFalse(client.disconnect())
@@ -0,0 +1,56 @@
+import time
+import unittest
+
+from waapi import WaapiClient, AsyncWaapiClient
+from waapi.server import FakeWaapiServer, FAKE_TICK_TOPIC
+from waapi.wamp.async_compatibility import asyncio
+
+
+class SharedSubscription(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def _wait_for(self, predicate):
+        deadline = time.time() + self.TIMEOUT_VALUE
+        while not predicate() and time.time() < deadline:
+            time.sleep(0.01)
+        return predicate()
+
+    def test_same_options(self):
+        with FakeWaapiServer(port=0) as server, WaapiClient(server.url) as client:
+            first, second, other = [], [], []
+            first_handler = client.subscribe(FAKE_TICK_TOPIC, lambda **kwargs: first.append(kwargs["index"]))
+            second_handler = client.subscribe(FAKE_TICK_TOPIC, lambda **kwargs: second.append(kwargs["index"]))
+            client.subscribe(FAKE_TICK_TOPIC, lambda **kwargs: other.append(kwargs["index"]), {"return": ["id"]})
+            self.assertEqual(server.subscribe_count, 2)  # Different options are a different subscription
+
+            server.publish(FAKE_TICK_TOPIC, {"index": 0})
+            self.assertTrue(self._wait_for(lambda: first == second == other == [0]))
+
+            # The subscription remains on the server as long as one of its handlers remains
+            self.assertTrue(first_handler.unsubscribe())
+            server.publish(FAKE_TICK_TOPIC, {"index": 1})
+            self.assertTrue(self._wait_for(lambda: second == other == [0, 1]))
+            self.assertEqual(first, [0])
+            self.assertEqual(len(server._subscriptions), 2)
+
+            self.assertTrue(second_handler.unsubscribe())
+            self.assertEqual(len(server._subscriptions), 1)
+
+            # Subscribing again after the last handler left makes a new subscription
+            client.subscribe(FAKE_TICK_TOPIC, lambda **kwargs: first.append(kwargs["index"]))
+            self.assertEqual(server.subscribe_count, 3)
+
+    def test_concurrent(self):
+        async def subscribe_concurrently(url):
+            received = []
+            async with AsyncWaapiClient(url) as client:
+                handlers = await asyncio.gather(*[
+                    client.subscribe(FAKE_TICK_TOPIC, lambda **kwargs: received.append(kwargs["index"]))
+                    for _ in range(3)
+                ])
+                self.assertTrue(all(handlers))
+                return received
+
+        with FakeWaapiServer(port=0) as server:
+            asyncio.run(subscribe_concurrently(server.url))
+            self.assertEqual(server.subscribe_count, 1)
@@ -121,3 +121,24 @@ class SubscribeLowLevel(CleanConnectedClientTestCase):
         self._create_object()
         # No exception: the callback wrapper ignored the publish
         self._delete_object()
+
+    def test_subscribe_many(self):
+        self._delete_objects_if_exists()
+        created = Event()
+        handler = EventHandler()
+
+        handlers = self.client.subscribe_many([
+            ("ak.wwise.core.object.created", lambda object: created.set(), {"return": ["id", "name"]}),
+            ("i.dont.exist", None),
+            ("ak.wwise.core.object.nameChanged", handler)
+        ])
+        self.assertEqual(len(handlers), 3)
+        self.assertIsInstance(handlers[0], EventHandler)
+        self.assertIsNone(handlers[1])
+        self.assertIs(handlers[2], handler)
+        self.assertEqual(self.client.subscriptions(), {handlers[0], handler})
+
+        self._create_object()
+        self.assertTrue(created.wait(self.TIMEOUT_VALUE))
+        self._delete_object()
+        self.assertListEqual(self.client.subscribe_many([]), [])
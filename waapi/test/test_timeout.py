@@ -0,0 +1,97 @@
+import unittest
+from threading import Event
+
+from waapi import WaapiClient, AsyncWaapiClient, WaapiRequestTimeout
+from waapi.server import FakeWaapiServer
+from waapi.wamp.async_compatibility import asyncio
+from waapi.test.fixture import ConnectedClientTestCase
+
+
+class Timeout(ConnectedClientTestCase):
+    ATTEMPTS = 10
+
+    def _expire(self, request):
+        """
+        Do a request with an immediate timeout until it expires: on a local connection, the reply may still win the
+        race against the caller's thread
+        """
+        for _ in range(self.ATTEMPTS):
+            try:
+                result = request()
+            except WaapiRequestTimeout as e:
+                return e
+            if hasattr(result, "unsubscribe"):
+                result.unsubscribe()
+        self.fail("The request never timed out")
+
+    def test_call_timeout(self):
+        error = self._expire(lambda: self.client.call("ak.wwise.core.getInfo", timeout=0))
+        self.assertEqual(error.uri, "ak.wwise.core.getInfo")
+        self.assertIsInstance(error, TimeoutError)
+
+        # The late reply is ignored and the connection remains usable
+        for _ in range(10):
+            self.assertIn("version", self.client.call("ak.wwise.core.getInfo", timeout=self.TIMEOUT_VALUE))
+        self.assertTrue(self.client.is_connected())
+
+    def test_call_async_cancel(self):
+        futures = [self.client.call_async("ak.wwise.core.getInfo") for _ in range(20)]
+        for future in futures[::2]:
+            future.cancel()
+        for future in futures[1::2]:
+            self.assertIn("version", future.result(self.TIMEOUT_VALUE))
+        self.assertIn("version", self.client.call("ak.wwise.core.getInfo"))
+
+    def test_subscribe_timeout(self):
+        received = Event()
+        self._expire(
+            lambda: self.client.subscribe("ak.wwise.core.object.created", lambda *args, **kwargs: received.set(), timeout=0)
+        )
+        self.assertEqual(len(self.client.subscriptions()), 0)
+
+        # The subscription made by the server after the timeout is undone
+        created = self._create_object("TimeoutSubscription")
+        self.assertFalse(received.wait(0.5))
+        self.client.call("ak.wwise.core.object.delete", object=created.get("id"))
+        self.assertTrue(self.client.is_connected())
+
+    def test_default_timeout(self):
+        with WaapiClient(timeout=0) as client:
+            self._expire(lambda: client.call("ak.wwise.core.getInfo"))
+            self.assertIn("version", client.call("ak.wwise.core.getInfo", timeout=self.TIMEOUT_VALUE))
+
+
+class AsyncTimeout(unittest.IsolatedAsyncioTestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    async def test_call_timeout(self):
+        async with AsyncWaapiClient() as client:
+            with self.assertRaises(WaapiRequestTimeout):
+                await client.call("ak.wwise.core.getInfo", timeout=0)
+            self.assertEqual(len(client._session._call_reqs), 0)  # The pending request is forgotten
+            self.assertIn("version", await client.call("ak.wwise.core.getInfo", timeout=self.TIMEOUT_VALUE))
+
+    async def test_cancel(self):
+        async with AsyncWaapiClient() as client:
+            tasks = [asyncio.ensure_future(client.call("ak.wwise.core.getInfo")) for _ in range(20)]
+            await asyncio.sleep(0)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.assertEqual(len(client._session._call_reqs), 0)
+            self.assertIn("version", await client.call("ak.wwise.core.getInfo"))
+
+    async def test_abandoned_forgotten_on_disconnect(self):
+        with FakeWaapiServer(port=0, latency=1.0) as server:
+            client = await AsyncWaapiClient(server.url).connect()
+            session = client._session
+            with self.assertRaises(WaapiRequestTimeout):
+                await client.call("ak.wwise.core.getInfo", timeout=0.05)
+            self.assertEqual(len(session._abandoned_call_reqs), 1)  # Awaiting its late reply
+
+            await client.disconnect()
+            self.assertEqual(len(session._abandoned_call_reqs), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,24 @@
 import inspect
-import random
+import json
 import txaio
 from sys import stderr
-from threading import Thread, Event
+from threading import Thread, Event, Lock, Condition
+from concurrent.futures import InvalidStateError
 from pprint import pformat
 
 from waapi.wamp.async_compatibility import asyncio
-from waapi.wamp.interface import WampRequestType
+from waapi.wamp.interface import WampRequest, WampRequestType, OverflowPolicy, QueueOverflowError
+from waapi.wamp.json_serializer import FastJsonSerializer, find_raw_serializer
 
 from autobahn.asyncio.websocket import WampWebSocketClientFactory
 from autobahn.asyncio.wamp import ApplicationSession
 
 from autobahn.websocket.util import parse_url as parse_ws_url
 
-from autobahn.wamp import exception, uri
-from autobahn.wamp.message import Call, Subscribe
+from autobahn.wamp import exception, uri, message, serializer as wamp_serializer
+from autobahn.wamp.message import Call, Subscribe, Unsubscribe
 from autobahn.wamp.protocol import CallRequest, is_method_or_function
-from autobahn.wamp.request import Handler, SubscribeRequest
+from autobahn.wamp.request import Handler, SubscribeRequest, UnsubscribeRequest, Subscription
 from autobahn.wamp.types import SubscribeOptions
 
 
@@ -25,11 +27,34 @@ class AutobahnClientDecoupler:
     Decoupler for an autobahn client that indicates when the connection has been made and
     manages a queue for requests (WampRequest)
     """
-    def __init__(self, queue_size):
+    def __init__(self, queue_size, metrics=None, overflow=OverflowPolicy.BLOCK, overflow_counts=None):
+        """
+        :param queue_size: Maximum number of requests waiting to be sent, 0 for no limit
+        :type queue_size: int
+        :param metrics: Metrics collected on the requests, None to not measure them
+        :type metrics: ClientMetrics | None
+        :param overflow: Behavior when a request is put in the full queue
+        :type overflow: OverflowPolicy
+        :param overflow_counts: Counts of the "dropped" and "rejected" requests to update, e.g. shared by the
+                                successive connections of a client
+        :type overflow_counts: dict[str, int] | None
+        """
         self._request_queue = asyncio.Queue(queue_size)
-        self._future = None
         self._stopping = False
-        """:type: concurrent.futures.Future"""
+        self.metrics = metrics
+        self._overflow = overflow
+        self.overflow_counts = overflow_counts if overflow_counts is not None else {"dropped": 0, "rejected": 0}
+
+        # Futures of the callers blocked on a request, from any number of threads
+        self._caller_futures = set()
+        """:type: set[concurrent.futures.Future]"""
+        self._callers_lock = Lock()
+        self._callers_unblocked = False
+
+        # Requests admitted by caller threads and not yet taken from the queue, bounded by the queue size when the
+        # overflow policy blocks the callers
+        self._admitted = 0
+        self._admission = Condition()
 
         # Do not use the asyncio loop, otherwise failure to connect will stop
         # the loop and the caller will never be notified!
@@ -53,48 +78,197 @@ class AutobahnClientDecoupler:
         # On first reception of a STOP request, immediately complete other requests with None
         if request.request_type == WampRequestType.STOP and not self._stopping:
             self._stopping = True
+            self.__wake_admission()
         elif self._stopping:
+            self.__release(request)
+
             async def stop_now():
                 return request.future.set_result(None)
             return stop_now()
 
-        return self._request_queue.put(request)
+        if self._overflow is OverflowPolicy.BLOCK or request.request_type == WampRequestType.STOP:
+            return self._request_queue.put(request)
+        return self.__put_or_overflow(request)
 
-    def get_request(self):
+    async def __put_or_overflow(self, request):
+        """
+        Put a request in the queue, applying the overflow policy if it is full.
+        Decided when the coroutine runs on the loop: the queue may have been drained since the request was made.
+
+        :type request: WampRequest
+        """
+        if not self._request_queue.full():
+            self._request_queue.put_nowait(request)
+            return
+
+        if self._overflow is OverflowPolicy.RAISE:
+            self.overflow_counts["rejected"] += 1
+            request.future.set_exception(QueueOverflowError("The request queue is full"))
+            return
+
+        if self._overflow is OverflowPolicy.DROP_OLDEST:
+            try:
+                dropped = self._request_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                dropped = None
+            self._request_queue.put_nowait(request)
+            if dropped is None:
+                return
+        else:
+            dropped = request
+        self.overflow_counts["dropped"] += 1
+        if not dropped.future.done():
+            dropped.future.set_result(None)
+
+    def admit(self, request):
+        """
+        Block the calling thread until the queue has room for a request it submits, with the BLOCK overflow policy
+        and a bounded queue. Thread-safe, must not be called from the loop of the connection.
+        The callers are released once the connection stops.
+
+        :type request: WampRequest
+        """
+        if self._overflow is not OverflowPolicy.BLOCK or self._request_queue.maxsize <= 0:
+            return
+
+        with self._admission:
+            self._admission.wait_for(
+                lambda: self._admitted < self._request_queue.maxsize or self._stopping or self._callers_unblocked
+            )
+            self._admitted += 1
+        request.admitted = True
+
+    def __release(self, request):
+        """
+        Make room for another caller once an admitted request leaves the queue
+
+        :type request: WampRequest
+        """
+        if request.admitted:
+            request.admitted = False
+            with self._admission:
+                self._admitted -= 1
+                self._admission.notify()
+
+    def __wake_admission(self):
+        with self._admission:
+            self._admission.notify_all()
+
+    def submit(self, request):
+        """
+        Put a WampRequest in the decoupled client processing queue, from a callback of the loop of the connection.
+        The request is queued immediately when the queue has room, without creating a task.
+        :type request: WampRequest
+        """
+        if not self._stopping and request.request_type != WampRequestType.STOP and not self._request_queue.full():
+            self._request_queue.put_nowait(request)
+        else:
+            asyncio.ensure_future(self.put_request(request))
+
+    def is_stopping(self):
+        """
+        :return: True if a STOP request has been received, False otherwise.
+        :rtype: bool
+        """
+        return self._stopping
+
+    async def get_request(self):
         """
         Get a WampRequest from the decoupled client processing queue as a coroutine
         :return: Generator to a WampRequest when one is available
         """
-        return self._request_queue.get()
+        request = await self._request_queue.get()
+        self.__release(request)
+        return request
 
-    def set_caller_future(self, concurrent_future):
-        self._future = concurrent_future
+    def queue_depth(self):
+        """
+        :return: Number of requests waiting in the processing queue
+        :rtype: int
+        """
+        return self._request_queue.qsize()
 
-    def unblock_caller(self):
-        if self._future:
-            self._future.set_result(None)
+    def add_caller_future(self, concurrent_future):
+        """
+        Track the future a caller is blocked on until it completes, so it can be woken if the client dies.
+        Thread-safe: any number of threads may be blocked on their own request at the same time.
+
+        :type concurrent_future: concurrent.futures.Future
+        """
+        with self._callers_lock:
+            tracked = not self._callers_unblocked
+            if tracked:
+                self._caller_futures.add(concurrent_future)
+
+        if tracked:
+            concurrent_future.add_done_callback(self._discard_caller_future)
+        else:
+            # The client already terminated, the request will never be processed
+            self._unblock_future(concurrent_future)
+
+    def _discard_caller_future(self, concurrent_future):
+        with self._callers_lock:
+            self._caller_futures.discard(concurrent_future)
+
+    def unblock_callers(self):
+        """
+        Wake every caller still blocked on a request with a None result, and any caller to come
+        """
+        with self._callers_lock:
+            self._callers_unblocked = True
+            caller_futures = list(self._caller_futures)
+            self._caller_futures.clear()
 
+        for concurrent_future in caller_futures:
+            self._unblock_future(concurrent_future)
+        self.__wake_admission()
 
-def start_decoupled_autobahn_client(url, loop, akcomponent_factory, callback_executor, allow_exception, queue_size):
+    @staticmethod
+    def _unblock_future(concurrent_future):
+        try:
+            concurrent_future.set_result(None)
+        except InvalidStateError:
+            pass  # Completed concurrently
+
+
+def start_decoupled_autobahn_client(url, loop, akcomponent_factory, callback_executor, allow_exception, queue_size,
+                                    max_in_flight, serializers=None, metrics=None, overflow=OverflowPolicy.BLOCK,
+                                    overflow_counts=None, shared=False):
     """
-    Initialize a WAMP client runner in a separate thread with the provided asyncio loop
+    Initialize a WAMP client runner in a separate thread with the provided asyncio loop, or as a task of a loop
+    already run by another thread
 
     :type url: str
     :type loop: asyncio.AbstractEventLoop
-    :type akcomponent_factory: (AutobahnClientDecoupler, CallbackExecutor, bool) -> AkComponent
+    :type akcomponent_factory: (AutobahnClientDecoupler, CallbackExecutor, bool, int) -> AkComponent
     :type callback_executor: CallbackExecutor
     :type allow_exception: bool
     :type queue_size: int
-    :rtype: (Thread, AutobahnClientDecoupler)
+    :param max_in_flight: Maximum number of requests awaiting a reply at the same time
+    :type max_in_flight: int
+    :param serializers: Serializers to offer to the server in order of preference, see create_serializers
+    :type serializers: list[str | ISerializer] | None
+    :param metrics: Metrics collected on the requests, None to not measure them
+    :type metrics: ClientMetrics | None
+    :param overflow: Behavior when a request is put in the full queue
+    :type overflow: OverflowPolicy
+    :param overflow_counts: Counts of the "dropped" and "rejected" requests to update
+    :type overflow_counts: dict[str, int] | None
+    :param shared: True if the loop is run by another thread hosting many connections, e.g. a WaapiRuntime
+    :type shared: bool
+    :return: The runner, which is alive until the connection terminates, and its decoupler
+    :rtype: (Thread | _WampConnection, AutobahnClientDecoupler)
     """
-    decoupler = AutobahnClientDecoupler(queue_size)
+    decoupler = AutobahnClientDecoupler(queue_size, metrics, overflow, overflow_counts)
 
-    async_client_thread = _WampClientThread(
+    async_client_thread = (_WampConnection if shared else _WampClientThread)(
         url,
         loop,
         akcomponent_factory,
         callback_executor,
         allow_exception,
+        max_in_flight,
+        serializers,
         decoupler
     )
     async_client_thread.start()
@@ -102,17 +276,96 @@ def start_decoupled_autobahn_client(url, loop, akcomponent_factory, callback_exe
     return async_client_thread, decoupler
 
 
+SERIALIZER_CLASS_NAMES = {
+    "json": "JsonSerializer",
+    "msgpack": "MsgPackSerializer",
+    "cbor": "CBORSerializer",
+    "ubjson": "UBJSONSerializer"
+}
+
+
+def create_serializers(serializers):
+    """
+    Create the WAMP serializers to offer to the server, in order of preference.
+    JSON is always offered last if not requested, as the fallback every server supports.
+    JSON is handled by FastJsonSerializer, with the fastest JSON package installed.
+
+    :param serializers: Serializer names ("msgpack", "cbor", "ubjson" or "json") or autobahn serializer instances.
+                        Names of serializers whose package is not installed are skipped.
+    :type serializers: list[str | ISerializer] | None
+    :rtype: list[ISerializer]
+    :raises: ValueError
+    """
+    instances = []
+    for serializer in serializers or []:
+        if isinstance(serializer, str):
+            if serializer not in SERIALIZER_CLASS_NAMES:
+                raise ValueError("Unknown serializer: " + serializer)
+            if serializer == "json":
+                instances.append(FastJsonSerializer())
+                continue
+            # The class is only defined by autobahn when the underlying package can be imported
+            serializer_class = getattr(wamp_serializer, SERIALIZER_CLASS_NAMES[serializer], None)
+            if serializer_class is None:
+                continue
+            serializer = serializer_class()
+        instances.append(serializer)
+
+    if not any(instance.SERIALIZER_ID == FastJsonSerializer.SERIALIZER_ID for instance in instances):
+        instances.append(FastJsonSerializer())
+    return instances
+
+
+async def connect_autobahn_client(url, loop, session_factory, serializers=None):
+    """
+    Open a WAMP-over-WebSocket connection to the provided URL on an asyncio loop
+
+    :type url: str
+    :type loop: asyncio.AbstractEventLoop
+    :param session_factory: Factory creating the session (AkComponent) once the transport is open
+    :type session_factory: () -> AkComponent
+    :param serializers: Serializers to offer to the server in order of preference, see create_serializers
+    :type serializers: list[str | ISerializer] | None
+    :return: Transport and protocol of the connection
+    :rtype: (asyncio.Transport, WampWebSocketClientProtocol)
+    """
+    # create a WAMP-over-WebSocket transport client factory
+    transport_factory = WampWebSocketClientFactory(
+        session_factory,
+        url=url,
+        serializers=create_serializers(serializers)
+    )
+
+    # Basic settings with most features disabled
+    transport_factory.setProtocolOptions(
+        failByDrop=False,
+        openHandshakeTimeout=5.,
+        closeHandshakeTimeout=1.
+    )
+
+    isSecure, host, port, _, _, _ = parse_ws_url(url)
+    return await loop.create_connection(
+        transport_factory,
+        host,
+        port,
+        ssl=isSecure
+    )
+
+
 class _WampClientThread(Thread):
-    def __init__(self, url, loop, akcomponent_factory, callback_executor, allow_exception, decoupler):
+    def __init__(self, url, loop, akcomponent_factory, callback_executor, allow_exception, max_in_flight, serializers,
+                 decoupler):
         """
         WAMP client thread that runs the asyncio main event loop
         Do NOT terminate this thread to stop the client: use the decoupler to send a STOP request.
 
         :type url: str
         :type loop: asyncio.AbstractEventLoop
-        :type akcomponent_factory: (AutobahnClientDecoupler, CallbackExecutor, bool) -> AkComponent
+        :type akcomponent_factory: (AutobahnClientDecoupler, CallbackExecutor, bool, int) -> AkComponent
         :type callback_executor: CallbackExecutor
         :type allow_exception: bool
+        :type max_in_flight: int
+        :type serializers: list[str | ISerializer] | None
         :type decoupler: AutobahnClientDecoupler
         """
         super(_WampClientThread, self).__init__()
@@ -122,35 +375,30 @@ class _WampClientThread(Thread):
         self._akcomponent_factory = akcomponent_factory
         self._callback_executor = callback_executor
         self._allow_exception = allow_exception
+        self._max_in_flight = max_in_flight
+        self._serializers = serializers
 
     def run(self):
         try:
             asyncio.set_event_loop(self._loop)
 
+            # Do not configure a global txaio loop: futures are created on the loop of the calling thread,
+            # allowing many clients (threaded or not) to live in the same process
             txaio.use_asyncio()
-            txaio.config.loop = self._loop
-
-            # create a WAMP-over-WebSocket transport client factory
-            transport_factory = WampWebSocketClientFactory(
-                lambda: self._akcomponent_factory(self._decoupler, self._callback_executor, self._allow_exception),
-                url=self._url
-            )
 
-            # Basic settings with most features disabled
-            transport_factory.setProtocolOptions(
-                failByDrop=False,
-                openHandshakeTimeout=5.,
-                closeHandshakeTimeout=1.
-            )
+            def create_session():
+                session = self._akcomponent_factory(
+                    self._decoupler,
+                    self._callback_executor,
+                    self._allow_exception,
+                    self._max_in_flight
+                )
+                # This thread owns the loop: stop it on disconnection, ultimately terminating the thread
+                session.on("disconnect", lambda *args, **kwargs: self._loop.stop())
+                return session
 
-            isSecure, host, port, _, _, _ = parse_ws_url(self._url)
             transport, protocol = self._loop.run_until_complete(
-                self._loop.create_connection(
-                    transport_factory,
-                    host,
-                    port,
-                    ssl=isSecure
-                )
+                connect_autobahn_client(self._url, self._loop, create_session, self._serializers)
             )
 
             try:
@@ -165,6 +413,12 @@ class _WampClientThread(Thread):
             if protocol._session:
                 self._loop.run_until_complete(protocol._session.leave())
 
+            # A lost connection leaves the session's request loop waiting on the queue
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
             self._loop.close()
         except Exception as e:
             errorStr = pformat(e)
@@ -174,7 +428,80 @@ class _WampClientThread(Thread):
             # error can be detected by checking if the thread is alive
             self._decoupler.set_joined()
 
-        self._decoupler.unblock_caller()
+        self._decoupler.unblock_callers()
+
+
+class _WampConnection:
+    def __init__(self, url, loop, akcomponent_factory, callback_executor, allow_exception, max_in_flight, serializers,
+                 decoupler):
+        """
+        WAMP client runner hosted as a task on a loop run by another thread, with the interface of _WampClientThread:
+        it is alive until the connection terminates.
+        Do NOT cancel its task to stop the client: use the decoupler to send a STOP request.
+
+        :type url: str
+        :type loop: asyncio.AbstractEventLoop
+        :type akcomponent_factory: (AutobahnClientDecoupler, CallbackExecutor, bool, int) -> AkComponent
+        :type callback_executor: CallbackExecutor
+        :type allow_exception: bool
+        :type max_in_flight: int
+        :type serializers: list[str | ISerializer] | None
+        :type decoupler: AutobahnClientDecoupler
+        """
+        self._url = url
+        self._loop = loop
+        self._decoupler = decoupler
+        self._akcomponent_factory = akcomponent_factory
+        self._callback_executor = callback_executor
+        self._allow_exception = allow_exception
+        self._max_in_flight = max_in_flight
+        self._serializers = serializers
+        self._terminated = Event()
+
+    def start(self):
+        asyncio.run_coroutine_threadsafe(self._run(), self._loop)
+
+    def is_alive(self):
+        return not self._terminated.is_set()
+
+    def join(self, timeout=None):
+        self._terminated.wait(timeout)
+
+    async def _run(self):
+        transport = None
+        try:
+            def create_session():
+                return self._akcomponent_factory(
+                    self._decoupler,
+                    self._callback_executor,
+                    self._allow_exception,
+                    self._max_in_flight
+                )
+
+            transport, protocol = await connect_autobahn_client(
+                self._url, self._loop, create_session, self._serializers
+            )
+            # Shielded: cancelling the task must not cancel the future that autobahn resolves on closure
+            await asyncio.shield(protocol.is_closed)
+
+            # The loop is not stopped: a lost connection leaves the session's request loop waiting on the queue
+            if not self._decoupler.is_stopping():
+                stop = WampRequest(WampRequestType.STOP, future=self._loop.create_future())
+                await self._decoupler.put_request(stop)
+        except asyncio.CancelledError:
+            # The runtime stopped with the connection open: drop it, the session is notified once the loop runs the
+            # callbacks of the closed transport
+            if transport is not None:
+                transport.close()
+            raise
+        except Exception as e:
+            errorStr = pformat(e)
+            stderr.write(errorStr + "\n")
+        finally:
+            # Wake the caller if the session never joined, then terminate like the thread of a client
+            self._decoupler.set_joined()
+            self._decoupler.unblock_callers()
+            self._terminated.set()
 
 
 class AkCall(Call):
@@ -210,15 +537,147 @@ class AkSubscribe(Subscribe):
         return [Subscribe.MESSAGE_TYPE, self.request, self.options, self.topic]
 
 
+def _chain(source, target):
+    """
+    Complete the target future with the outcome of the source future, unless the target is already done
+
+    :type source: asyncio.Future
+    :type target: asyncio.Future
+    """
+    def on_done(future):
+        if target.done():
+            return
+        if future.cancelled():
+            target.cancel()
+        elif future.exception() is not None:
+            target.set_exception(future.exception())
+        else:
+            target.set_result(future.result())
+    source.add_done_callback(on_done)
+
+
+def _subscription_key(topic, options):
+    """
+    :return: Key identifying the subscriptions receiving the same events: the topic and the canonical options
+    :rtype: (str, str)
+    """
+    return topic, json.dumps(options or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
 class AkComponent(ApplicationSession):
+    def __init__(self, *args, **kwargs):
+        super(AkComponent, self).__init__(*args, **kwargs)
+
+        # Requests whose future was cancelled (e.g. on timeout): their late reply must be ignored,
+        # autobahn considers a reply to an unknown request a protocol violation
+        self._abandoned_call_reqs = set()
+        self._abandoned_subscriptions = set()
+
+        # Calls whose result is the undecoded JSON of their keyword arguments
+        self._raw_call_reqs = set()
+
+        # Handlers subscribing with the same topic and options share a single subscription on the server: autobahn
+        # fans each event out to all the handlers of a subscription, and only unsubscribes from the server when the
+        # last of them unsubscribes
+        self._shared_subscriptions = {}
+        """:type: dict[(str, str), int]"""
+        self._pending_subscriptions = {}
+        """:type: dict[(str, str), asyncio.Future]"""
+
+    def onDisconnect(self):
+        # Replies to the abandoned requests can no longer arrive
+        self._abandoned_call_reqs.clear()
+        self._abandoned_subscriptions.clear()
+        super(AkComponent, self).onDisconnect()
+
+    def onMessage(self, msg):
+        """
+        Reimplemented to ignore late replies to abandoned requests
+        """
+        if isinstance(msg, message.Result) or \
+                (isinstance(msg, message.Error) and msg.request_type == Call.MESSAGE_TYPE):
+            if msg.request in self._abandoned_call_reqs:
+                self._abandoned_call_reqs.discard(msg.request)
+                return
+            if isinstance(msg, message.Result) and msg.request in self._raw_call_reqs:
+                self.__complete_raw_call(msg)
+                return
+
+        elif isinstance(msg, message.Subscribed):
+            request = self._subscribe_reqs.get(msg.request)
+            if request is not None and request.on_reply.cancelled():
+                del self._subscribe_reqs[msg.request]
+                if msg.subscription not in self._subscriptions:
+                    self.__unsubscribe_abandoned(msg.subscription)
+                return
+            self._abandoned_subscriptions.discard(msg.subscription)
+
+        elif isinstance(msg, message.Event):
+            if msg.subscription in self._abandoned_subscriptions:
+                return
+
+        super(AkComponent, self).onMessage(msg)
+
+    def __unsubscribe_abandoned(self, subscription_id):
+        """
+        Unsubscribe from a subscription made by the server for a cancelled request, ignoring its remaining events
+        """
+        self._abandoned_subscriptions.add(subscription_id)
+        request_id = self._request_id_gen.next()
+        self._unsubscribe_reqs[request_id] = UnsubscribeRequest(request_id, txaio.create_future(), subscription_id)
+        self._transport.send(Unsubscribe(request_id, subscription_id))
+
     def call(self, procedure, *args, **kwargs):
         """
         Reimplemented to support calls with custom options
         """
+        return self.__send_call(procedure, args, kwargs)[1]
+
+    def call_raw(self, procedure, *args, **kwargs):
+        """
+        Call a procedure whose result is the JSON of its keyword arguments, as bytes.
+        With FastJsonSerializer, the keyword arguments are not decoded, otherwise they are encoded again.
+
+        :rtype: asyncio.Future
+        """
+        request_id, on_reply = self.__send_call(procedure, args, kwargs)
+        raw_serializer = find_raw_serializer(self._transport)
+        self._raw_call_reqs.add(request_id)
+        if raw_serializer is not None:
+            raw_serializer.raw_requests.add(request_id)
+
+        def on_done(_):
+            self._raw_call_reqs.discard(request_id)
+            if raw_serializer is not None:
+                raw_serializer.raw_requests.discard(request_id)
+                raw_serializer.raw_results.pop(request_id, None)
+
+        on_reply.add_done_callback(on_done)
+        return on_reply
+
+    def __complete_raw_call(self, msg):
+        """
+        :type msg: message.Result
+        """
+        raw_serializer = find_raw_serializer(self._transport)
+        raw = raw_serializer.raw_results.pop(msg.request, None) if raw_serializer is not None else None
+        if raw is None:
+            raw = json.dumps(msg.kwargs or {}, separators=(",", ":"), ensure_ascii=False).encode("utf8")
+
+        call_request = self._call_reqs.pop(msg.request, None)
+        if call_request is not None and not call_request.on_reply.done():
+            call_request.on_reply.set_result(raw)
+
+    def __send_call(self, procedure, args, kwargs):
+        """
+        :return: Request id and future to the reply of the call
+        :rtype: (int, asyncio.Future)
+        """
         if not self._transport:
             raise exception.TransportLost()
 
-        request_id = random.randint(0, 9007199254740992)
+        # Sequential ids guarantee uniqueness among the many calls that can be in flight at once
+        request_id = self._request_id_gen.next()
         on_reply = txaio.create_future()
         self._call_reqs[request_id] = CallRequest(request_id, procedure, on_reply, {})
 
@@ -228,16 +687,67 @@ class AkComponent(ApplicationSession):
             if request_id in self._call_reqs:
                 del self._call_reqs[request_id]
             raise e
-        return on_reply
+
+        def on_done(future):
+            # A cancelled call no longer awaits its reply: forget the pending request
+            if future.cancelled() and self._call_reqs.pop(request_id, None) is not None:
+                self._abandoned_call_reqs.add(request_id)
+
+        on_reply.add_done_callback(on_done)
+        return request_id, on_reply
 
     def _subscribe(self, obj, fn, topic, options):
+        key = _subscription_key(topic, options)
+        handler_obj = Handler(fn, obj, None)
+
+        if self._subscriptions.get(self._shared_subscriptions.get(key)):
+            return txaio.create_future_success(self.__share_subscription(key, topic, handler_obj))
+
+        pending = self._pending_subscriptions.get(key)
+        if pending is None:
+            return self.__send_subscribe(key, topic, options, handler_obj)
+
+        # Join the subscription being made with the same topic and options
+        on_reply = txaio.create_future()
+
+        def on_subscribed(future):
+            if on_reply.done():
+                return  # Cancelled while waiting
+            if not future.cancelled() and future.exception() is not None:
+                on_reply.set_exception(future.exception())
+            elif self._subscriptions.get(self._shared_subscriptions.get(key)):
+                on_reply.set_result(self.__share_subscription(key, topic, handler_obj))
+            else:
+                # The subscription was abandoned or already left by its handlers
+                _chain(self._subscribe(obj, fn, topic, options), on_reply)
+
+        pending.add_done_callback(on_subscribed)
+        return on_reply
+
+    def __send_subscribe(self, key, topic, options, handler_obj):
         request_id = self._request_id_gen.next()
         on_reply = txaio.create_future()
-        handler_obj = Handler(fn, obj, None)
         self._subscribe_reqs[request_id] = SubscribeRequest(request_id, topic, on_reply, handler_obj)
         self._transport.send(AkSubscribe(request_id, topic, options))
+
+        def on_subscribed(future):
+            if self._pending_subscriptions.get(key) is future:
+                del self._pending_subscriptions[key]
+            if not future.cancelled() and future.exception() is None:
+                self._shared_subscriptions[key] = future.result().id
+
+        self._pending_subscriptions[key] = on_reply
+        on_reply.add_done_callback(on_subscribed)
         return on_reply
 
+    def __share_subscription(self, key, topic, handler_obj):
+        """
+        Add a handler to the subscription of the server made with the same topic and options
+        """
+        subscription = Subscription(self._shared_subscriptions[key], topic, self, handler_obj)
+        self._subscriptions[subscription.id].append(subscription)
+        return subscription
+
     def subscribe(self, handler, topic=None, options=None):
         """
         Implements :func:`autobahn.wamp.interfaces.ISubscriber.subscribe`
@@ -1,48 +1,82 @@
+import time
 from txaio import make_logger
 from pprint import pformat
 from threading import Thread
 
 from autobahn.wamp import ApplicationError
 
-from waapi.client.interface import CallbackExecutor
-from waapi.wamp.interface import WampRequestType, WampRequest, WaapiRequestFailed
+from waapi.client.interface import CallbackExecutor, ForwardingExecutor
+from waapi.wamp.interface import WampRequestType, WampRequest, WaapiRequestFailed, DEFAULT_MAX_IN_FLIGHT
 from waapi.wamp.ak_autobahn import AkComponent
 from waapi.wamp.async_compatibility import asyncio
 
 logger = make_logger()
 
+
+def _cancel_threadsafe(task):
+    """
+    Cancel a task of the loop of the connection from any thread
+
+    :type task: asyncio.Task
+    """
+    try:
+        task.get_loop().call_soon_threadsafe(task.cancel)
+    except RuntimeError:
+        pass  # The loop was closed, along with its tasks
+
 class WampClientAutobahn(AkComponent):
     """
     Implementation class of a Waapi client using the autobahn library
     """
 
-    def __init__(self, decoupler, callback_executor, allow_exception):
+    def __init__(self, decoupler, callback_executor, allow_exception, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
         """
         :type decoupler: AutobahnClientDecoupler
         :type callback_executor: CallbackExecutor
         :param allow_exception: True to allow exception, False to ignore them.
                                 In any case they are logged to stderr.
         :type allow_exception: bool
+        :param max_in_flight: Maximum number of requests sent and awaiting a reply at the same time
+        :type max_in_flight: int
         """
         super(WampClientAutobahn, self).__init__()
         self._decoupler = decoupler
         self._callback_executor = callback_executor
         self._allow_exception = allow_exception
+        self._max_in_flight = max_in_flight
+        self._callback_executor_started = False
+        # Executors of the subscriptions holding events back, flushed when the connection closes
+        self._forwarding_executors = set()
+        """:type: set[ForwardingExecutor]"""
+        self._handlers = {
+            WampRequestType.STOP: self.stop_handler,
+            WampRequestType.CALL: self.call_handler,
+            WampRequestType.SUBSCRIBE: self.subscribe_handler,
+            WampRequestType.UNSUBSCRIBE: self.unsubscribe_handler
+        }
+
+    # Debug messages are only formatted once enabled, keeping them off the path of each request
+    _debug_log = False
 
     @classmethod
     def enable_debug_log(cls):
+        cls._debug_log = True
         logger._set_log_level('debug')
 
     @classmethod
-    def _log(cls, msg):
-        logger.debug("WampClientAutobahn: {}".format(msg))
+    def _log(cls, msg, *args):
+        """
+        :param msg: Message, formatted with the arguments if the debug log is enabled
+        :type msg: str
+        """
+        if cls._debug_log:
+            logger.debug("WampClientAutobahn: {msg}", msg=msg.format(*args))
 
     async def stop_handler(self, request):
         """
         :param request: WampRequest
         """
         self._log("Received STOP, stopping and setting the result")
-        self._callback_executor.stop()
         self.disconnect()
         self._log("Disconnected")
         request.future.set_result(True)
@@ -51,13 +85,16 @@ class WampClientAutobahn(AkComponent):
         """
         :param request: WampRequest
         """
-        self._log("Received CALL, calling " + request.uri)
-        res = await self.call(request.uri, **request.kwargs)
+        self._log("Received CALL, calling {}", request.uri)
+        if request.raw:
+            result = await self.call_raw(request.uri, **request.kwargs)
+        else:
+            res = await self.call(request.uri, **request.kwargs)
+            result = res.kwresults if res else {}
         self._log("Received response for call")
-        result = res.kwresults if res else {}
         if request.callback:
             self._log("Callback specified, calling it")
-            callback = _WampCallbackHandler(request.callback, self._callback_executor)
+            callback = _WampCallbackHandler(request.callback, self._callback_executor, self._decoupler.metrics)
             callback(result)
         request.future.set_result(result)
 
@@ -65,34 +102,111 @@ class WampClientAutobahn(AkComponent):
         """
         :param request: WampRequest
         """
-        self._log("Received SUBSCRIBE, subscribing to " + request.uri)
-        callback = _WampCallbackHandler(request.callback, self._callback_executor)
+        self._log("Received SUBSCRIBE, subscribing to {}", request.uri)
+        executor = request.executor or self._callback_executor
+        metrics = self._decoupler.metrics
+        if isinstance(executor, ForwardingExecutor):
+            # The executor of the subscription runs on this thread and forwards to the executor of this connection
+            executor.target = self._callback_executor
+            executor.metrics, metrics = metrics, None
+        callback = _WampCallbackHandler(request.callback, executor, metrics)
         subscription = await (self.subscribe(
             callback,
             topic=request.uri,
             options=request.kwargs)
         )
+        if isinstance(executor, ForwardingExecutor):
+            self._forwarding_executors.add(executor)
         request.future.set_result(subscription)
 
     async def unsubscribe_handler(self, request):
         """
         :param request: WampRequest
         """
-        self._log("Received UNSUBSCRIBE, unsubscribing from " + str(request.subscription))
+        self._log("Received UNSUBSCRIBE, unsubscribing from {}", request.subscription)
         try:
             # Successful unsubscribe returns nothing
             await request.subscription.unsubscribe()
-            request.future.set_result(True)
+            result = True
         except ApplicationError:
-            request.future.set_result(False)
+            result = False
         except Exception as e:
-            self._log(str(e))
-            request.future.set_result(False)
+            self._log("{}", e)
+            result = False
+
+        # Events held back by the subscription are delivered before the unsubscription completes
+        if isinstance(request.executor, ForwardingExecutor):
+            self._forwarding_executors.discard(request.executor)
+            request.executor.flush()
+        request.future.set_result(result)
+
+    async def process_request(self, request):
+        """
+        Dispatch a request to its handler and complete its future on failure
+
+        :param request: WampRequest
+        """
+        metrics = self._decoupler.metrics
+        if metrics is not None and request.submitted is None:
+            metrics = None  # Internal request of the client
+
+        if request.future.done():
+            self._log("Request cancelled before being sent")
+            if metrics is not None:
+                metrics._record_request(request, None, time.perf_counter(), "cancelled")
+            return
+
+        handler = self._handlers.get(request.request_type)
+
+        sent = time.perf_counter() if metrics is not None else None
+        error = None
+        try:
+            if handler:
+                await handler(request)
+            else:
+                self._log("Undefined WampRequestType")
+        except ApplicationError as e:
+            error = "failed"
+            sanitized_exception_str = str(e).replace("{", "{{").replace("}", "}}")
+            error_message = "WampClientAutobahn (ERROR): " + pformat(sanitized_exception_str)
+            logger.error(error_message)
+
+            if request.future.done():
+                pass  # Cancelled while in flight
+            elif self._allow_exception:
+                request.future.set_exception(WaapiRequestFailed(e))
+            else:
+                request.future.set_result(None)
+        except Exception as e:
+            # Any other failure (e.g. transport lost) must still release the caller
+            error = "lost"
+            self._log("{}", e)
+            if not request.future.done():
+                request.future.set_result(None)
+        except asyncio.CancelledError:
+            error = "cancelled"
+            raise
+        finally:
+            if metrics is not None:
+                metrics._record_request(request, sent, time.perf_counter(), error)
+
+        self._log("Done treating request")
 
     async def onJoin(self, details):
         self._log("Joined!")
         self._decoupler.set_joined()
         self._callback_executor.start()
+        self._callback_executor_started = True
+
+        in_flight_slots = asyncio.Semaphore(self._max_in_flight)
+        in_flight = set()
+        metrics = self._decoupler.metrics
+
+        def on_request_done(task):
+            in_flight.discard(task)
+            in_flight_slots.release()
+            if metrics is not None:
+                metrics._add_in_flight(-1)
 
         try:
             while True:
@@ -101,33 +215,28 @@ class WampClientAutobahn(AkComponent):
                 """:type: WampRequest"""
                 self._log("Received something!")
 
-                try:
-                    handler = {
-                        WampRequestType.STOP: self.stop_handler,
-                        WampRequestType.CALL: self.call_handler,
-                        WampRequestType.SUBSCRIBE: self.subscribe_handler,
-                        WampRequestType.UNSUBSCRIBE: self.unsubscribe_handler
-                    }.get(request.request_type)
-
-                    if handler:
-                        await handler(request)
-                    else:
-                        self._log("Undefined WampRequestType")
-                except ApplicationError as e:
-                    sanitized_exception_str = str(e).replace("{", "{{").replace("}", "}}")
-                    error_message = "WampClientAutobahn (ERROR): " + pformat(sanitized_exception_str)
-                    logger.error(error_message)
-
-                    if self._allow_exception:
-                        request.future.set_exception(WaapiRequestFailed(e))
-                    else:
-                        request.future.set_result(None)
-
-                self._log("Done treating request")
-
                 if request.request_type == WampRequestType.STOP:
+                    # Let the requests already on the wire complete before stopping
+                    if in_flight:
+                        await asyncio.wait(in_flight)
+                    await self.process_request(request)
                     break
 
+                # Each request runs as its own task so multiple CALLs can be in flight on the socket,
+                # replies are matched back to their request by the session using the request id
+                await in_flight_slots.acquire()
+                task = asyncio.ensure_future(self.process_request(request))
+                in_flight.add(task)
+                task.add_done_callback(on_request_done)
+                if metrics is not None:
+                    metrics._add_in_flight(1)
+
+                # The caller cancels the request future on timeout, which stops waiting for the reply.
+                # The future of a synchronous caller is cancelled from its own thread.
+                request.future.add_done_callback(
+                    lambda future, request_task=task: _cancel_threadsafe(request_task) if future.cancelled() else None
+                )
+
         except RuntimeError:
             # The loop has been shut down by a disconnect
             pass
@@ -135,19 +244,34 @@ class WampClientAutobahn(AkComponent):
     def onDisconnect(self):
         self._log("The client was disconnected.")
 
-        # Stop the asyncio loop, ultimately stopping the runner thread
-        asyncio.get_event_loop().stop()
+        # Deliver the events held back by subscriptions, before the executor stops
+        forwarding_executors, self._forwarding_executors = self._forwarding_executors, set()
+        for executor in forwarding_executors:
+            executor.flush()
+
+        # Stop the executor whether the disconnection was requested or the connection was lost
+        if self._callback_executor_started:
+            self._callback_executor_started = False
+            self._callback_executor.stop()
+
+        # Release any request still awaiting a reply, the owner of the loop is notified through
+        # the "disconnect" event which is fired after this method returns
+        super(WampClientAutobahn, self).onDisconnect()
 
 class _WampCallbackHandler:
     """
     Wrapper for a callback that unwraps a WAMP response
     """
-    def __init__(self, callback, executor):
+    def __init__(self, callback, executor, metrics=None):
         assert callable(callback)
         assert isinstance(executor, CallbackExecutor)
         self._callback = callback
         self._executor = executor
+        self._metrics = metrics
 
     def __call__(self, *args, **kwargs):
         if self._callback and callable(self._callback):
-            self._executor.execute(self._callback, kwargs)
+            if self._metrics is not None:
+                self._executor.execute(self._metrics._wrap_callback(self._callback), kwargs)
+            else:
+                self._executor.execute(self._callback, kwargs)
@@ -1,7 +1,7 @@
 from enum import Enum
 
-from autobahn.wamp.request import Subscription
-from autobahn.wamp import ApplicationError
+# Maximum number of requests of a connection sent to the server and awaiting a reply at the same time, by default
+DEFAULT_MAX_IN_FLIGHT = 128
 
 
 class CannotConnectToWaapiException(Exception):
@@ -28,6 +28,47 @@ class WaapiRequestFailed(Exception):
         return str(self._error)
 
 
+class WaapiRequestTimeout(TimeoutError):
+    def __init__(self, uri, timeout):
+        """
+        :param uri: URI of the request that did not complete in time
+        :type uri: str
+        :param timeout: Timeout in seconds that elapsed
+        :type timeout: float
+        """
+        super(WaapiRequestTimeout, self).__init__(uri, timeout)
+        self._uri = uri
+        self._timeout = timeout
+
+    @property
+    def uri(self):
+        return self._uri
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    def __str__(self):
+        return "{} did not complete within {} seconds".format(self._uri, self._timeout)
+
+
+class QueueOverflowError(Exception):
+    """
+    A request or an event was rejected by a full queue whose overflow policy is OverflowPolicy.RAISE
+    """
+    pass
+
+
+class OverflowPolicy(Enum):
+    """
+    Behavior of a bounded queue when it is full
+    """
+    BLOCK = "block"  # Wait for room in the queue
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest item of the queue to make room
+    DROP_NEWEST = "drop_newest"  # Discard the new item
+    RAISE = "raise"  # Reject the new item with QueueOverflowError
+
+
 class WampRequestType(Enum):
     STOP = 0,
     CALL = 1,
@@ -40,7 +81,8 @@ class WampRequest:
     Structure meant to be used as a payload for requests to a WAMP decoupled client
     """
 
-    def __init__(self, request_type, uri=None, kwargs=None, callback=None, subscription=None, future=None):
+    def __init__(self, request_type, uri=None, kwargs=None, callback=None, subscription=None, future=None,
+                 executor=None, raw=False):
         """
         :type request_type: WampRequestType
         :type uri: str | None
@@ -49,6 +91,10 @@ class WampRequest:
         :type subscription: Subscription | None
         :param future: Result future to complete upon processing of the request
         :type future: asyncio.Future
+        :param executor: Executor of the callback, None for the executor of the client
+        :type executor: CallbackExecutor | None
+        :param raw: For a CALL, complete the future with the JSON of the result as bytes instead of a dict
+        :type raw: bool
         """
         self.request_type = request_type
         self.uri = uri
@@ -56,3 +102,11 @@ class WampRequest:
         self.subscription = subscription
         self.callback = callback
         self.future = future
+        self.executor = executor
+        self.raw = raw
+
+        # Time when the caller submitted the request, only measured when the client collects metrics
+        self.submitted = None
+
+        # Whether the request holds a place in the queue of the decoupler until it is taken from it
+        self.admitted = False
@@ -0,0 +1,191 @@
+import json
+import re
+
+import waapi.wamp.async_compatibility  # noqa: F401, selects asyncio for txaio before autobahn is imported
+from autobahn.wamp import serializer as wamp_serializer
+from autobahn.wamp.interfaces import IObjectSerializer, ISerializer
+from autobahn.wamp.message import Result
+
+# JSON packages used to encode and decode messages, in order of preference when installed
+JSON_BACKENDS = ("orjson", "ujson", "json")
+
+# Start of a RESULT message, up to its request id
+_RESULT_PREFIX = re.compile(rb"\[\s*" + str(Result.MESSAGE_TYPE).encode() + rb"\s*,\s*(\d+)\s*,\s*")
+_SEPARATOR = re.compile(r"\s*,\s*")
+_DECODER = json.JSONDecoder()
+
+
+def _load_backend(name):
+    """
+    :param name: Name of the JSON package
+    :type name: str
+    :return: Function decoding bytes and function encoding to bytes, None if the package is not installed
+    :rtype: ((bytes) -> Any, (Any) -> bytes) | None
+    :raises: ValueError
+    """
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            return None
+        return orjson.loads, lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    if name == "ujson":
+        try:
+            import ujson
+        except ImportError:
+            return None
+        return ujson.loads, \
+            lambda obj: ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf8")
+
+    if name == "json":
+        return json.loads, lambda obj: json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf8")
+
+    raise ValueError("Unknown JSON backend: " + name)
+
+
+def available_json_backends():
+    """
+    :return: Names of the JSON packages installed, in order of preference
+    :rtype: list[str]
+    """
+    return [name for name in JSON_BACKENDS if _load_backend(name) is not None]
+
+
+class FastJsonObjectSerializer:
+    """
+    JSON object serializer delegating to the fastest JSON package installed.
+    Binary strings are not supported, which WAAPI does not use.
+
+    The keyword arguments of the RESULT messages of requests registered in raw_requests are not decoded: their JSON
+    is kept as bytes in raw_results by request id, and the message is decoded without them.
+    """
+    NAME = "json"
+    BINARY = False
+
+    def __init__(self, backend=None):
+        """
+        :param backend: Name of the JSON package (see JSON_BACKENDS), None for the first one installed
+        :type backend: str | None
+        :raises: ValueError
+        """
+        for name in [backend] if backend is not None else JSON_BACKENDS:
+            functions = _load_backend(name)
+            if functions is not None:
+                self.backend = name
+                self._loads, self._dumps = functions
+                break
+        else:
+            raise ValueError("JSON backend not installed: " + backend)
+
+        self.raw_requests = set()
+        """:type: set[int]"""
+        self.raw_results = {}
+        """:type: dict[int, bytes]"""
+
+    def serialize(self, obj):
+        return self._dumps(obj)
+
+    def unserialize(self, payload):
+        if self.raw_requests:
+            match = _RESULT_PREFIX.match(payload)
+            if match is not None and int(match.group(1)) in self.raw_requests:
+                raw_msg = self._split_result(payload, int(match.group(1)), match.end())
+                if raw_msg is not None:
+                    return [raw_msg]
+        return [self._loads(payload)]
+
+    def _split_result(self, payload, request_id, start):
+        """
+        Decode a RESULT message except for its keyword arguments, which are stored in raw_results
+
+        :type payload: bytes
+        :type request_id: int
+        :param start: Offset of the details of the message, after its request id
+        :type start: int
+        :return: The message without its keyword arguments, None if it does not have the expected layout
+        :rtype: list | None
+        """
+        text = payload.decode("utf8")
+        raw_msg = [Result.MESSAGE_TYPE, request_id]
+        index = start
+        try:
+            # Details and positional arguments, before the keyword arguments
+            for _ in range(2):
+                value, index = _DECODER.raw_decode(text, index)
+                raw_msg.append(value)
+                separator = _SEPARATOR.match(text, index)
+                if separator is None:
+                    break
+                index = separator.end()
+            else:
+                # Only the prefix of the message is encoded again to find the offset of the keyword arguments
+                raw = payload[len(text[:index].encode("utf8")):].rstrip()
+                if not raw.endswith(b"]"):
+                    return None
+                self.raw_results[request_id] = raw[:-1].rstrip()
+                self.raw_requests.discard(request_id)
+                return raw_msg
+        except ValueError:
+            return None
+
+        # No keyword arguments
+        if text[index:].strip() != "]":
+            return None
+        self.raw_results[request_id] = b"{}"
+        self.raw_requests.discard(request_id)
+        return raw_msg
+
+
+IObjectSerializer.register(FastJsonObjectSerializer)
+
+
+class FastJsonSerializer(wamp_serializer.Serializer):
+    """
+    WAMP JSON serializer using the fastest JSON package installed, e.g. orjson or ujson, otherwise the standard
+    library. Offered instead of the JSON serializer of autobahn for the "json" serializer name.
+
+    Import as:
+      from waapi.wamp.json_serializer import FastJsonSerializer
+    """
+    SERIALIZER_ID = wamp_serializer.JsonSerializer.SERIALIZER_ID
+    RAWSOCKET_SERIALIZER_ID = wamp_serializer.JsonSerializer.RAWSOCKET_SERIALIZER_ID
+    PAYLOAD_SERIALIZER_ID = wamp_serializer.JsonSerializer.SERIALIZER_ID
+    MIME_TYPE = wamp_serializer.JsonSerializer.MIME_TYPE
+
+    def __init__(self, backend=None):
+        """
+        :param backend: Name of the JSON package (see JSON_BACKENDS), None for the first one installed
+        :type backend: str | None
+        :raises: ValueError
+        """
+        super(FastJsonSerializer, self).__init__(FastJsonObjectSerializer(backend))
+
+    def __copy__(self):
+        """
+        autobahn copies the serializer for each connection: the copy has an object serializer of its own, whose raw
+        results are keyed by the request ids of that connection only
+        """
+        return type(self)(self.backend)
+
+    @property
+    def backend(self):
+        """
+        :return: Name of the JSON package used
+        :rtype: str
+        """
+        return self._serializer.backend
+
+
+ISerializer.register(FastJsonSerializer)
+
+
+def find_raw_serializer(obj):
+    """
+    :param obj: Transport or serializer, possibly wrapping other serializers
+    :return: The object serializer able to keep results undecoded, None if the transport does not use one
+    :rtype: FastJsonObjectSerializer | None
+    """
+    while obj is not None and not isinstance(obj, FastJsonObjectSerializer):
+        obj = getattr(obj, "_serializer", None)
+    return obj